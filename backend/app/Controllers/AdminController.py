@@ -1,8 +1,13 @@
+from sqlalchemy import select, func, case
+from sqlalchemy import update as sql_update
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from typing import List, Optional
 from backend.app.Model.EmployeeModel import EmployeeModel
 from backend.app.Model.ProjectModel import ProjectModel
+from backend.app.Model.ProjectStatsModel import ProjectStatsModel
+from backend.app.Core.Config import config as settings
+from backend.app.Core.EntityCache import project_cache
 from backend.app.Model.Role import RoleEnum
 from backend.app.View.ProjectSchemas import (
     ProjectCreate,
@@ -10,6 +15,8 @@ from backend.app.View.ProjectSchemas import (
     ProjectResponse,
     ProjectStatsResponse,
 )
+from backend.app.Utils.Pagination import keyset, to_page
+from backend.app.Utils.Fields import Fields, narrow, partial_schema, projection
 from datetime import datetime
 from .ManagerController import check_manager_or_admin
 
@@ -32,58 +39,40 @@ def create_project(db: Session, project: ProjectCreate, current_user: EmployeeMo
         end_date=project.end_date,
     )
     db.add(new_proj)
+    # Flush first so column defaults (e.g. status) are what gets counted
+    db.flush()
+    bump_project_stats(db, _project_stats_delta(new_proj.status, new_proj.expected_hours, +1))
     db.commit()
     db.refresh(new_proj)
-    return ProjectResponse(
-        project_id=new_proj.project_id,
-        name=new_proj.name,
-        client=new_proj.client,
-        expected_hours=new_proj.expected_hours,
-        status=new_proj.status,
-        start_date=new_proj.start_date,
-        end_date=new_proj.end_date,
-    )
+    return ProjectResponse.model_validate(new_proj, from_attributes=True)
 
 
 def list_projects(
-    db: Session, skip: int = 0, limit: int = 100, current_user: EmployeeModel = None
+    db: Session, skip: int = 0, limit: int = 100, current_user: EmployeeModel = None,
+    cursor: Optional[str] = None, fields: Fields = None,
 ):
     if current_user:
         check_manager_or_admin(current_user)
 
-    query = db.query(ProjectModel)
-    projects = query.offset(skip).limit(limit).all()
-
-    return [
-        ProjectResponse(
-            project_id=p.project_id,
-            name=p.name,
-            client=p.client,
-            expected_hours=p.expected_hours,
-            status=p.status,
-            start_date=p.start_date,
-            end_date=p.end_date,
-        )
-        for p in projects
-    ]
+    query = db.query(*projection(ProjectModel.__table__.c, fields, "project_id"))
+    if skip and not cursor:
+        # Legacy offset paging; keyset cursors stay fast on deep pages
+        query = query.order_by(ProjectModel.project_id).offset(skip).limit(limit + 1)
+    else:
+        query = keyset(query, ProjectModel.project_id, cursor, limit)
 
+    return to_page(query.all(), limit, key_of=lambda p: p.project_id, schema=partial_schema(ProjectResponse, fields))
 
-def get_project(db: Session, project_id: int, current_user: EmployeeModel):
+
+def get_project(db: Session, project_id: int, current_user: EmployeeModel, fields: Fields = None):
     check_admin(current_user)
 
-    proj = db.query(ProjectModel).filter(ProjectModel.project_id == project_id).first()
+    proj = project_cache.get(db, project_id)
     if not proj:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    return ProjectResponse(
-        project_id=proj.project_id,
-        name=proj.name,
-        client=proj.client,
-        expected_hours=proj.expected_hours,
-        status=proj.status,
-        start_date=proj.start_date,
-        end_date=proj.end_date,
-    )
+    # Served from the entity cache, so only the payload is narrowed
+    return narrow(proj, fields)
 
 
 def update_project(
@@ -95,21 +84,16 @@ def update_project(
     if not proj:
         raise HTTPException(status_code=404, detail="Project not found")
 
+    before = _project_stats_delta(proj.status, proj.expected_hours, -1)
     for field, value in update.dict(exclude_unset=True).items():
         if hasattr(proj, field):
             setattr(proj, field, value)
+    bump_project_stats(db, before, _project_stats_delta(proj.status, proj.expected_hours, +1))
 
-    db.commit()
+    with project_cache.writing(proj.project_id):
+        db.commit()
     db.refresh(proj)
-    return ProjectResponse(
-        project_id=proj.project_id,
-        name=proj.name,
-        client=proj.client,
-        expected_hours=proj.expected_hours,
-        status=proj.status,
-        start_date=proj.start_date,
-        end_date=proj.end_date,
-    )
+    return ProjectResponse.model_validate(proj, from_attributes=True)
 
 
 # def delete_project(db: Session, project_id: int, current_user: EmployeeModel):
@@ -124,23 +108,76 @@ def update_project(
 #     return {"message": "Project deleted"}
 
 
-# Stats function
-def get_project_stats(db: Session, current_user: EmployeeModel):
-    check_admin(current_user)
+# Stats functions
+def _project_stats_delta(status, expected_hours, sign: int) -> dict:
+    """Contribution of one project to the running totals (sign=-1 removes it)."""
+    return {
+        "total_projects": sign,
+        "active_projects": sign if status is True else 0,
+        "completed_projects": sign if status is False else 0,
+        "total_expected_hours": sign * (expected_hours or 0),
+    }
+
+
+def bump_project_stats(db: Session, *deltas: dict):
+    """
+    Apply deltas to the project_stats row inside the caller's transaction.
+    No-op unless Config.PROJECT_STATS_TABLE is on.
+    """
+    if not settings.PROJECT_STATS_TABLE:
+        return
+    totals = {k: sum(d[k] for d in deltas) for k in deltas[0]}
+    updated = db.execute(
+        sql_update(ProjectStatsModel)
+        .where(ProjectStatsModel.id == 1)
+        .values({getattr(ProjectStatsModel, k): getattr(ProjectStatsModel, k) + v for k, v in totals.items()})
+    ).rowcount
+    if not updated:
+        # First write since the table was created: build it from the projects table
+        db.flush()
+        rebuild_project_stats(db)
+
+
+def aggregate_project_stats(db: Session) -> dict:
+    """All four project totals in a single aggregate statement."""
+    row = db.execute(
+        select(
+            func.count(ProjectModel.project_id),
+            func.coalesce(func.sum(case((ProjectModel.status == True, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((ProjectModel.status == False, 1), else_=0)), 0),
+            func.coalesce(func.sum(ProjectModel.expected_hours), 0),
+        )
+    ).one()
+    return dict(zip(
+        ("total_projects", "active_projects", "completed_projects", "total_expected_hours"),
+        (int(v) for v in row),
+    ))
 
-    total_projects = db.query(ProjectModel).count()
-    active_projects = db.query(ProjectModel).filter(ProjectModel.status == True).count()
-    completed_projects = (
-        db.query(ProjectModel).filter(ProjectModel.status == False).count()
-    )
 
-    # Sum of expected_hours across all projects
-    total_expected_hours = db.query(ProjectModel).all()
-    hours_sum = sum(p.expected_hours or 0 for p in total_expected_hours)
+def rebuild_project_stats(db: Session):
+    """Recompute the project_stats row from scratch (caller commits)."""
+    stats = db.get(ProjectStatsModel, 1)
+    if stats is None:
+        stats = ProjectStatsModel(id=1)
+        db.add(stats)
+    for field, value in aggregate_project_stats(db).items():
+        setattr(stats, field, value)
 
-    return ProjectStatsResponse(
-        total_projects=total_projects,
-        active_projects=active_projects,
-        completed_projects=completed_projects,
-        total_expected_hours=hours_sum,
-    )
+
+def get_project_stats(db: Session, current_user: EmployeeModel):
+    check_admin(current_user)
+
+    stats = None
+    if settings.PROJECT_STATS_TABLE:
+        row = db.get(ProjectStatsModel, 1)
+        if row is not None:
+            stats = {
+                "total_projects": row.total_projects,
+                "active_projects": row.active_projects,
+                "completed_projects": row.completed_projects,
+                "total_expected_hours": row.total_expected_hours,
+            }
+    if stats is None:
+        stats = aggregate_project_stats(db)
+
+    return ProjectStatsResponse(**stats)
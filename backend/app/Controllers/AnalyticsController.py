@@ -0,0 +1,198 @@
+from datetime import date, datetime
+from typing import Optional
+import numpy as np
+import pandas as pd
+from fastapi import HTTPException, status
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
+from backend.app.Model.EmployeeModel import EmployeeModel
+from backend.app.Model.ProjectModel import ProjectModel
+from backend.app.Model.AssignedProjectModel import AssignedProjectModel
+from backend.app.Model.ProjectDailyRollupModel import ProjectDailyRollupModel
+from backend.app.Model.Role import RoleEnum
+from backend.app.Core.Config import config as settings
+from backend.app.Controllers.ManagerController import check_manager_or_admin
+from backend.app.Utils.ProjectRollups import COUNTERS
+from backend.app.View.AnalyticsSchemas import UtilizationReport, UtilizationRow, ProjectBurndown, BurndownPoint
+
+# group_by -> (key column, label column); assignments are always joined to both tables
+GROUPINGS = {
+    "employee": (EmployeeModel.emp_id, EmployeeModel.emp_name),
+    "department": (EmployeeModel.dept, EmployeeModel.dept),
+    "project": (ProjectModel.project_id, ProjectModel.name),
+    "client": (ProjectModel.client, ProjectModel.client),
+}
+
+SORT_COLUMNS = ("key", "utilization", "load", "overrun_ratio", "allotted_ratio", "allotted_hours", "worked_hours")
+
+_SUM_COLUMNS = ["assignments", "completed_assignments", "allotted_hours", "open_allotted_hours",
+                "completed_allotted_hours", "worked_hours", "billable_work_hours", "expected_hours"]
+
+
+def _assignment_totals(db: Session, group_by: str, dept: Optional[str]) -> pd.DataFrame:
+    """One GROUP BY over assignments; the database does the per-row work."""
+    key, label = GROUPINGS[group_by]
+    completed = AssignedProjectModel.is_completed == True
+    stmt = (
+        select(
+            key.label("key"),
+            func.max(label).label("name"),
+            func.count(AssignedProjectModel.assign_id).label("assignments"),
+            func.sum(case((completed, 1), else_=0)).label("completed_assignments"),
+            func.sum(AssignedProjectModel.allotted_hours).label("allotted_hours"),
+            func.sum(case((completed, 0), else_=AssignedProjectModel.allotted_hours)).label("open_allotted_hours"),
+            func.sum(case((completed, AssignedProjectModel.allotted_hours), else_=0)).label("completed_allotted_hours"),
+            func.sum(func.coalesce(AssignedProjectModel.hours_worked, 0)).label("worked_hours"),
+        )
+        .select_from(AssignedProjectModel)
+        .join(EmployeeModel, AssignedProjectModel.emp_id == EmployeeModel.emp_id)
+        .join(ProjectModel, AssignedProjectModel.project_id == ProjectModel.project_id)
+        .group_by(key)
+    )
+    if dept is not None:
+        stmt = stmt.where(EmployeeModel.dept == dept)
+    result = db.execute(stmt)
+    return pd.DataFrame.from_records(result.all(), columns=list(result.keys()))
+
+
+def _capacity_totals(db: Session, group_by: str, dept: Optional[str]) -> pd.DataFrame:
+    """Denominators that live outside assignments: billable hours or expected hours per group."""
+    key, label = GROUPINGS[group_by]
+    if group_by in ("employee", "department"):
+        stmt = select(key.label("key"), func.max(label).label("group_name"),
+                      func.sum(func.coalesce(EmployeeModel.billable_work_hours, 0)).label("billable_work_hours"))
+        if dept is not None:
+            stmt = stmt.where(EmployeeModel.dept == dept)
+    else:
+        stmt = select(key.label("key"), func.max(label).label("group_name"),
+                      func.sum(func.coalesce(ProjectModel.expected_hours, 0)).label("expected_hours"))
+    result = db.execute(stmt.group_by(key))
+    return pd.DataFrame.from_records(result.all(), columns=list(result.keys()))
+
+
+def _ratio(numerator: pd.Series, denominator: pd.Series) -> np.ndarray:
+    """numerator / denominator, NaN where the denominator is 0."""
+    num = numerator.to_numpy(dtype=float)
+    den = denominator.to_numpy(dtype=float)
+    out = np.full(len(num), np.nan)
+    np.divide(num, den, out=out, where=den > 0)
+    return out
+
+
+def _add_ratios(df: pd.DataFrame, group_by: str, scoped: bool):
+    df["utilization"] = _ratio(df["worked_hours"], df["completed_allotted_hours"])
+    if group_by in ("employee", "department"):
+        df["load"] = _ratio(df["open_allotted_hours"], df["billable_work_hours"])
+    elif scoped:
+        # Only when the hours cover the whole project: a department's share of
+        # the work over the project's full expected_hours would understate it
+        df["overrun_ratio"] = _ratio(df["worked_hours"], df["expected_hours"])
+        df["allotted_ratio"] = _ratio(df["allotted_hours"], df["expected_hours"])
+
+
+def _to_rows(df: pd.DataFrame):
+    # NaN/NA -> None for JSON; round ratios for readability
+    ratio_columns = [c for c in ("utilization", "load", "overrun_ratio", "allotted_ratio") if c in df]
+    df[ratio_columns] = df[ratio_columns].round(4)
+    records = df.astype(object).where(df.notna(), None).to_dict("records")
+    return [UtilizationRow(**{**r, "key": None if r["key"] is None else str(r["key"])}) for r in records]
+
+
+def utilization_report(db: Session, group_by: str, current_user: EmployeeModel,
+                       sort: str = "key", descending: bool = False, limit: Optional[int] = None) -> UtilizationReport:
+    """
+    Allotted vs worked hours per employee, department, project or client.
+    Managers only see assignments of employees in their department; their
+    project and client views therefore leave out overrun_ratio and
+    allotted_ratio, since expected_hours is for the whole project.
+    """
+    check_manager_or_admin(current_user)
+    dept = None
+    if current_user.role == RoleEnum.manager:
+        if not current_user.dept:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Manager department not set"
+            )
+        dept = current_user.dept
+
+    df = _assignment_totals(db, group_by, dept)
+    capacity = _capacity_totals(db, group_by, dept)
+    # Show groups with no assignments yet (e.g. a project nobody is on), unless
+    # the denominators are not department-scoped (projects/clients for a manager)
+    scoped = dept is None or group_by in ("employee", "department")
+    df = df.merge(capacity, on="key", how="outer" if scoped else "left")
+    df["name"] = df["name"].combine_first(df.pop("group_name"))
+    for column in _SUM_COLUMNS:
+        if column in df:
+            # The merge can leave object columns (NaN fill, Decimal sums); make them numeric
+            # before filling so pandas doesn't downcast object arrays in fillna
+            df[column] = pd.to_numeric(df[column]).fillna(0).astype(np.int64)
+
+    totals = df[[c for c in _SUM_COLUMNS if c in df]].sum().to_frame().T
+    totals.insert(0, "key", None)
+    totals.insert(1, "name", "Total")
+    _add_ratios(df, group_by, scoped)
+    _add_ratios(totals, group_by, scoped)
+
+    sort_column = "key" if sort not in df else sort
+    df = df.sort_values(sort_column, ascending=not descending, na_position="last", kind="stable")
+    if limit is not None:
+        df = df.head(limit)
+
+    return UtilizationReport(group_by=group_by, rows=_to_rows(df), totals=_to_rows(totals)[0])
+
+
+def project_burndown(db: Session, project_id: int, current_user: EmployeeModel,
+                     start: Optional[date] = None, end: Optional[date] = None) -> ProjectBurndown:
+    """
+    Daily burn-down series for one project, read from project_daily_rollups:
+    the buckets in [start, end] plus one SUM over earlier buckets for the
+    running totals. Defaults to the project's first active day through today.
+    """
+    check_manager_or_admin(current_user)
+    project = db.get(ProjectModel, project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    rollup = ProjectDailyRollupModel
+    end = end or datetime.utcnow().date()
+    if start is None:
+        start = db.scalar(select(func.min(rollup.day)).where(rollup.project_id == project_id)) or end
+    if start > end:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start must not be after end")
+    if (end - start).days + 1 > settings.BURNDOWN_MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.BURNDOWN_MAX_DAYS} days per request"
+        )
+
+    counters = [getattr(rollup, name) for name in COUNTERS]
+    before = db.execute(
+        select(*(func.coalesce(func.sum(c), 0) for c in counters))
+        .where(rollup.project_id == project_id, rollup.day < start)
+    ).one()
+    buckets = db.execute(
+        select(rollup.day, *counters)
+        .where(rollup.project_id == project_id, rollup.day >= start, rollup.day <= end)
+    ).all()
+
+    # Dense daily series: days without a bucket had no activity
+    days = pd.date_range(start, end, freq="D").date
+    df = (pd.DataFrame.from_records(buckets, columns=["day", *COUNTERS], index="day")
+          .reindex(days, fill_value=0).astype(np.int64))
+    totals = df.cumsum() + pd.Series(dict(zip(COUNTERS, before)), dtype=np.int64)
+    df["total_allotted_hours"] = totals["allotted_hours"]
+    df["total_completed_hours"] = totals["completed_hours"]
+    df["total_worked_hours"] = totals["worked_hours"]
+    df["remaining_hours"] = totals["allotted_hours"] - totals["completed_hours"]
+    df["open_assignments"] = totals["assignments_added"] - totals["assignments_completed"]
+
+    return ProjectBurndown(
+        project_id=project.project_id,
+        project_name=project.name,
+        expected_hours=project.expected_hours,
+        start=start,
+        end=end,
+        points=[BurndownPoint(day=day, **values) for day, values in zip(days, df.to_dict("records"))],
+    )
@@ -1,4 +1,8 @@
+from sqlalchemy import select, insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from typing import Optional
 from backend.app.Model.EmployeeModel import EmployeeModel
@@ -6,8 +10,15 @@ from backend.app.Model.AssignedProjectModel import AssignedProjectModel
 from backend.app.Model.ProjectModel import ProjectModel
 from backend.app.Model.Role import RoleEnum
 from backend.app.View.AssignmentSchemas import (
-    AssignmentCreate, AssignmentUpdate, AssignmentResponse
+    AssignmentCreate, AssignmentUpdate, AssignmentResponse,
+    AssignmentBatchCreate, AssignmentBatchError, AssignmentBatchResponse,
 )
+from backend.app.Core.Config import config as settings
+from backend.app.Core.EntityCache import employee_cache, project_cache
+from backend.app.Utils.Pagination import keyset, to_page
+from backend.app.Utils.Fields import Fields, partial_schema, projection
+from backend.app.Utils.Capacity import bump_committed_hours, bump_committed_hours_async
+from backend.app.Utils.ProjectRollups import assignment_rollup, bump_rollups, bump_rollups_async
 
 def check_manager_or_admin(user):
     if user.role not in [RoleEnum.manager, RoleEnum.admin]:
@@ -16,17 +27,54 @@ def check_manager_or_admin(user):
             detail="Not enough permissions"
         )
 
+def assignment_with_names():
+    """SELECT assignment rows together with the employee and project names."""
+    return (
+        select(AssignedProjectModel, EmployeeModel.emp_name, ProjectModel.name)
+        .join(EmployeeModel, AssignedProjectModel.emp_id == EmployeeModel.emp_id)
+        .join(ProjectModel, AssignedProjectModel.project_id == ProjectModel.project_id)
+    )
+
+# Every AssignmentResponse / TaskCompletionResponse field as a column labelled by its name
+ASSIGNMENT_COLUMNS = (*AssignedProjectModel.__table__.c, EmployeeModel.emp_name, ProjectModel.name.label("project_name"))
+
+def assignment_rows(fields: Fields = None):
+    """
+    assignment_with_names as labelled columns, for validating straight into
+    AssignmentResponse; only `fields` (plus assign_id for paging) when given.
+    """
+    return (
+        select(*projection(ASSIGNMENT_COLUMNS, fields, "assign_id"))
+        .join(EmployeeModel, AssignedProjectModel.emp_id == EmployeeModel.emp_id)
+        .join(ProjectModel, AssignedProjectModel.project_id == ProjectModel.project_id)
+    )
+
+def to_assignment_response(a: AssignedProjectModel, emp_name: str, project_name: str):
+    return AssignmentResponse(
+        assign_id=a.assign_id,
+        emp_id=a.emp_id,
+        project_id=a.project_id,
+        assigned_at=a.assigned_at,
+        allotted_hours=a.allotted_hours,
+        emp_name=emp_name,
+        project_name=project_name,
+        is_completed=a.is_completed,
+        completed_at=a.completed_at,
+        hours_worked=a.hours_worked,
+        completion_notes=a.completion_notes
+    )
+
 # Assignment functions
 def create_assignment(db: Session, assignment: AssignmentCreate, current_user: EmployeeModel):
     check_manager_or_admin(current_user)
     
     # Check employee
-    emp = db.query(EmployeeModel).filter(EmployeeModel.emp_id == assignment.emp_id).first()
+    emp = employee_cache.get(db, assignment.emp_id)
     if not emp:
         raise HTTPException(status_code=404, detail="Employee not found")
     
     # Check project
-    proj = db.query(ProjectModel).filter(ProjectModel.project_id == assignment.project_id).first()
+    proj = project_cache.get(db, assignment.project_id)
     if not proj:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -44,49 +92,28 @@ def create_assignment(db: Session, assignment: AssignmentCreate, current_user: E
         allotted_hours=assignment.allotted_hours
     )
     db.add(new_assign)
+    db.flush()  # assigned_at default
+    bump_committed_hours(db, {assignment.emp_id: assignment.allotted_hours})
+    bump_rollups(db, assignment_rollup(new_assign))
     db.commit()
     db.refresh(new_assign)
     
-    return AssignmentResponse(
-        assign_id=new_assign.assign_id,
-        emp_id=new_assign.emp_id,
-        project_id=new_assign.project_id,
-        assigned_at=new_assign.assigned_at,
-        allotted_hours=new_assign.allotted_hours,
-        emp_name=emp.emp_name,
-        project_name=proj.name,
-        is_completed=new_assign.is_completed,
-        completed_at=new_assign.completed_at,
-        hours_worked=new_assign.hours_worked,
-        completion_notes=new_assign.completion_notes
-    )
+    return to_assignment_response(new_assign, emp.emp_name, proj.name)
 
-def list_assignments(db: Session, emp_id: Optional[int] = None, project_id: Optional[int] = None, current_user: EmployeeModel = None):
+def list_assignments(db: Session, emp_id: Optional[int] = None, project_id: Optional[int] = None, current_user: EmployeeModel = None,
+                     cursor: Optional[str] = None, limit: int = settings.PAGE_SIZE_DEFAULT, fields: Fields = None):
     if current_user:
         check_manager_or_admin(current_user)
     
-    query = db.query(AssignedProjectModel).join(EmployeeModel).join(ProjectModel)
+    # Names come from the same SELECT, so there are no per-row lazy loads
+    stmt = assignment_rows(fields)
     if emp_id:
-        query = query.filter(AssignedProjectModel.emp_id == emp_id)
+        stmt = stmt.where(AssignedProjectModel.emp_id == emp_id)
     if project_id:
-        query = query.filter(AssignedProjectModel.project_id == project_id)
+        stmt = stmt.where(AssignedProjectModel.project_id == project_id)
     
-    assignments = query.all()
-    return [
-        AssignmentResponse(
-            assign_id=a.assign_id,
-            emp_id=a.emp_id,
-            project_id=a.project_id,
-            assigned_at=a.assigned_at,
-            allotted_hours=a.allotted_hours,
-            emp_name=a.employee.emp_name,
-            project_name=a.project.name,
-            is_completed=a.is_completed,
-            completed_at=a.completed_at,
-            hours_worked=a.hours_worked,
-            completion_notes=a.completion_notes
-        ) for a in assignments
-    ]
+    rows = db.execute(keyset(stmt, AssignedProjectModel.assign_id, cursor, limit)).all()
+    return to_page(rows, limit, key_of=lambda row: row.assign_id, schema=partial_schema(AssignmentResponse, fields))
 
 def update_assignment(db: Session, assign_id: int, update: AssignmentUpdate, current_user: EmployeeModel):
     check_manager_or_admin(current_user)
@@ -96,23 +123,105 @@ def update_assignment(db: Session, assign_id: int, update: AssignmentUpdate, cur
         raise HTTPException(status_code=404, detail="Assignment not found")
     
     if update.allotted_hours is not None:
+        if not assign.is_completed:
+            bump_committed_hours(db, {assign.emp_id: update.allotted_hours - assign.allotted_hours})
+        before = assignment_rollup(assign, -1)
         assign.allotted_hours = update.allotted_hours
+        bump_rollups(db, before + assignment_rollup(assign))
     
     db.commit()
-    db.refresh(assign)
-    return AssignmentResponse(
-        assign_id=assign.assign_id,
-        emp_id=assign.emp_id,
-        project_id=assign.project_id,
-        assigned_at=assign.assigned_at,
-        allotted_hours=assign.allotted_hours,
-        emp_name=assign.employee.emp_name,
-        project_name=assign.project.name,
-        is_completed=assign.is_completed,
-        completed_at=assign.completed_at,
-        hours_worked=assign.hours_worked,
-        completion_notes=assign.completion_notes
+    row = db.execute(
+        assignment_with_names().where(AssignedProjectModel.assign_id == assign_id)
+    ).one()
+    return to_assignment_response(*row)
+
+# --- batch assignment: set-based checks and one transaction for a whole project staffing ---
+CONFLICT_IGNORING_INSERTS = {
+    "sqlite": sqlite_insert,
+    "postgresql": postgresql_insert,
+}
+
+def _check_batch_size(batch: AssignmentBatchCreate):
+    if len(batch.assignees) > settings.IMPORT_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.IMPORT_MAX_ROWS} assignees per batch",
+        )
+
+def _batch_lookups(batch: AssignmentBatchCreate):
+    """The two set-based SELECTs a batch needs: known employees and employees already on the project."""
+    emp_ids = {a.emp_id for a in batch.assignees}
+    names = select(EmployeeModel.emp_id, EmployeeModel.emp_name).where(EmployeeModel.emp_id.in_(emp_ids))
+    assigned = select(AssignedProjectModel.emp_id).where(
+        AssignedProjectModel.project_id == batch.project_id,
+        AssignedProjectModel.emp_id.in_(emp_ids),
     )
+    return names, assigned
+
+def _plan_batch(batch: AssignmentBatchCreate, emp_names: dict, assigned: set):
+    """Split assignees into INSERT values and per-employee errors."""
+    values, errors, seen = [], [], set(assigned)
+    for a in batch.assignees:
+        if a.emp_id not in emp_names:
+            errors.append(AssignmentBatchError(emp_id=a.emp_id, error="Employee not found"))
+        elif a.emp_id in seen:
+            errors.append(AssignmentBatchError(emp_id=a.emp_id, error="Assignment already exists"))
+        else:
+            seen.add(a.emp_id)
+            values.append({"emp_id": a.emp_id, "project_id": batch.project_id, "allotted_hours": a.allotted_hours})
+    return values, errors
+
+def _batch_insert(dialect_name: str, values: list):
+    """
+    Multi-row INSERT ... RETURNING. Where the dialect supports it, rows that hit
+    unique_employee_project (e.g. a concurrent assignment) are skipped rather
+    than aborting the transaction; they are missing from the returned rows.
+    """
+    dialect_insert = CONFLICT_IGNORING_INSERTS.get(dialect_name)
+    if dialect_insert is None:
+        stmt = insert(AssignedProjectModel)
+    else:
+        stmt = dialect_insert(AssignedProjectModel).on_conflict_do_nothing(index_elements=["emp_id", "project_id"])
+    return stmt.values(values).returning(AssignedProjectModel)
+
+def _batch_response(batch: AssignmentBatchCreate, project_name: str, emp_names: dict,
+                    values: list, created: list, errors: list):
+    created_ids = {a.emp_id for a in created}
+    errors += [AssignmentBatchError(emp_id=v["emp_id"], error="Assignment already exists")
+               for v in values if v["emp_id"] not in created_ids]
+    return AssignmentBatchResponse(
+        project_id=batch.project_id,
+        created=[to_assignment_response(a, emp_names[a.emp_id], project_name)
+                 for a in sorted(created, key=lambda a: a.assign_id)],
+        errors=errors,
+    )
+
+def _insert_chunks(values: list):
+    size = settings.IMPORT_CHUNK_SIZE
+    return (values[start:start + size] for start in range(0, len(values), size))
+
+def batch_create_assignments(db: Session, batch: AssignmentBatchCreate, current_user: EmployeeModel):
+    check_manager_or_admin(current_user)
+    _check_batch_size(batch)
+
+    proj = project_cache.get(db, batch.project_id)
+    if not proj:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    names_stmt, assigned_stmt = _batch_lookups(batch)
+    emp_names = dict(db.execute(names_stmt).all())
+    values, errors = _plan_batch(batch, emp_names, set(db.scalars(assigned_stmt)))
+
+    created = []
+    dialect_name = db.get_bind().dialect.name
+    for chunk in _insert_chunks(values):
+        created += db.scalars(_batch_insert(dialect_name, chunk)).all()
+    bump_committed_hours(db, {a.emp_id: a.allotted_hours for a in created})
+    bump_rollups(db, (delta for a in created for delta in assignment_rollup(a)))
+    # Build the response before commit expires the returned rows
+    response = _batch_response(batch, proj.name, emp_names, values, created, errors)
+    db.commit()
+    return response
 
 def delete_assignment(db: Session, assign_id: int, current_user: EmployeeModel):
     check_manager_or_admin(current_user)
@@ -121,6 +230,113 @@ def delete_assignment(db: Session, assign_id: int, current_user: EmployeeModel):
     if not assign:
         raise HTTPException(status_code=404, detail="Assignment not found")
     
+    if not assign.is_completed:
+        bump_committed_hours(db, {assign.emp_id: -assign.allotted_hours})
+    bump_rollups(db, assignment_rollup(assign, -1))
     db.delete(assign)
     db.commit()
     return {"message": "Assignment deleted"}
+
+
+# --- async variants (used when Config.DB_ASYNC_MODE is on) ---
+async def create_assignment_async(db: AsyncSession, assignment: AssignmentCreate, current_user: EmployeeModel):
+    check_manager_or_admin(current_user)
+
+    emp = await employee_cache.get_async(db, assignment.emp_id)
+    if not emp:
+        raise HTTPException(status_code=404, detail="Employee not found")
+
+    proj = await project_cache.get_async(db, assignment.project_id)
+    if not proj:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    existing = await db.scalar(select(AssignedProjectModel.assign_id).where(
+        AssignedProjectModel.emp_id == assignment.emp_id,
+        AssignedProjectModel.project_id == assignment.project_id
+    ))
+    if existing:
+        raise HTTPException(status_code=400, detail="Assignment already exists")
+
+    new_assign = AssignedProjectModel(
+        emp_id=assignment.emp_id,
+        project_id=assignment.project_id,
+        allotted_hours=assignment.allotted_hours
+    )
+    db.add(new_assign)
+    await db.flush()
+    await bump_committed_hours_async(db, {assignment.emp_id: assignment.allotted_hours})
+    await bump_rollups_async(db, assignment_rollup(new_assign))
+    await db.commit()
+    await db.refresh(new_assign)
+
+    return to_assignment_response(new_assign, emp.emp_name, proj.name)
+
+async def list_assignments_async(db: AsyncSession, emp_id: Optional[int] = None, project_id: Optional[int] = None, current_user: EmployeeModel = None,
+                                 cursor: Optional[str] = None, limit: int = settings.PAGE_SIZE_DEFAULT, fields: Fields = None):
+    if current_user:
+        check_manager_or_admin(current_user)
+
+    stmt = assignment_rows(fields)
+    if emp_id:
+        stmt = stmt.where(AssignedProjectModel.emp_id == emp_id)
+    if project_id:
+        stmt = stmt.where(AssignedProjectModel.project_id == project_id)
+
+    rows = (await db.execute(keyset(stmt, AssignedProjectModel.assign_id, cursor, limit))).all()
+    return to_page(rows, limit, key_of=lambda row: row.assign_id, schema=partial_schema(AssignmentResponse, fields))
+
+async def update_assignment_async(db: AsyncSession, assign_id: int, update: AssignmentUpdate, current_user: EmployeeModel):
+    check_manager_or_admin(current_user)
+
+    assign = await db.get(AssignedProjectModel, assign_id)
+    if not assign:
+        raise HTTPException(status_code=404, detail="Assignment not found")
+
+    if update.allotted_hours is not None:
+        if not assign.is_completed:
+            await bump_committed_hours_async(db, {assign.emp_id: update.allotted_hours - assign.allotted_hours})
+        before = assignment_rollup(assign, -1)
+        assign.allotted_hours = update.allotted_hours
+        await bump_rollups_async(db, before + assignment_rollup(assign))
+
+    await db.commit()
+    row = (await db.execute(
+        assignment_with_names().where(AssignedProjectModel.assign_id == assign_id)
+    )).one()
+    return to_assignment_response(*row)
+
+async def batch_create_assignments_async(db: AsyncSession, batch: AssignmentBatchCreate, current_user: EmployeeModel):
+    check_manager_or_admin(current_user)
+    _check_batch_size(batch)
+
+    proj = await project_cache.get_async(db, batch.project_id)
+    if not proj:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    names_stmt, assigned_stmt = _batch_lookups(batch)
+    emp_names = dict((await db.execute(names_stmt)).all())
+    values, errors = _plan_batch(batch, emp_names, set(await db.scalars(assigned_stmt)))
+
+    created = []
+    dialect_name = db.get_bind().dialect.name
+    for chunk in _insert_chunks(values):
+        created += (await db.scalars(_batch_insert(dialect_name, chunk))).all()
+    await bump_committed_hours_async(db, {a.emp_id: a.allotted_hours for a in created})
+    await bump_rollups_async(db, (delta for a in created for delta in assignment_rollup(a)))
+    response = _batch_response(batch, proj.name, emp_names, values, created, errors)
+    await db.commit()
+    return response
+
+async def delete_assignment_async(db: AsyncSession, assign_id: int, current_user: EmployeeModel):
+    check_manager_or_admin(current_user)
+
+    assign = await db.get(AssignedProjectModel, assign_id)
+    if not assign:
+        raise HTTPException(status_code=404, detail="Assignment not found")
+
+    if not assign.is_completed:
+        await bump_committed_hours_async(db, {assign.emp_id: -assign.allotted_hours})
+    await bump_rollups_async(db, assignment_rollup(assign, -1))
+    await db.delete(assign)
+    await db.commit()
+    return {"message": "Assignment deleted"}
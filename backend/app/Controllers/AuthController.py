@@ -1,15 +1,20 @@
 from fastapi.security import OAuth2PasswordRequestForm
-from backend.app.Core.Security import verify_password, hash_password
+from backend.app.Core.Security import verify_password, hash_password, password_needs_rehash
+from backend.app.Core.Security import verify_password_async, hash_password_async
 from backend.app.Core.Security import create_access_token, create_refresh_token, verify_refresh_token
 from fastapi import APIRouter, Depends, HTTPException, logger, status
 from jose import jwt, JWTError
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 import re
 
 from backend.app.DataBase import get_db
 from backend.app.Core.Config import config as settings
 from backend.app.Core.Logger import setup_logging
+from backend.app.Core.RateLimiter import login_rate_limiter
+from backend.app.Utils.Capacity import rebuild_capacity, rebuild_capacity_async
 
 from backend.app.Model.EmployeeModel import EmployeeModel
 from backend.app.Model.Role import RoleEnum
@@ -17,13 +22,10 @@ from backend.app.View.AuthSchemas import SignupRequest, ForgotPasswordRequest
 
 # logger = setup_logging()
 
-def signupUser(
-    request: SignupRequest,
-    db: Session = Depends(get_db),
-    logger: any = setup_logging()
-):
-    logger.info(f"Signup attempt for email: {request.email}")
+def _token_claims(user: EmployeeModel) -> dict:
+    return {"emp_id": str(user.emp_id), "role": user.role, "email": user.email, "is_active": user.is_active, "experience": int(user.experience or 0), "billable_work_hours": user.billable_work_hours, "dept": user.dept }
 
+def _validate_signup(request: SignupRequest, logger):
     # if username=="" or password=="":
     
     # Validate email format
@@ -76,7 +78,29 @@ def signupUser(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid PIN for the selected role"
         )
-    
+
+def _check_reset_pin(request: ForgotPasswordRequest, user: EmployeeModel, logger):
+    # Check PIN
+    role_pins = {
+        RoleEnum.admin: "adm789",
+        RoleEnum.manager: "mgr456",
+        RoleEnum.employee: "emp123"
+    }
+    if request.pin != role_pins.get(user.role):
+        logger.warning(f"Forgot password failed: Invalid PIN for {request.email}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid PIN"
+        )
+
+def signupUser(
+    request: SignupRequest,
+    db: Session = Depends(get_db),
+    logger: any = setup_logging()
+):
+    logger.info(f"Signup attempt for email: {request.email}")
+    _validate_signup(request, logger)
+
     # Check if email already exists
     existing_user = db.query(EmployeeModel).filter(EmployeeModel.email == request.email).first()
     if existing_user:
@@ -98,6 +122,8 @@ def signupUser(
     )
     
     db.add(new_user)
+    db.flush()
+    rebuild_capacity(db, [new_user.emp_id])
     db.commit()
     db.refresh(new_user)
     
@@ -107,9 +133,18 @@ def signupUser(
 def loginUser(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db),
-    logger: any = setup_logging()
+    logger: any = setup_logging(),
+    client_ip: str = None
 ):
     logger.info(f"Login attempt for user: {form_data.username}")
+
+    # Throttle before touching the database or running bcrypt
+    try:
+        login_rate_limiter.check(form_data.username, client_ip)
+    except HTTPException:
+        logger.warning(f"Login throttled for user: {form_data.username} from {client_ip}")
+        raise
+
     user = db.query(EmployeeModel).filter(
         EmployeeModel.email == form_data.username
     ).first()
@@ -121,10 +156,17 @@ def loginUser(
             detail="Invalid credentials"
         )
 
-    access_token = create_access_token({"emp_id": str(user.emp_id), "role": user.role, "email": user.email, "is_active": user.is_active, "experience": int(user.experience or 0), "billable_work_hours": user.billable_work_hours, "dept": user.dept })
-    refresh_token = create_refresh_token({"emp_id": str(user.emp_id), "role": user.role, "email": user.email, "is_active": user.is_active, "experience": int(user.experience or 0), "billable_work_hours": user.billable_work_hours, "dept": user.dept })
-    print("\n\n GENERATED TOKENS:\n", access_token, "\n", refresh_token, "\n\n")
+    # Upgrade hashes made at a different bcrypt cost while we have the plain password
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = hash_password(form_data.password)
+        db.commit()
+        logger.info(f"Rehashed password at configured cost for user: {form_data.username}")
+
+    access_token = create_access_token(_token_claims(user))
+    refresh_token = create_refresh_token(_token_claims(user))
+    logger.debug(f"Issued access and refresh tokens for emp_id: {user.emp_id}")
 
+    login_rate_limiter.reset_email(form_data.username)
     logger.info(f"Successful login for user: {form_data.username}")
     return {
         "access_token": access_token,
@@ -147,18 +189,7 @@ def forgetPasswordUser(
             detail="Email not found"
         )
     
-    # Check PIN
-    role_pins = {
-        RoleEnum.admin: "adm789",
-        RoleEnum.manager: "mgr456",
-        RoleEnum.employee: "emp123"
-    }
-    if request.pin != role_pins.get(user.role):
-        logger.warning(f"Forgot password failed: Invalid PIN for {request.email}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid PIN"
-        )
+    _check_reset_pin(request, user, logger)
     
     # Hash new password
     hashed_password = hash_password(request.new_password)
@@ -185,5 +216,100 @@ def refreshAccessToken(
     if not user or not user.is_active:
         raise HTTPException(status_code=401, detail="User not found")
 
-    new_access_token = create_access_token({"emp_id": str(user.emp_id), "role": user.role, "email": user.email, "is_active": user.is_active, "experience": int(user.experience or 0), "billable_work_hours": user.billable_work_hours, "dept": user.dept })
-    return {"access_token": new_access_token, "token_type": "bearer"}
\ No newline at end of file
+    new_access_token = create_access_token(_token_claims(user))
+    return {"access_token": new_access_token, "token_type": "bearer"}
+
+
+# --- async variants (used when Config.DB_ASYNC_MODE is on) ---
+async def signupUserAsync(
+    request: SignupRequest,
+    db: AsyncSession,
+    logger: any = setup_logging()
+):
+    logger.info(f"Signup attempt for email: {request.email}")
+    _validate_signup(request, logger)
+
+    existing_user = await db.scalar(select(EmployeeModel.emp_id).where(EmployeeModel.email == request.email))
+    if existing_user:
+        logger.warning(f"Signup failed: Email already exists: {request.email}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+
+    new_user = EmployeeModel(
+        emp_name=request.emp_name,
+        email=request.email,
+        hashed_password=await hash_password_async(request.password),
+        role=request.role
+    )
+    db.add(new_user)
+    await db.flush()
+    await rebuild_capacity_async(db, [new_user.emp_id])
+    await db.commit()
+
+    logger.info(f"Successful signup for user: {request.email}")
+    return {"message": "User created successfully", "emp_id": new_user.emp_id}
+
+async def loginUserAsync(
+    form_data: OAuth2PasswordRequestForm,
+    db: AsyncSession,
+    logger: any = setup_logging(),
+    client_ip: str = None
+):
+    logger.info(f"Login attempt for user: {form_data.username}")
+
+    try:
+        login_rate_limiter.check(form_data.username, client_ip)
+    except HTTPException:
+        logger.warning(f"Login throttled for user: {form_data.username} from {client_ip}")
+        raise
+
+    user = await db.scalar(select(EmployeeModel).where(EmployeeModel.email == form_data.username))
+
+    if not user or not await verify_password_async(form_data.password, user.hashed_password):
+        logger.warning(f"Failed login attempt for user: {form_data.username}")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid credentials"
+        )
+
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await hash_password_async(form_data.password)
+        await db.commit()
+        logger.info(f"Rehashed password at configured cost for user: {form_data.username}")
+
+    access_token = create_access_token(_token_claims(user))
+    refresh_token = create_refresh_token(_token_claims(user))
+    logger.debug(f"Issued access and refresh tokens for emp_id: {user.emp_id}")
+
+    login_rate_limiter.reset_email(form_data.username)
+    logger.info(f"Successful login for user: {form_data.username}")
+    return {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "token_type": "bearer"
+    }
+
+async def forgetPasswordUserAsync(
+    request: ForgotPasswordRequest,
+    db: AsyncSession,
+    logger: any = setup_logging()
+):
+    logger.info(f"Forgot password attempt for email: {request.email}")
+
+    user = await db.scalar(select(EmployeeModel).where(EmployeeModel.email == request.email))
+    if not user:
+        logger.warning(f"Forgot password failed: Email not found: {request.email}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Email not found"
+        )
+
+    _check_reset_pin(request, user, logger)
+
+    user.hashed_password = await hash_password_async(request.new_password)
+    await db.commit()
+
+    logger.info(f"Password reset successful for user: {request.email}")
+    return {"message": "Password reset successfully"}
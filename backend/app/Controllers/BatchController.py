@@ -0,0 +1,160 @@
+import json
+import logging
+from typing import List, Optional
+from urllib.parse import urlsplit
+
+import anyio
+from fastapi import HTTPException, Request, status
+
+from backend.app.Core.BatchContext import BatchLane, batch_lane, batch_principal
+from backend.app.Core.Config import config as settings
+from backend.app.Utils.Principal import Principal
+from backend.app.View.BatchSchemas import BatchRequest, BatchResponse, BatchSubRequest, BatchSubResponse
+
+logger = logging.getLogger(__name__)
+
+BATCH_PATH = "/api/batch"
+
+# Request headers a sub-request may not set: auth and framing belong to the batch, and
+# sub-responses stay uncompressed JSON (the batch response itself is negotiated as usual)
+RESERVED_HEADERS = {
+    "accept", "accept-encoding", "authorization", "content-length", "content-type", "host", "transfer-encoding",
+}
+
+
+def _groups(requests: List[BatchSubRequest]) -> List[List[int]]:
+    """Runs of consecutive GETs (run concurrently); every other method runs alone, in order."""
+    groups: List[List[int]] = []
+    for index, sub in enumerate(requests):
+        if sub.method == "GET" and groups and requests[groups[-1][0]].method == "GET":
+            groups[-1].append(index)
+        else:
+            groups.append([index])
+    return groups
+
+
+def _decode_body(content_type: str, body: bytes):
+    if not body:
+        return None
+    if content_type.startswith("application/json"):
+        return json.loads(body)
+    return body.decode("utf-8", errors="replace")
+
+
+async def _never_disconnect():
+    # Sub-requests have no client of their own; StreamingResponse polls this
+    # for disconnects and is cancelled once it has sent the last chunk
+    await anyio.sleep_forever()
+
+
+async def dispatch(request: Request, sub: BatchSubRequest) -> BatchSubResponse:
+    """Run one sub-request through the app (routing, dependencies, exception handlers), in process."""
+    url = urlsplit(sub.path)
+    if url.path.rstrip("/") == BATCH_PATH:
+        return BatchSubResponse(id=sub.id, status=status.HTTP_400_BAD_REQUEST, headers={},
+                                body={"detail": "Batches cannot be nested"})
+
+    headers = [(name.lower().encode("latin-1"), value.encode("latin-1"))
+               for name, value in sub.headers.items() if name.lower() not in RESERVED_HEADERS]
+    if "authorization" in request.headers:
+        headers.append((b"authorization", request.headers["authorization"].encode("latin-1")))
+    body = b""
+    if sub.body is not None:
+        body = json.dumps(sub.body).encode("utf-8")
+        headers += [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+
+    scope = {
+        key: request.scope[key]
+        for key in ("type", "asgi", "http_version", "scheme", "server", "client")
+        if key in request.scope
+    }
+    scope.update(
+        method=sub.method, path=url.path, raw_path=url.path.encode(), root_path="",
+        query_string=url.query.encode(), headers=headers,
+    )
+    if "state" in request.scope:
+        scope["state"] = dict(request.scope["state"])
+
+    body_sent = False
+
+    async def receive():
+        nonlocal body_sent
+        if body_sent:
+            await _never_disconnect()
+        body_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    response_status, response_headers, chunks = None, [], []
+
+    async def send(message):
+        nonlocal response_status, response_headers
+        if message["type"] == "http.response.start":
+            response_status, response_headers = message["status"], message.get("headers", [])
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await request.app(scope, receive, send)
+    except Exception:
+        # ServerErrorMiddleware has already sent its 500 when it re-raises
+        logger.exception("Batch sub-request %s %s failed", sub.method, sub.path)
+        if response_status is None:
+            response_status, response_headers, chunks = 500, [], [b'{"detail":"Internal Server Error"}']
+            response_headers = [(b"content-type", b"application/json")]
+
+    out_headers = {
+        name.decode("latin-1"): value.decode("latin-1")
+        for name, value in response_headers if name.lower() != b"content-length"
+    }
+    return BatchSubResponse(
+        id=sub.id,
+        status=response_status,
+        headers=out_headers,
+        body=_decode_body(out_headers.get("content-type", ""), b"".join(chunks)),
+    )
+
+
+async def run_batch(request: Request, batch: BatchRequest, current_user: Principal) -> BatchResponse:
+    """
+    Run the sub-requests of one batch as `current_user`, with its token
+    decoded and its principal resolved once. Consecutive GETs run
+    concurrently on up to BATCH_MAX_CONCURRENCY workers; any other method
+    waits for the GETs before it and runs alone. Each worker owns a lane of
+    sessions its sub-requests share (a Session is not safe to use from two
+    requests at once).
+    """
+    requests = batch.requests
+    if not requests:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="A batch needs at least one request")
+    if len(requests) > settings.BATCH_MAX_REQUESTS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.BATCH_MAX_REQUESTS} requests per batch",
+        )
+
+    results: List[Optional[BatchSubResponse]] = [None] * len(requests)
+    lanes = [BatchLane() for _ in range(min(len(requests), max(settings.BATCH_MAX_CONCURRENCY, 1)))]
+
+    async def worker(lane: BatchLane, pending):
+        batch_lane.set(lane)  # this task's context only
+        for index in pending:
+            results[index] = await dispatch(request, requests[index])
+            if results[index].status >= 500:
+                await lane.end_transactions()  # a failed handler may leave the session unusable
+
+    principal_token = batch_principal.set(current_user)
+    try:
+        for group in _groups(requests):
+            pending = iter(group)  # shared, so idle workers pick up the next sub-request
+            used = lanes[:len(group)]
+            async with anyio.create_task_group() as tg:
+                for lane in used:
+                    tg.start_soon(worker, lane, pending)
+            for lane in used:
+                await lane.end_transactions()
+    finally:
+        batch_principal.reset(principal_token)
+        for lane in lanes:
+            await lane.close()
+
+    return BatchResponse(responses=results)
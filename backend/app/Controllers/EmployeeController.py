@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 from backend.app.Model.EmployeeModel import EmployeeModel
 from backend.app.Model.AssignedProjectModel import AssignedProjectModel
@@ -8,63 +9,60 @@ from backend.app.Model.ProjectModel import ProjectModel
 from backend.app.View.AssignmentSchemas import (
     AssignmentResponse, TaskCompletionCreate, TaskCompletionResponse
 )
+from backend.app.Core.Config import config as settings
+from backend.app.Utils.Pagination import keyset, to_page
+from backend.app.Utils.Serialization import validate_rows
+from backend.app.Utils.Fields import Fields, partial_schema
+from backend.app.Utils.Capacity import bump_committed_hours, bump_committed_hours_async
+from backend.app.Utils.ProjectRollups import completion_rollup, bump_rollups, bump_rollups_async
+from .AssignProjectController import assignment_with_names, assignment_rows
 
 
-def get_my_assignments(db: Session, current_user: EmployeeModel):
+def to_completion_response(a: AssignedProjectModel, emp_name: str, project_name: str):
+    return TaskCompletionResponse(
+        assign_id=a.assign_id,
+        emp_id=a.emp_id,
+        project_id=a.project_id,
+        emp_name=emp_name,
+        project_name=project_name,
+        assigned_at=a.assigned_at,
+        completed_at=a.completed_at,
+        allotted_hours=a.allotted_hours,
+        hours_worked=a.hours_worked,
+        completion_notes=a.completion_notes
+    )
+
+
+def get_my_assignments(db: Session, current_user: EmployeeModel,
+                       cursor: Optional[str] = None, limit: int = settings.PAGE_SIZE_DEFAULT, fields: Fields = None):
     """
-    Get all assignments for the current user.
+    Get a page of assignments for the current user.
     Available to all roles (Employee/Manager/Admin).
     """
-    assignments = db.query(AssignedProjectModel).filter(
-        AssignedProjectModel.emp_id == current_user.emp_id
-    ).join(ProjectModel).all()
-    
-    return [
-        AssignmentResponse(
-            assign_id=a.assign_id,
-            emp_id=a.emp_id,
-            project_id=a.project_id,
-            assigned_at=a.assigned_at,
-            allotted_hours=a.allotted_hours,
-            emp_name=a.employee.emp_name,
-            project_name=a.project.name,
-            is_completed=a.is_completed,
-            completed_at=a.completed_at,
-            hours_worked=a.hours_worked,
-            completion_notes=a.completion_notes
-        ) for a in assignments
-    ]
-
-
-def get_my_assignment_details(db: Session, assign_id: int, current_user: EmployeeModel):
+    stmt = assignment_rows(fields).where(AssignedProjectModel.emp_id == current_user.emp_id)
+    rows = db.execute(keyset(stmt, AssignedProjectModel.assign_id, cursor, limit)).all()
+    return to_page(rows, limit, key_of=lambda row: row.assign_id, schema=partial_schema(AssignmentResponse, fields))
+
+
+def get_my_assignment_details(db: Session, assign_id: int, current_user: EmployeeModel, fields: Fields = None):
     """
     Get details of a specific assignment.
     Users can only see their own assignments.
     """
-    assignment = db.query(AssignedProjectModel).filter(
-        AssignedProjectModel.assign_id == assign_id,
-        AssignedProjectModel.emp_id == current_user.emp_id
+    row = db.execute(
+        assignment_rows(fields).where(
+            AssignedProjectModel.assign_id == assign_id,
+            AssignedProjectModel.emp_id == current_user.emp_id
+        )
     ).first()
     
-    if not assignment:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Assignment not found or you don't have access to it"
         )
     
-    return AssignmentResponse(
-        assign_id=assignment.assign_id,
-        emp_id=assignment.emp_id,
-        project_id=assignment.project_id,
-        assigned_at=assignment.assigned_at,
-        allotted_hours=assignment.allotted_hours,
-        emp_name=assignment.employee.emp_name,
-        project_name=assignment.project.name,
-        is_completed=assignment.is_completed,
-        completed_at=assignment.completed_at,
-        hours_worked=assignment.hours_worked,
-        completion_notes=assignment.completion_notes
-    )
+    return partial_schema(AssignmentResponse, fields).model_validate(row._asdict())
 
 
 def mark_task_completed(db: Session, completion: TaskCompletionCreate, current_user: EmployeeModel):
@@ -72,16 +70,19 @@ def mark_task_completed(db: Session, completion: TaskCompletionCreate, current_u
     Mark a task/assignment as completed.
     Users can only complete their own assignments.
     """
-    assignment = db.query(AssignedProjectModel).filter(
-        AssignedProjectModel.assign_id == completion.assign_id,
-        AssignedProjectModel.emp_id == current_user.emp_id
+    row = db.execute(
+        assignment_with_names().where(
+            AssignedProjectModel.assign_id == completion.assign_id,
+            AssignedProjectModel.emp_id == current_user.emp_id
+        )
     ).first()
     
-    if not assignment:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Assignment not found or you don't have access to it"
         )
+    assignment, emp_name, project_name = row
     
     if assignment.is_completed:
         raise HTTPException(
@@ -101,44 +102,100 @@ def mark_task_completed(db: Session, completion: TaskCompletionCreate, current_u
     assignment.completed_at = datetime.utcnow()
     assignment.hours_worked = completion.hours_worked
     assignment.completion_notes = completion.completion_notes
+    # Completed work no longer holds the employee's hours
+    bump_committed_hours(db, {assignment.emp_id: -assignment.allotted_hours})
+    bump_rollups(db, [completion_rollup(assignment)])
     
     db.commit()
     db.refresh(assignment)
     
-    return TaskCompletionResponse(
-        assign_id=assignment.assign_id,
-        emp_id=assignment.emp_id,
-        project_id=assignment.project_id,
-        emp_name=assignment.employee.emp_name,
-        project_name=assignment.project.name,
-        assigned_at=assignment.assigned_at,
-        completed_at=assignment.completed_at,
-        allotted_hours=assignment.allotted_hours,
-        hours_worked=assignment.hours_worked,
-        completion_notes=assignment.completion_notes
-    )
+    return to_completion_response(assignment, emp_name, project_name)
 
 
-def get_my_completed_tasks(db: Session, current_user: EmployeeModel):
+def get_my_completed_tasks(db: Session, current_user: EmployeeModel, fields: Fields = None):
     """
     Get history of all completed tasks for the current user.
     """
-    completed_assignments = db.query(AssignedProjectModel).filter(
-        AssignedProjectModel.emp_id == current_user.emp_id,
-        AssignedProjectModel.is_completed == True
-    ).join(ProjectModel).all()
-    
-    return [
-        TaskCompletionResponse(
-            assign_id=a.assign_id,
-            emp_id=a.emp_id,
-            project_id=a.project_id,
-            emp_name=a.employee.emp_name,
-            project_name=a.project.name,
-            assigned_at=a.assigned_at,
-            completed_at=a.completed_at,
-            allotted_hours=a.allotted_hours,
-            hours_worked=a.hours_worked,
-            completion_notes=a.completion_notes
-        ) for a in completed_assignments
-    ]
+    rows = db.execute(
+        assignment_rows(fields).where(
+            AssignedProjectModel.emp_id == current_user.emp_id,
+            AssignedProjectModel.is_completed == True
+        )
+    ).all()
+    return validate_rows(partial_schema(TaskCompletionResponse, fields), rows)
+
+
+# --- async variants (used when Config.DB_ASYNC_MODE is on) ---
+async def get_my_assignments_async(db: AsyncSession, current_user: EmployeeModel,
+                                   cursor: Optional[str] = None, limit: int = settings.PAGE_SIZE_DEFAULT,
+                                   fields: Fields = None):
+    stmt = assignment_rows(fields).where(AssignedProjectModel.emp_id == current_user.emp_id)
+    rows = (await db.execute(keyset(stmt, AssignedProjectModel.assign_id, cursor, limit))).all()
+    return to_page(rows, limit, key_of=lambda row: row.assign_id, schema=partial_schema(AssignmentResponse, fields))
+
+
+async def get_my_assignment_details_async(db: AsyncSession, assign_id: int, current_user: EmployeeModel,
+                                          fields: Fields = None):
+    row = (await db.execute(
+        assignment_rows(fields).where(
+            AssignedProjectModel.assign_id == assign_id,
+            AssignedProjectModel.emp_id == current_user.emp_id
+        )
+    )).first()
+
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Assignment not found or you don't have access to it"
+        )
+
+    return partial_schema(AssignmentResponse, fields).model_validate(row._asdict())
+
+
+async def mark_task_completed_async(db: AsyncSession, completion: TaskCompletionCreate, current_user: EmployeeModel):
+    row = (await db.execute(
+        assignment_with_names().where(
+            AssignedProjectModel.assign_id == completion.assign_id,
+            AssignedProjectModel.emp_id == current_user.emp_id
+        )
+    )).first()
+
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Assignment not found or you don't have access to it"
+        )
+    assignment, emp_name, project_name = row
+
+    if assignment.is_completed:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="This assignment is already marked as completed"
+        )
+
+    if completion.hours_worked < 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Hours worked cannot be negative"
+        )
+
+    assignment.is_completed = True
+    assignment.completed_at = datetime.utcnow()
+    assignment.hours_worked = completion.hours_worked
+    assignment.completion_notes = completion.completion_notes
+    await bump_committed_hours_async(db, {assignment.emp_id: -assignment.allotted_hours})
+    await bump_rollups_async(db, [completion_rollup(assignment)])
+
+    await db.commit()
+
+    return to_completion_response(assignment, emp_name, project_name)
+
+
+async def get_my_completed_tasks_async(db: AsyncSession, current_user: EmployeeModel, fields: Fields = None):
+    rows = (await db.execute(
+        assignment_rows(fields).where(
+            AssignedProjectModel.emp_id == current_user.emp_id,
+            AssignedProjectModel.is_completed == True
+        )
+    )).all()
+    return validate_rows(partial_schema(TaskCompletionResponse, fields), rows)
@@ -0,0 +1,114 @@
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime
+from typing import Iterator, Optional
+from sqlalchemy import select
+from backend.app.DataBase import SessionLocal
+from backend.app.Model.EmployeeModel import EmployeeModel
+from backend.app.Model.ProjectModel import ProjectModel
+from backend.app.Model.AssignedProjectModel import AssignedProjectModel
+from backend.app.Model.Role import RoleEnum
+from backend.app.Core.Config import config as settings
+from backend.app.Controllers.ManagerController import check_manager, check_manager_or_admin
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+# Exports select plain columns rather than ORM entities so nothing piles up in the identity map
+def employee_export_query(current_user: EmployeeModel):
+    # Same scope as GET /api/manager/employees: managers only, employees of their department
+    check_manager(current_user)
+    stmt = select(
+        EmployeeModel.emp_id,
+        EmployeeModel.emp_name,
+        EmployeeModel.email,
+        EmployeeModel.role,
+        EmployeeModel.dept,
+        EmployeeModel.skills,
+        EmployeeModel.experience,
+        EmployeeModel.billable_work_hours,
+        EmployeeModel.is_active,
+        EmployeeModel.added_by,
+    )
+    stmt = stmt.where(EmployeeModel.role == RoleEnum.employee, EmployeeModel.dept == current_user.dept)
+    return stmt.order_by(EmployeeModel.emp_id)
+
+
+def project_export_query(current_user: EmployeeModel):
+    check_manager_or_admin(current_user)
+    return select(
+        ProjectModel.project_id,
+        ProjectModel.name,
+        ProjectModel.client,
+        ProjectModel.expected_hours,
+        ProjectModel.status,
+        ProjectModel.start_date,
+        ProjectModel.end_date,
+    ).order_by(ProjectModel.project_id)
+
+
+def assignment_export_query(current_user: EmployeeModel, emp_id: Optional[int] = None, project_id: Optional[int] = None):
+    check_manager_or_admin(current_user)
+    stmt = (
+        select(
+            AssignedProjectModel.assign_id,
+            AssignedProjectModel.emp_id,
+            EmployeeModel.emp_name,
+            AssignedProjectModel.project_id,
+            ProjectModel.name.label("project_name"),
+            AssignedProjectModel.assigned_at,
+            AssignedProjectModel.allotted_hours,
+            AssignedProjectModel.is_completed,
+            AssignedProjectModel.completed_at,
+            AssignedProjectModel.hours_worked,
+            AssignedProjectModel.completion_notes,
+        )
+        .join(EmployeeModel, AssignedProjectModel.emp_id == EmployeeModel.emp_id)
+        .join(ProjectModel, AssignedProjectModel.project_id == ProjectModel.project_id)
+    )
+    if emp_id:
+        stmt = stmt.where(AssignedProjectModel.emp_id == emp_id)
+    if project_id:
+        stmt = stmt.where(AssignedProjectModel.project_id == project_id)
+    return stmt.order_by(AssignedProjectModel.assign_id)
+
+
+def _plain(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _ndjson_chunk(columns, rows) -> str:
+    return "".join(
+        json.dumps(dict(zip(columns, map(_plain, row))), separators=(",", ":")) + "\n"
+        for row in rows
+    )
+
+
+def _csv_chunk(rows) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows([_plain(v) for v in row] for row in rows)
+    return buffer.getvalue()
+
+
+def stream_export(stmt, fmt: str, batch_size: int = None) -> Iterator[str]:
+    """
+    Run `stmt` on a server-side cursor and yield NDJSON/CSV text one batch at a time.
+    Opens its own session because the body is produced after the endpoint has returned.
+    """
+    batch_size = batch_size or settings.EXPORT_BATCH_SIZE
+    with SessionLocal() as db:
+        result = db.execute(stmt, execution_options={"yield_per": batch_size})
+        columns = list(result.keys())
+        if fmt == "csv":
+            yield _csv_chunk([columns])
+        for rows in result.partitions():
+            yield _csv_chunk(rows) if fmt == "csv" else _ndjson_chunk(columns, rows)
@@ -0,0 +1,225 @@
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from backend.app.Model.EmployeeModel import EmployeeModel
+from backend.app.Model.ProjectModel import ProjectModel
+from backend.app.Model.AssignedProjectModel import AssignedProjectModel
+from backend.app.Model.Role import RoleEnum
+from backend.app.Core.Security import hash_passwords
+from backend.app.Core.SkillMatcher import skill_matcher
+from backend.app.Core.Config import config as settings
+from backend.app.Utils.SkillIndex import sync_employee_skills
+from backend.app.Utils.Capacity import rebuild_capacity, bump_committed_hours
+from backend.app.Utils.ProjectRollups import rollup_delta, bump_rollups
+from backend.app.Controllers.AdminController import check_admin, bump_project_stats, _project_stats_delta
+from backend.app.Controllers.ManagerController import check_manager, check_manager_or_admin
+from backend.app.View.EmployeeSchemas import EmployeeCreateByManager
+from backend.app.View.ProjectSchemas import ProjectCreate
+from backend.app.View.AssignmentSchemas import AssignmentCreate
+from backend.app.View.ImportSchemas import ImportResult, ImportRowError
+
+logger = logging.getLogger(__name__)
+
+# (1-based row number, validated schema object)
+Rows = List[Tuple[int, Any]]
+
+
+class ImportReport:
+    def __init__(self, total: int):
+        self.total = total
+        self.created_ids: List[int] = []
+        self.errors: List[ImportRowError] = []
+
+    def fail(self, row: int, error: str):
+        self.errors.append(ImportRowError(row=row, error=error))
+
+    def result(self) -> ImportResult:
+        return ImportResult(
+            total=self.total,
+            created=len(self.created_ids),
+            created_ids=self.created_ids,
+            errors=sorted(self.errors, key=lambda e: e.row),
+        )
+
+
+def _validate(raw_rows: List[Dict[str, Any]], schema: type, report: ImportReport) -> Rows:
+    if len(raw_rows) > settings.IMPORT_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.IMPORT_MAX_ROWS} rows per import",
+        )
+    valid = []
+    for row, raw in enumerate(raw_rows, start=1):
+        try:
+            valid.append((row, schema.model_validate(raw)))
+        except ValidationError as e:
+            err = e.errors()[0]
+            report.fail(row, f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}")
+    return valid
+
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _insert_chunks(db: Session, model, pk, rows: Rows, to_values: Callable[[Any], dict],
+                   report: ImportReport, before_commit: Callable[[Rows, List[int]], None] = None,
+                   after_commit: Callable[[Rows, List[int]], None] = None):
+    """executemany INSERT ... RETURNING per chunk; each chunk commits or rolls back on its own."""
+    for chunk in _chunks(rows, settings.IMPORT_CHUNK_SIZE):
+        try:
+            ids = db.scalars(
+                insert(model).returning(pk, sort_by_parameter_order=True),
+                [to_values(item) for _, item in chunk],
+            ).all()
+            if before_commit:
+                before_commit(chunk, ids)
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.warning("Import chunk of %d %s rows failed: %s", len(chunk), model.__tablename__, e)
+            for row, _ in chunk:
+                report.fail(row, "Database rejected the batch containing this row")
+            continue
+        report.created_ids.extend(ids)
+        if after_commit:
+            after_commit(chunk, ids)
+
+
+def _existing(db: Session, column, values) -> set:
+    """Which of `values` already exist in `column`, in IN-list chunks."""
+    found = set()
+    for chunk in _chunks(list(values), settings.IMPORT_CHUNK_SIZE):
+        found.update(db.scalars(select(column).where(column.in_(chunk))))
+    return found
+
+
+def import_employees(db: Session, raw_rows: List[Dict[str, Any]], current_user: EmployeeModel) -> ImportResult:
+    check_manager(current_user)
+    report = ImportReport(len(raw_rows))
+    rows = _validate(raw_rows, EmployeeCreateByManager, report)
+
+    taken = _existing(db, EmployeeModel.email, {e.email for _, e in rows})
+    accepted: Rows = []
+    for row, employee in rows:
+        if employee.email in taken:
+            report.fail(row, "Email already exists")
+            continue
+        taken.add(employee.email)  # later duplicates within the batch
+        accepted.append((row, employee))
+
+    # bcrypt dominates the cost of onboarding; spread it over the worker pool
+    hashed = dict(zip((row for row, _ in accepted), hash_passwords([e.password for _, e in accepted])))
+    accepted = [(row, (employee, hashed[row])) for row, employee in accepted]
+
+    def index_created(chunk: Rows, ids: List[int]):
+        sync_employee_skills(db, {emp_id: employee.skills for emp_id, (_, (employee, _)) in zip(ids, chunk)})
+        rebuild_capacity(db, ids)
+
+    def refresh_matcher(chunk: Rows, ids: List[int]):
+        for emp_id, (_, (employee, _)) in zip(ids, chunk):
+            skill_matcher.upsert(emp_id, employee.dept, employee.experience, employee.skills)
+
+    _insert_chunks(
+        db, EmployeeModel, EmployeeModel.emp_id, accepted,
+        lambda item: dict(
+            emp_name=item[0].emp_name,
+            email=item[0].email,
+            hashed_password=item[1],
+            role=RoleEnum.employee,  # Always set to employee
+            added_by=current_user.emp_id,
+            billable_work_hours=item[0].billable_work_hours,
+            skills=item[0].skills,
+            experience=item[0].experience,
+            dept=item[0].dept,
+        ),
+        report,
+        before_commit=index_created,
+        after_commit=refresh_matcher,
+    )
+    logger.info("Imported %d/%d employees", len(report.created_ids), report.total)
+    return report.result()
+
+
+def _project_values(project: ProjectCreate) -> dict:
+    return dict(
+        name=project.name,
+        client=project.client,
+        expected_hours=project.expected_hours,
+        status=True if project.status is None else project.status,  # column default
+        end_date=project.end_date,
+    )
+
+
+def import_projects(db: Session, raw_rows: List[Dict[str, Any]], current_user: EmployeeModel) -> ImportResult:
+    check_admin(current_user)
+    report = ImportReport(len(raw_rows))
+    rows = _validate(raw_rows, ProjectCreate, report)
+
+    def bump_stats(chunk: Rows, ids: List[int]):
+        bump_project_stats(db, *(
+            _project_stats_delta(values["status"], values["expected_hours"], +1)
+            for values in (_project_values(p) for _, p in chunk)
+        ))
+
+    _insert_chunks(db, ProjectModel, ProjectModel.project_id, rows, _project_values, report, before_commit=bump_stats)
+    logger.info("Imported %d/%d projects", len(report.created_ids), report.total)
+    return report.result()
+
+
+def import_assignments(db: Session, raw_rows: List[Dict[str, Any]], current_user: EmployeeModel) -> ImportResult:
+    check_manager_or_admin(current_user)
+    report = ImportReport(len(raw_rows))
+    rows = _validate(raw_rows, AssignmentCreate, report)
+
+    emp_ids = _existing(db, EmployeeModel.emp_id, {a.emp_id for _, a in rows})
+    project_ids = _existing(db, ProjectModel.project_id, {a.project_id for _, a in rows})
+    pairs = {(a.emp_id, a.project_id) for _, a in rows if a.emp_id in emp_ids and a.project_id in project_ids}
+    taken = set()
+    pair_column = tuple_(AssignedProjectModel.emp_id, AssignedProjectModel.project_id)
+    for chunk in _chunks(list(pairs), settings.IMPORT_CHUNK_SIZE):
+        taken.update(tuple(pair) for pair in db.execute(
+            select(AssignedProjectModel.emp_id, AssignedProjectModel.project_id).where(pair_column.in_(chunk))
+        ))
+
+    accepted: Rows = []
+    for row, assignment in rows:
+        pair = (assignment.emp_id, assignment.project_id)
+        if assignment.emp_id not in emp_ids:
+            report.fail(row, "Employee not found")
+        elif assignment.project_id not in project_ids:
+            report.fail(row, "Project not found")
+        elif pair in taken:
+            report.fail(row, "Assignment already exists")
+        else:
+            taken.add(pair)
+            accepted.append((row, assignment))
+
+    # One timestamp for the whole import, so the rollup day is known without reading rows back
+    assigned_at = datetime.utcnow()
+
+    def commit_hours(chunk: Rows, ids: List[int]):
+        deltas = {}
+        for _, a in chunk:
+            deltas[a.emp_id] = deltas.get(a.emp_id, 0) + a.allotted_hours
+        bump_committed_hours(db, deltas)
+        bump_rollups(db, (
+            rollup_delta(a.project_id, assigned_at, assignments_added=1, allotted_hours=a.allotted_hours)
+            for _, a in chunk
+        ))
+
+    _insert_chunks(
+        db, AssignedProjectModel, AssignedProjectModel.assign_id, accepted,
+        lambda a: dict(emp_id=a.emp_id, project_id=a.project_id, allotted_hours=a.allotted_hours,
+                       assigned_at=assigned_at),
+        report,
+        before_commit=commit_hours,
+    )
+    logger.info("Imported %d/%d assignments", len(report.created_ids), report.total)
+    return report.result()
@@ -1,13 +1,35 @@
+import logging
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from typing import Optional
 from backend.app.Model.EmployeeModel import EmployeeModel
 from backend.app.Model.Role import RoleEnum
-from backend.app.Core.Security import hash_password
+from backend.app.Model.EmployeeCapacityModel import EmployeeCapacityModel
+from backend.app.Core.Security import hash_password, invalidate_principal
+from backend.app.Core.Config import config as settings
+from backend.app.Core.SkillMatcher import skill_matcher
+from backend.app.Core.EntityCache import employee_cache
+from backend.app.Utils.Pagination import keyset, keyset_desc, to_page
+from backend.app.Utils.Serialization import validate_rows
+from backend.app.Utils.Fields import Fields, narrow, partial_schema, projection
+from backend.app.Utils.Capacity import rebuild_capacity
+from backend.app.Utils.SkillIndex import parse_skills, sync_employee_skills, employees_with_any_skill
 from backend.app.View.EmployeeSchemas import (
-    EmployeeCreate, EmployeeCreateByManager, EmployeeUpdate, EmployeeResponse,
+    EmployeeCreate, EmployeeCreateByManager, EmployeeUpdate, EmployeeResponse, SkillMatchResponse,
+    EmployeeCapacityResponse,
 )
 
+logger = logging.getLogger(__name__)
+
+# EmployeeResponse fields as plain columns: list reads validate rows straight
+# into the response schemas without building ORM objects first
+EMPLOYEE_COLUMNS = (
+    EmployeeModel.emp_id, EmployeeModel.emp_name, EmployeeModel.email, EmployeeModel.role,
+    EmployeeModel.billable_work_hours, EmployeeModel.skills, EmployeeModel.experience,
+    EmployeeModel.dept, EmployeeModel.is_active, EmployeeModel.added_by,
+)
+EMPLOYEE_CAPACITY_COLUMNS = EMPLOYEE_COLUMNS + (EmployeeCapacityModel.committed_hours, EmployeeCapacityModel.available_hours)
+
 def check_manager_or_admin(user):
     if user.role not in [RoleEnum.manager, RoleEnum.admin]:
         raise HTTPException(
@@ -22,11 +44,13 @@ def check_manager(user):
             detail="Not enough permissions"
         )
 
+def refresh_skill_matcher(emp: EmployeeModel):
+    """Push a committed employee write into the in-memory skill matcher."""
+    skill_matcher.upsert(emp.emp_id, emp.dept, emp.experience, emp.skills, emp.is_active, emp.role)
+
 # Employee functions
 def create_employee(db: Session, employee: EmployeeCreateByManager, current_user: EmployeeModel):
-    print("\n\n USER:\n", current_user, "\n\n")
-    # print("\nCURRENT USRER ROLE\n", current_user['role'], "\n\n")
-    print("\nCURRENT USRER ROLE\n", current_user.role, "\n\n")
+    logger.debug("create_employee by emp_id=%s role=%s", current_user.emp_id, current_user.role.value)
 
     # check_manager_or_admin(current_user)
     check_manager(current_user)
@@ -53,27 +77,51 @@ def create_employee(db: Session, employee: EmployeeCreateByManager, current_user
         dept=employee.dept
     )
     db.add(new_emp)
+    db.flush()
+    sync_employee_skills(db, {new_emp.emp_id: new_emp.skills})
+    rebuild_capacity(db, [new_emp.emp_id])
     db.commit()
     db.refresh(new_emp)
-    return EmployeeResponse(
-        emp_id=new_emp.emp_id,
-        emp_name=new_emp.emp_name,
-        email=new_emp.email,
-        role=new_emp.role.value,
-        billable_work_hours=new_emp.billable_work_hours,
-        skills=new_emp.skills,
-        experience=new_emp.experience,
-        dept=new_emp.dept,
-        is_active=new_emp.is_active,
-        added_by=new_emp.added_by
-    )
+    refresh_skill_matcher(new_emp)
+    return EmployeeResponse.model_validate(new_emp, from_attributes=True)
+
+def capacity_columns(fields: Fields, sort: str):
+    """EMPLOYEE_CAPACITY_COLUMNS narrowed to `fields`, keeping the keys capacity_page orders by."""
+    keys = ("emp_id", "available_hours") if sort == "available" else ("emp_id",)
+    return projection(EMPLOYEE_CAPACITY_COLUMNS, fields, *keys)
 
-def list_employees(db: Session, dept: Optional[str] = None, role: Optional[str] = None, current_user: EmployeeModel = None):
+def capacity_page(query, min_available_hours: Optional[int], include_assigned: bool, sort: str,
+                  cursor: Optional[str], limit: int, fields: Fields = None):
+    """
+    Join an employee query (selecting capacity_columns) to its hour counters,
+    apply the capacity filters and page it by emp_id or by available hours
+    (most available first).
+    """
+    # Inner join on the bare counter columns so ix_employee_capacity_available serves the
+    # filter and sort; every write path and the startup backfill keep a row per employee
+    query = query.join(EmployeeCapacityModel, EmployeeCapacityModel.emp_id == EmployeeModel.emp_id)
+    if min_available_hours is not None:
+        query = query.filter(EmployeeCapacityModel.available_hours >= min_available_hours)
+    if not include_assigned:
+        # Already assigned = still holding hours on an open assignment
+        query = query.filter(EmployeeCapacityModel.committed_hours == 0)
+
+    if sort == "available":
+        rows = keyset_desc(query, EmployeeCapacityModel.available_hours, EmployeeModel.emp_id, cursor, limit).all()
+        key_of = lambda row: (row.available_hours, row.emp_id)
+    else:
+        rows = keyset(query, EmployeeModel.emp_id, cursor, limit).all()
+        key_of = lambda row: row.emp_id
+    return to_page(rows, limit, key_of=key_of, schema=partial_schema(EmployeeCapacityResponse, fields))
+
+def list_employees(db: Session, dept: Optional[str] = None, role: Optional[str] = None, current_user: EmployeeModel = None,
+                   cursor: Optional[str] = None, limit: int = settings.PAGE_SIZE_DEFAULT,
+                   min_available_hours: Optional[int] = None, sort: str = "emp_id", fields: Fields = None):
     if current_user:
         # check_manager_or_admin(current_user)
         check_manager(current_user)
     
-    query = db.query(EmployeeModel)
+    query = db.query(*capacity_columns(fields, sort))
     
     # Manager can only see employees in their department
     if current_user and current_user.role == RoleEnum.manager:
@@ -82,27 +130,13 @@ def list_employees(db: Session, dept: Optional[str] = None, role: Optional[str]
     if role:
         query = query.filter(EmployeeModel.role == RoleEnum(role))
     
-    employees = query.all()
-    return [
-        EmployeeResponse(
-            emp_id=e.emp_id,
-            emp_name=e.emp_name,
-            email=e.email,
-            role=e.role.value,
-            billable_work_hours=e.billable_work_hours,
-            skills=e.skills,
-            experience=e.experience,
-            dept=e.dept,
-            is_active=e.is_active,
-            added_by=e.added_by
-        ) for e in employees
-    ]
+    return capacity_page(query, min_available_hours, True, sort, cursor, limit, fields)
 
-def get_employee(db: Session, emp_id: int, current_user: EmployeeModel):
+def get_employee(db: Session, emp_id: int, current_user: EmployeeModel, fields: Fields = None):
     # check_manager_or_admin(current_user)
     check_manager(current_user)
     
-    emp = db.query(EmployeeModel).filter(EmployeeModel.emp_id == emp_id).first()
+    emp = employee_cache.get(db, emp_id)
     if not emp:
         raise HTTPException(status_code=404, detail="Employee not found")
     
@@ -119,18 +153,8 @@ def get_employee(db: Session, emp_id: int, current_user: EmployeeModel):
                 detail="You can only view employees in your department"
             )
     
-    return EmployeeResponse(
-        emp_id=emp.emp_id,
-        emp_name=emp.emp_name,
-        email=emp.email,
-        role=emp.role.value,
-        billable_work_hours=emp.billable_work_hours,
-        skills=emp.skills,
-        experience=emp.experience,
-        dept=emp.dept,
-        is_active=emp.is_active,
-        added_by=emp.added_by
-    )
+    # Served from the entity cache, so only the payload is narrowed
+    return narrow(emp, fields)
 
 def update_employee(db: Session, emp_id: int, update: EmployeeUpdate, current_user: EmployeeModel):
     # check_manager_or_admin(current_user)
@@ -159,24 +183,21 @@ def update_employee(db: Session, emp_id: int, update: EmployeeUpdate, current_us
             raise HTTPException(status_code=400, detail="Email already exists")
         emp.email = update.email
     
-    for field, value in update.dict(exclude_unset=True).items():
+    fields = update.dict(exclude_unset=True)
+    for field, value in fields.items():
         if field != 'email' and hasattr(emp, field):
             setattr(emp, field, value)
+    if 'skills' in fields:
+        sync_employee_skills(db, {emp.emp_id: emp.skills})
+    if 'billable_work_hours' in fields:
+        rebuild_capacity(db, [emp.emp_id])
     
-    db.commit()
+    with employee_cache.writing(emp.emp_id):
+        db.commit()
+    invalidate_principal(emp.emp_id)
     db.refresh(emp)
-    return EmployeeResponse(
-        emp_id=emp.emp_id,
-        emp_name=emp.emp_name,
-        email=emp.email,
-        role=emp.role.value,
-        billable_work_hours=emp.billable_work_hours,
-        skills=emp.skills,
-        experience=emp.experience,
-        dept=emp.dept,
-        is_active=emp.is_active,
-        added_by=emp.added_by
-    )
+    refresh_skill_matcher(emp)
+    return EmployeeResponse.model_validate(emp, from_attributes=True)
 
 def toggle_employee_status(db: Session, emp_id: int, current_user: EmployeeModel):
     # check_manager_or_admin(current_user)
@@ -201,13 +222,21 @@ def toggle_employee_status(db: Session, emp_id: int, current_user: EmployeeModel
     
     # Toggle the active status
     emp.is_active = not emp.is_active
-    db.commit()
+    with employee_cache.writing(emp.emp_id):
+        db.commit()
+    invalidate_principal(emp.emp_id)
+    refresh_skill_matcher(emp)
     status_text = "activated" if emp.is_active else "deactivated"
     return {"message": f"Employee {status_text} successfully"}
 
 def search_employees_by_skills(db: Session, skills: str, current_user: EmployeeModel, 
                                 min_experience: Optional[int] = None, 
-                                include_assigned: bool = False):
+                                include_assigned: bool = False,
+                                cursor: Optional[str] = None,
+                                limit: int = settings.PAGE_SIZE_DEFAULT,
+                                min_available_hours: Optional[int] = None,
+                                sort: str = "emp_id",
+                                fields: Fields = None):
     """
     Search employees by skill set for project assignment.
     Managers can search employees in their department based on required skills.
@@ -217,19 +246,24 @@ def search_employees_by_skills(db: Session, skills: str, current_user: EmployeeM
         skills: Comma-separated skills to search for (e.g., "Python,FastAPI,SQL")
         current_user: Current logged-in manager
         min_experience: Minimum years of experience required
-        include_assigned: Whether to include already assigned employees
+        include_assigned: Whether to include employees with hours committed to open assignments
+        cursor: Opaque cursor from the previous page's X-Next-Cursor header
+        limit: Page size
+        min_available_hours: Only employees with at least this many uncommitted billable hours
+        sort: "emp_id" or "available" (most available hours first)
+        fields: Only these EmployeeCapacityResponse fields (None = all)
     
     Returns:
-        List of matching employees with their details
+        Page of matching employees with their details
     """
     # check_manager_or_admin(current_user)
     check_manager(current_user)
     
     # Parse skills
-    skill_list = [s.strip().lower() for s in skills.split(',') if s.strip()]
+    skill_list = parse_skills(skills)
     
     # Base query - managers can only search in their department
-    query = db.query(EmployeeModel).filter(
+    query = db.query(*capacity_columns(fields, sort)).filter(
         EmployeeModel.is_active == True,
         EmployeeModel.role == RoleEnum.employee  # Only search employees, not managers/admins
     )
@@ -246,29 +280,42 @@ def search_employees_by_skills(db: Session, skills: str, current_user: EmployeeM
     if min_experience is not None:
         query = query.filter(EmployeeModel.experience >= min_experience)
     
-    employees = query.all()
+    # Filter by skills (case-insensitive partial match) through the skill index
+    if not skill_list:
+        return to_page([], limit, key_of=lambda e: e.emp_id)
+    query = query.filter(EmployeeModel.emp_id.in_(employees_with_any_skill(skill_list)))
     
-    # Filter by skills (case-insensitive partial match)
-    matching_employees = []
-    for emp in employees:
-        if emp.skills:
-            emp_skills = [s.strip().lower() for s in emp.skills.split(',')]
-            # Check if employee has at least one of the required skills
-            if any(req_skill in emp_skills or any(req_skill in emp_skill for emp_skill in emp_skills) 
-                   for req_skill in skill_list):
-                matching_employees.append(emp)
-    
-    return [
-        EmployeeResponse(
-            emp_id=e.emp_id,
-            emp_name=e.emp_name,
-            email=e.email,
-            role=e.role.value,
-            billable_work_hours=e.billable_work_hours,
-            skills=e.skills,
-            experience=e.experience,
-            dept=e.dept,
-            is_active=e.is_active,
-            added_by=e.added_by
-        ) for e in matching_employees
-    ]
+    # Filter and order by the maintained hour counters
+    return capacity_page(query, min_available_hours, include_assigned, sort, cursor, limit, fields)
+
+def match_employees_by_skills(db: Session, skills: str, current_user: EmployeeModel,
+                              min_experience: Optional[int] = None, k: int = 10, fields: Fields = None):
+    """
+    Rank employees for a project by how many of the required skills they cover,
+    then by experience. Scoring runs on the in-memory skill matcher; only the
+    top k employees are read from the database.
+    """
+    check_manager(current_user)
+
+    dept = None
+    if current_user.role == RoleEnum.manager:
+        if not current_user.dept:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Manager department not set"
+            )
+        dept = current_user.dept
+
+    skill_matcher.ensure_fresh(db)
+    ranked = skill_matcher.top_k(parse_skills(skills), k, dept, min_experience)
+    if not ranked:
+        return []
+
+    employees = {row.emp_id: row._mapping for row in
+                 db.query(*projection(EMPLOYEE_COLUMNS, fields, "emp_id"))
+                 .filter(EmployeeModel.emp_id.in_([r["emp_id"] for r in ranked]))}
+    return validate_rows(partial_schema(SkillMatchResponse, fields), [
+        {**e, **r}
+        for r in ranked
+        if (e := employees.get(r["emp_id"])) is not None
+    ])
@@ -0,0 +1,39 @@
+from contextvars import ContextVar
+from typing import Optional
+
+import anyio
+
+from backend.app.Utils.Principal import Principal
+
+
+class BatchLane:
+    """
+    Sessions shared by the /api/batch sub-requests that one batch worker runs
+    one after another. get_db / get_async_db open them on first use; the batch
+    ends their transactions between groups and closes them at the end.
+    """
+
+    def __init__(self):
+        self.session = None
+        self.async_session = None
+
+    async def end_transactions(self):
+        """Roll back (reads) so the next sub-requests see writes made meanwhile."""
+        if self.session is not None:
+            await anyio.to_thread.run_sync(self.session.rollback)
+        if self.async_session is not None:
+            await self.async_session.rollback()
+
+    async def close(self):
+        if self.session is not None:
+            await anyio.to_thread.run_sync(self.session.close)
+            self.session = None
+        if self.async_session is not None:
+            await self.async_session.close()
+            self.async_session = None
+
+
+# Set while /api/batch runs a sub-request: the caller it already authenticated
+# and the lane whose sessions the sub-request's dependencies should use
+batch_principal: ContextVar[Optional[Principal]] = ContextVar("batch_principal", default=None)
+batch_lane: ContextVar[Optional[BatchLane]] = ContextVar("batch_lane", default=None)
@@ -1,4 +1,5 @@
 from pydantic_settings import BaseSettings
+from typing import Optional
 
 class Config(BaseSettings):
     DataBase_URL: str = "sqlite:///./intern_proj_manage.db.sqlite3"
@@ -7,6 +8,99 @@ class Config(BaseSettings):
     ACCESS_TOKEN_EXPIRY_MIN: int = 30
     REFRESH_TOKEN_EXPIRY_DAYS: int = 365
 
+    # Serve auth, assignment and employee routes with async handlers and AsyncSession
+    DB_ASYNC_MODE: bool = False
+    DataBase_ASYNC_URL: Optional[str] = None  # defaults to DataBase_URL with an async driver
+
+    # List endpoints (keyset pagination)
+    PAGE_SIZE_DEFAULT: int = 100
+    PAGE_SIZE_MAX: int = 1000
+
+    # Streaming exports: rows fetched per server-side cursor batch
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # Bulk imports: rows per INSERT/commit chunk and per request
+    IMPORT_CHUNK_SIZE: int = 500
+    IMPORT_MAX_ROWS: int = 10000
+    # Request body cap: IMPORT_MAX_ROWS rows of up to this many bytes each (JSON or CSV)
+    IMPORT_MAX_ROW_BYTES: int = 2048
+
+    # /api/batch: sub-requests per batch, and how many consecutive GETs run at once (one session each)
+    BATCH_MAX_REQUESTS: int = 20
+    BATCH_MAX_CONCURRENCY: int = 4
+
+    # In-memory skill matcher: full reload interval (picks up other workers' writes) and max k
+    SKILL_MATCHER_MAX_AGE_SECONDS: int = 300
+    SKILL_MATCH_MAX_K: int = 100
+
+    # Longest date range (days) one burn-down request may cover
+    BURNDOWN_MAX_DAYS: int = 731
+
+    # Keep project totals in a project_stats row updated by project writes (O(1) stats reads)
+    PROJECT_STATS_TABLE: bool = False
+
+    # Engine / connection pool (ignored for in-memory SQLite)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a connection before erroring
+    DB_POOL_RECYCLE: int = 1800  # seconds; drop connections older than this
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO: bool = False
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # PostgreSQL only, 0 = no limit
+
+    # SQLite PRAGMAs applied on every new connection
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KB: int = 65536
+    SQLITE_MMAP_SIZE: int = 268435456
+
+    # Password hashing: "process" runs bcrypt in a process pool, "inline" in the request thread
+    PASSWORD_HASH_BACKEND: str = "process"
+    PASSWORD_HASH_WORKERS: int = 0  # 0 = one worker per CPU
+    PASSWORD_HASH_QUEUE_SIZE: int = 16  # keep below the anyio threadpool size (40)
+    # bcrypt cost; see calibrate_password_hashing.py. Hashes at another cost are upgraded on login
+    PASSWORD_HASH_ROUNDS: int = 12
+
+    # ETags on the project/employee/assignment GETs, from per-table version counters (304 on If-None-Match)
+    ETAGS_ENABLED: bool = True
+
+    # Response encoding: compress bodies of at least this size with zstd/br (if installed) or gzip, 0 = off
+    RESPONSE_COMPRESSION_MIN_BYTES: int = 1024
+    RESPONSE_COMPRESSION_LEVEL: int = 6  # gzip level
+    # Serve JSON as msgpack to clients whose Accept prefers application/msgpack
+    RESPONSE_MSGPACK_ENABLED: bool = True
+    # Bodies at least this large are encoded/compressed in a worker thread, off the event loop
+    RESPONSE_ENCODE_THREAD_MIN_BYTES: int = 16384
+
+    # Read-through cache of project/employee snapshots for primary-key lookups
+    # "memory" is per process: with ETAGS_ENABLED and several workers use a shared backend
+    ENTITY_CACHE_BACKEND: str = "memory"  # "shared" (local stand-in store), "off", or dotted path to an EntityCacheBackend subclass
+    ENTITY_CACHE_MAX_SIZE: int = 10000
+    ENTITY_CACHE_TTL_SECONDS: int = 60
+
+    # Cut-down response models kept for distinct `fields=` selections (evicted least recently used)
+    SPARSE_FIELDS_CACHE_SIZE: int = 256
+
+    # Authenticated-user cache used by get_current_user
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    # Verified access tokens kept to skip repeated signature checks
+    TOKEN_CACHE_MAX_SIZE: int = 4096
+
+    # Login throttling (token buckets checked before bcrypt runs)
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_RATE_EMAIL_BURST: int = 5
+    LOGIN_RATE_EMAIL_PER_MINUTE: float = 5
+    LOGIN_RATE_IP_BURST: int = 30
+    LOGIN_RATE_IP_PER_MINUTE: float = 30
+    RATE_LIMIT_BACKEND: str = "memory"  # or dotted path to a RateLimitBackend subclass
+
+    # Logging
+    LOG_LEVEL: str = "INFO"
+    LOG_DEBUG_SAMPLE_RATE: float = 1.0  # fraction of DEBUG records kept
+    LOG_QUEUE_SIZE: int = 10000  # records beyond this are dropped, never blocking a request
+
     # class Config:
     #     env_file = ".env"
 config = Config()
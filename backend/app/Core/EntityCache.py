@@ -0,0 +1,243 @@
+import importlib
+from abc import ABC, abstractmethod
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.Core.Config import config as settings
+from backend.app.Model.EmployeeModel import EmployeeModel
+from backend.app.Model.ProjectModel import ProjectModel
+from backend.app.Utils.TTLCache import TTLCache
+from backend.app.View.EmployeeSchemas import EmployeeResponse
+from backend.app.View.ProjectSchemas import ProjectResponse
+
+
+class EntityCacheBackend(ABC):
+    """
+    Storage for cached entity snapshots. Subclass this to share the cache between
+    workers (e.g. on Redis) and point Config.ENTITY_CACHE_BACKEND at the class.
+    Backends with `serialized = True` are handed JSON strings instead of objects.
+    """
+
+    serialized = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any):
+        ...
+
+    @abstractmethod
+    def delete(self, key: str):
+        ...
+
+
+class InMemoryEntityCacheBackend(EntityCacheBackend):
+    """Per-process LRU whose entries also expire after ENTITY_CACHE_TTL_SECONDS."""
+
+    def __init__(self):
+        self._cache = TTLCache(maxsize=settings.ENTITY_CACHE_MAX_SIZE, ttl=settings.ENTITY_CACHE_TTL_SECONDS)
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: Any):
+        self._cache.set(key, value)
+
+    def delete(self, key: str):
+        self._cache.invalidate(key)
+
+
+class LocalKeyValueStore:
+    """
+    Stand-in for a shared key-value server: the slice of the redis-py client API
+    that SharedStoreEntityCacheBackend uses. For tests and single-host setups.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[str, Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Optional[str]:
+        with self._lock:
+            entry = self._data.get(name)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._data[name]
+                return None
+            return value
+
+    def set(self, name: str, value: str, ex: Optional[int] = None):
+        with self._lock:
+            self._data[name] = (value, time.time() + ex if ex else None)
+
+    def delete(self, *names: str):
+        with self._lock:
+            for name in names:
+                self._data.pop(name, None)
+
+
+class SharedStoreEntityCacheBackend(EntityCacheBackend):
+    """
+    JSON snapshots in a key-value store with a redis-py style client (get,
+    set(ex=...), delete); size is bounded by the store's own eviction policy.
+    Without a client it uses LocalKeyValueStore. A Redis subclass only needs
+    `super().__init__(redis.Redis.from_url(url))`.
+    """
+
+    serialized = True
+
+    def __init__(self, client=None, prefix: str = "entity-cache:"):
+        self.client = client if client is not None else LocalKeyValueStore()
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: Any):
+        self.client.set(self.prefix + key, value, ex=settings.ENTITY_CACHE_TTL_SECONDS)
+
+    def delete(self, key: str):
+        self.client.delete(self.prefix + key)
+
+
+def _load_backend(name: str) -> Optional[EntityCacheBackend]:
+    if name == "off":
+        return None
+    if name == "memory":
+        return InMemoryEntityCacheBackend()
+    if name == "shared":
+        return SharedStoreEntityCacheBackend()
+    # Dotted path to an EntityCacheBackend subclass, e.g. "myapp.cache.RedisEntityCacheBackend"
+    module_name, _, class_name = name.rpartition(".")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+class EntityCache:
+    """
+    Read-through cache of one entity's response snapshot, keyed by primary key.
+
+    Misses load the row with a primary-key get and store its `schema` snapshot
+    (treat returned snapshots as read-only). Write paths commit inside
+    `writing(pk)`: from just before the commit (which bumps the row's ETag
+    version) until the entry is dropped after it, lookups bypass the cache,
+    so no request pairs the new ETag with the old snapshot. A load that
+    overlapped a write is not stored.
+
+    Invalidation only reaches this process's view of the backend; with the
+    per-process `memory` backend, other workers keep serving their snapshot
+    until its TTL, so use a shared backend (or ETAGS_ENABLED=false) when
+    running several workers.
+    """
+
+    def __init__(self, name: str, model, schema: type, backend: Optional[EntityCacheBackend]):
+        self.name = name
+        self.model = model
+        self.schema = schema
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._epoch = 0  # bumped by every invalidation
+        self._writing: Dict[int, int] = {}  # pk -> writes between commit and invalidation
+        self._lock = threading.Lock()
+
+    def _key(self, pk: int) -> str:
+        return f"{self.name}:{pk}"
+
+    def _lookup(self, pk: int) -> Optional[BaseModel]:
+        value = None if pk in self._writing else self.backend.get(self._key(pk))
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return self.schema.model_validate_json(value) if self.backend.serialized else value
+
+    def _store(self, pk: int, row, epoch: int) -> Optional[BaseModel]:
+        if row is None:
+            return None
+        snapshot = self.schema.model_validate(row, from_attributes=True)
+        with self._lock:
+            if epoch == self._epoch and pk not in self._writing:
+                self.backend.set(self._key(pk), snapshot.model_dump_json() if self.backend.serialized else snapshot)
+        return snapshot
+
+    def get(self, db: Session, pk: int) -> Optional[BaseModel]:
+        if self.backend is None:
+            row = db.get(self.model, pk)
+            return None if row is None else self.schema.model_validate(row, from_attributes=True)
+        cached = self._lookup(pk)
+        if cached is not None:
+            return cached
+        epoch = self._epoch
+        return self._store(pk, db.get(self.model, pk), epoch)
+
+    async def get_async(self, db: AsyncSession, pk: int) -> Optional[BaseModel]:
+        if self.backend is None:
+            row = await db.get(self.model, pk)
+            return None if row is None else self.schema.model_validate(row, from_attributes=True)
+        cached = self._lookup(pk)
+        if cached is not None:
+            return cached
+        epoch = self._epoch
+        return self._store(pk, await db.get(self.model, pk), epoch)
+
+    def invalidate(self, pk: int):
+        """Drop a cached snapshot; call after committing changes to that row."""
+        if self.backend is None:
+            return
+        with self._lock:
+            self._epoch += 1
+            self.invalidations += 1
+            self.backend.delete(self._key(int(pk)))
+
+    @contextmanager
+    def writing(self, pk: int):
+        """Wrap the commit of a change to row `pk`; invalidates before and after it."""
+        if self.backend is None:
+            yield
+            return
+        pk = int(pk)
+        with self._lock:
+            self._writing[pk] = self._writing.get(pk, 0) + 1
+        self.invalidate(pk)
+        try:
+            yield
+        finally:
+            with self._lock:
+                if self._writing[pk] == 1:
+                    del self._writing[pk]
+                else:
+                    self._writing[pk] -= 1
+            self.invalidate(pk)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+
+_backend = _load_backend(settings.ENTITY_CACHE_BACKEND)
+project_cache = EntityCache("project", ProjectModel, ProjectResponse, _backend)
+employee_cache = EntityCache("employee", EmployeeModel, EmployeeResponse, _backend)
+
+
+def entity_cache_stats() -> dict:
+    return {
+        "backend": type(_backend).__name__ if _backend is not None else "off",
+        "entities": {cache.name: cache.stats() for cache in (project_cache, employee_cache)},
+    }
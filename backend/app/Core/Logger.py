@@ -1,29 +1,117 @@
+import atexit
+import contextvars
 import logging
+import logging.handlers
+import queue
+import random
+
+from backend.app.Core.Config import config as settings
+
+# Per-request fields. The middleware installs a fresh dict per request; it is
+# mutated in place (e.g. by get_current_user) so that updates made in
+# threadpool workers are visible to the rest of the request.
+log_context = contextvars.ContextVar("log_context", default=None)
+LOG_CONTEXT_FIELDS = ("request_id", "request_path", "emp_id")
+
+
+def bind_log_context(**fields):
+    """Set structured fields on the current request's log context."""
+    ctx = log_context.get()
+    if ctx is not None:
+        ctx.update(fields)
+
+LOG_FORMAT = (
+    '%(asctime)s - %(name)s - %(levelname)s - '
+    '[req=%(request_id)s path=%(request_path)s emp=%(emp_id)s] %(message)s'
+)
+
+_listener = None
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full."""
+
+    dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class RequestContextFilter(logging.Filter):
+    """Copy the current request's context variables onto each record."""
+
+    def filter(self, record):
+        ctx = log_context.get() or {}
+        for field in LOG_CONTEXT_FIELDS:
+            setattr(record, field, ctx.get(field, "-"))
+        return True
+
+
+class DebugSamplingFilter(logging.Filter):
+    """Keep only a `rate` fraction of DEBUG records; other levels always pass."""
+
+    def __init__(self, rate: float = 1.0):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG or self.rate >= 1.0:
+            return True
+        return random.random() < self.rate
+
 
 def setup_logging():
+    """
+    Configure the root logger once and return a module logger.
+
+    Request threads only put records on an in-memory queue; a background
+    QueueListener does the actual (blocking) console I/O.
+    """
+    global _listener
     # Only setup if not already setup
-    if logging.getLogger().hasHandlers():
+    if _listener is not None or logging.getLogger().hasHandlers():
         return logging.getLogger(__name__)
-    
-    # Configure logging
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            # Console handler only
-            logging.StreamHandler()
-        ]
-    )
-
-    # Set console handler to DEBUG level to show all log levels
-    console_handler = logging.getLogger().handlers[0]
-    console_handler.setLevel(logging.DEBUG)
+
+    level = logging.getLevelName(settings.LOG_LEVEL.upper())
+    if not isinstance(level, int):
+        level = logging.INFO
+
+    # Console handler, driven by the listener thread
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+    queue_handler = DroppingQueueHandler(log_queue)
+    # Filters run in the calling thread, before the record is enqueued
+    queue_handler.addFilter(RequestContextFilter())
+    if settings.LOG_DEBUG_SAMPLE_RATE < 1.0:
+        queue_handler.addFilter(DebugSamplingFilter(settings.LOG_DEBUG_SAMPLE_RATE))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
 
     # Create logger instance
     logger = logging.getLogger(__name__)
 
     return logger
 
+
+def stop_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 # Example usage
 if __name__ == "__main__":
     logger = setup_logging()
@@ -31,4 +119,4 @@ if __name__ == "__main__":
     logger.info("This is an info message")
     logger.warning("This is a warning message")
     logger.error("This is an error message")
-    logger.critical("This is a critical message")
\ No newline at end of file
+    logger.critical("This is a critical message")
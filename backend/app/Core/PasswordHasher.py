@@ -0,0 +1,161 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import List, Optional
+
+import bcrypt
+from fastapi import HTTPException, status
+
+from backend.app.Core.Config import config as settings
+
+
+# Worker functions live at module level so the process pool can pickle them.
+# Keep this module light on imports: every worker process re-imports it.
+def _hashpw(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+
+
+def _checkpw(plain_password: str, hashed_password: str) -> bool:
+    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+def hash_rounds(hashed_password: str) -> int:
+    """Cost factor of a bcrypt hash ("$2b$12$..." -> 12)."""
+    return int(hashed_password.split('$')[2])
+
+
+def calibrate_rounds(target_ms: float, samples: int = 3) -> dict:
+    """
+    Time bcrypt on this host and propose the highest cost whose hash time
+    stays within `target_ms`. Each extra round doubles the work, so the time
+    for other costs is extrapolated from a measurement at a cheap cost.
+    """
+    base_rounds = 10
+    start = time.perf_counter()
+    for _ in range(samples):
+        _hashpw("calibration-password", base_rounds)
+    base_ms = (time.perf_counter() - start) * 1000 / samples
+
+    estimates = {rounds: base_ms * 2 ** (rounds - base_rounds) for rounds in range(4, 18)}
+    fitting = [rounds for rounds, ms in estimates.items() if ms <= target_ms]
+    return {
+        "proposed_rounds": max(fitting) if fitting else 4,
+        "measured_ms_at_10": base_ms,
+        "estimates_ms": estimates,
+    }
+
+
+class HashingQueueFullError(HTTPException):
+    """Raised when too many password hashes are already queued or running."""
+
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, please retry shortly",
+            headers={"Retry-After": "1"},
+        )
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt either inline or in a bounded process pool.
+
+    In "process" mode at most `queue_size` calls may be queued or running at
+    once; anything beyond that is rejected immediately with a 503 instead of
+    piling up behind the pool and pinning request threads.
+    """
+
+    def __init__(self, backend: str = "process", workers: int = 0, queue_size: int = 16, rounds: int = 12):
+        if backend not in ("inline", "process"):
+            raise ValueError(f"Unknown password hash backend: {backend}")
+        self.backend = backend
+        self.rounds = rounds
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self._slots = threading.BoundedSemaphore(queue_size)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    # spawn avoids forking a process that already runs threads
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._pool
+
+    def _submit(self, fn, *args, block: bool = False) -> Future:
+        if not self._slots.acquire(blocking=block):
+            raise HashingQueueFullError()
+        try:
+            future = self._get_pool().submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    # --- sync entry points (for def handlers running in the threadpool) ---
+    def hash(self, password: str) -> str:
+        if self.backend == "inline":
+            return _hashpw(password, self.rounds)
+        return self._submit(_hashpw, password, self.rounds).result()
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        if self.backend == "inline":
+            return _checkpw(plain_password, hashed_password)
+        return self._submit(_checkpw, plain_password, hashed_password).result()
+
+    def hash_many(self, passwords: List[str]) -> List[str]:
+        """
+        Hash a batch across the worker pool, preserving order. Waits for free
+        slots instead of failing fast, but never holds more than `workers` of
+        them so interactive logins keep getting through.
+        """
+        if self.backend == "inline":
+            return [_hashpw(password, self.rounds) for password in passwords]
+        window = max(1, min(self.workers, self.queue_size // 2))
+        hashed = []
+        for start in range(0, len(passwords), window):
+            futures = [self._submit(_hashpw, password, self.rounds, block=True)
+                       for password in passwords[start:start + window]]
+            hashed.extend(future.result() for future in futures)
+        return hashed
+
+    # --- async entry points (for async def handlers) ---
+    async def hash_async(self, password: str) -> str:
+        if self.backend == "inline":
+            return await asyncio.to_thread(_hashpw, password, self.rounds)
+        return await asyncio.wrap_future(self._submit(_hashpw, password, self.rounds))
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        if self.backend == "inline":
+            return await asyncio.to_thread(_checkpw, plain_password, hashed_password)
+        return await asyncio.wrap_future(self._submit(_checkpw, plain_password, hashed_password))
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """True when a stored hash was made with a different cost than configured."""
+        try:
+            return hash_rounds(hashed_password) != self.rounds
+        except (IndexError, ValueError):
+            return True
+
+    def shutdown(self):
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+
+
+password_hasher = PasswordHasher(
+    backend=settings.PASSWORD_HASH_BACKEND,
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_size=settings.PASSWORD_HASH_QUEUE_SIZE,
+    rounds=settings.PASSWORD_HASH_ROUNDS,
+)
@@ -0,0 +1,127 @@
+import importlib
+from abc import ABC, abstractmethod
+import math
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from backend.app.Core.Config import config as settings
+
+
+class RateLimitBackend(ABC):
+    """
+    Storage for token buckets. Subclass this to share buckets between workers
+    (e.g. on Redis) and point Config.RATE_LIMIT_BACKEND at the class.
+    """
+
+    @abstractmethod
+    def consume(self, key: str, capacity: int, refill_per_sec: float, cost: float = 1.0) -> Tuple[bool, float]:
+        """Take `cost` tokens from the bucket. Returns (allowed, retry_after_seconds)."""
+
+    @abstractmethod
+    def reset(self, key: str):
+        ...
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Per-process buckets stored as key -> [tokens, last_refill_ts].
+
+    A bucket that has been idle long enough to refill completely carries no
+    information, so it is evicted during periodic sweeps.
+    """
+
+    SWEEP_EVERY = 1024
+
+    def __init__(self):
+        self._buckets: Dict[str, List[float]] = {}
+        # key -> time after which the bucket is full again and can be dropped
+        self._idle_after: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._calls = 0
+
+    def consume(self, key: str, capacity: int, refill_per_sec: float, cost: float = 1.0) -> Tuple[bool, float]:
+        now = time.monotonic()
+        with self._lock:
+            self._calls += 1
+            if self._calls % self.SWEEP_EVERY == 0:
+                self._sweep(now)
+
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(capacity), now]
+            else:
+                bucket[0] = min(capacity, bucket[0] + (now - bucket[1]) * refill_per_sec)
+                bucket[1] = now
+
+            if bucket[0] >= cost:
+                bucket[0] -= cost
+                allowed, retry_after = True, 0.0
+            else:
+                allowed, retry_after = False, (cost - bucket[0]) / refill_per_sec
+
+            self._idle_after[key] = now + (capacity - bucket[0]) / refill_per_sec
+            return allowed, retry_after
+
+    def reset(self, key: str):
+        with self._lock:
+            self._buckets.pop(key, None)
+            self._idle_after.pop(key, None)
+
+    def _sweep(self, now: float):
+        expired = [k for k, t in self._idle_after.items() if t <= now]
+        for k in expired:
+            del self._buckets[k]
+            del self._idle_after[k]
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+def _load_backend(name: str) -> RateLimitBackend:
+    if name == "memory":
+        return InMemoryRateLimitBackend()
+    # Dotted path to a RateLimitBackend subclass, e.g. "myapp.limits.RedisBackend"
+    module_name, _, class_name = name.rpartition(".")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+class LoginRateLimiter:
+    """Per-email and per-client-IP login throttling, checked before any bcrypt work."""
+
+    def __init__(self, backend: RateLimitBackend):
+        self.backend = backend
+
+    def check(self, email: str, client_ip: Optional[str]):
+        if not settings.LOGIN_RATE_LIMIT_ENABLED:
+            return
+
+        checks = [(
+            f"login:email:{email.strip().lower()}",
+            settings.LOGIN_RATE_EMAIL_BURST,
+            settings.LOGIN_RATE_EMAIL_PER_MINUTE / 60.0,
+        )]
+        if client_ip:
+            checks.append((
+                f"login:ip:{client_ip}",
+                settings.LOGIN_RATE_IP_BURST,
+                settings.LOGIN_RATE_IP_PER_MINUTE / 60.0,
+            ))
+
+        for key, capacity, rate in checks:
+            allowed, retry_after = self.backend.consume(key, capacity, rate)
+            if not allowed:
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too many login attempts, please try again later",
+                    headers={"Retry-After": str(math.ceil(retry_after))},
+                )
+
+    def reset_email(self, email: str):
+        """Clear the per-email bucket after a successful login."""
+        self.backend.reset(f"login:email:{email.strip().lower()}")
+
+
+login_rate_limiter = LoginRateLimiter(_load_backend(settings.RATE_LIMIT_BACKEND))
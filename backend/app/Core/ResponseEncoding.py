@@ -0,0 +1,220 @@
+import json
+import zlib
+from typing import Callable, Dict, Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.app.Core.Config import config as settings
+
+# Optional codecs: negotiated only when their package is installed
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+COMPRESSIBLE_TYPES = ("application/json", "application/msgpack", "application/x-ndjson", "text/")
+
+ZSTD_LEVEL = 3
+BROTLI_QUALITY = 4  # higher qualities cost far more CPU for little gain on JSON
+
+
+class _BrotliStream:
+    """brotli.Compressor behind the compressobj interface (compress/flush)."""
+
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+def _compressors() -> Dict[str, Callable]:
+    """Content-coding -> factory of a streaming compressor, in server preference order."""
+    codecs = {}
+    if zstandard is not None:
+        codecs["zstd"] = lambda: zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+    if brotli is not None:
+        codecs["br"] = _BrotliStream
+    # wbits=31: zlib stream with a gzip header and trailer
+    codecs["gzip"] = lambda: zlib.compressobj(settings.RESPONSE_COMPRESSION_LEVEL, zlib.DEFLATED, 31)
+    return codecs
+
+
+COMPRESSORS = _compressors()
+
+
+def _qvalues(header: str) -> Dict[str, float]:
+    """Parse an Accept / Accept-Encoding header into {token: q}."""
+    values = {}
+    for part in header.split(","):
+        token, *params = [p.strip() for p in part.split(";")]
+        if not token:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        values[token.lower()] = q
+    return values
+
+
+def negotiate_coding(accept_encoding: str) -> Optional[str]:
+    """Best content-coding we can produce for this Accept-Encoding (client q first, then our order)."""
+    if not accept_encoding or not settings.RESPONSE_COMPRESSION_MIN_BYTES:
+        return None
+    accepted = _qvalues(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    best, best_q = None, 0.0
+    for coding in COMPRESSORS:
+        q = accepted.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def wants_msgpack(headers) -> bool:
+    """True when the client prefers msgpack to JSON (and we can produce it)."""
+    accept = headers.get("accept")
+    if msgpack is None or not settings.RESPONSE_MSGPACK_ENABLED or not accept or "msgpack" not in accept:
+        return False
+    accepted = _qvalues(accept)
+    q_msgpack = max(accepted.get(t, 0.0) for t in MSGPACK_MEDIA_TYPES)
+    q_json = accepted.get("application/json", accepted.get("application/*", accepted.get("*/*", 0.0)))
+    return q_msgpack > 0 and q_msgpack >= q_json
+
+
+def _add_vary(headers: MutableHeaders, value: str):
+    vary = headers.get("vary")
+    headers["vary"] = f"{vary}, {value}" if vary else value
+
+
+def _encodable(status: int, headers: MutableHeaders) -> bool:
+    return status >= 200 and status not in (204, 304) and "content-encoding" not in headers
+
+
+async def _run(fn: Callable, size: int, *args):
+    """Encode off the event loop once the payload is big enough to be worth a thread hop."""
+    if size >= settings.RESPONSE_ENCODE_THREAD_MIN_BYTES:
+        return await anyio.to_thread.run_sync(fn, *args)
+    return fn(*args)
+
+
+class ResponseEncodingMiddleware:
+    """
+    Negotiates the response representation:
+    - JSON bodies become msgpack (same shape; dates stay ISO strings) when the
+      request's Accept prefers application/msgpack.
+    - JSON, msgpack, NDJSON and text bodies of at least
+      RESPONSE_COMPRESSION_MIN_BYTES are compressed with the best of zstd, br
+      and gzip the client accepts. Streamed bodies are compressed chunk by chunk.
+    Requests asking for neither pass straight through.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        coding = negotiate_coding(headers.get("accept-encoding", ""))
+        to_msgpack = wants_msgpack(headers)
+        if coding is None and not to_msgpack:
+            await self.app(scope, receive, send)
+            return
+        await _EncodingResponder(self.app, send, coding, to_msgpack)(scope, receive)
+
+
+class _EncodingResponder:
+    def __init__(self, app: ASGIApp, send: Send, coding: Optional[str], to_msgpack: bool):
+        self.app = app
+        self.send = send
+        self.coding = coding
+        self.to_msgpack = to_msgpack
+        self.start: Optional[Message] = None
+        self.compressor = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive):
+        await self.app(scope, receive, self.send_encoded)
+
+    def encode(self, body: bytes, content_type: str) -> Tuple[bytes, str, Optional[str]]:
+        """Whole-body encoding: (body, content type, content-coding applied or None)."""
+        if self.to_msgpack and content_type.startswith("application/json"):
+            body = msgpack.packb(json.loads(body)) if body else body
+            content_type = "application/msgpack"
+        if self.coding is None or len(body) < settings.RESPONSE_COMPRESSION_MIN_BYTES \
+                or not content_type.startswith(COMPRESSIBLE_TYPES):
+            return body, content_type, None
+        compressor = COMPRESSORS[self.coding]()
+        return compressor.compress(body) + compressor.flush(), content_type, self.coding
+
+    async def send_encoded(self, message: Message):
+        if message["type"] == "http.response.start":
+            self.start = message  # held until we have seen the first body chunk
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body, more_body = message.get("body", b""), message.get("more_body", False)
+        if self.start is not None:
+            start, self.start = self.start, None
+            headers = MutableHeaders(scope=start)
+            content_type = headers.get("content-type", "")
+            if not _encodable(start["status"], headers):
+                self.passthrough = True
+                await self.send(start)
+                await self.send(message)
+                return
+
+            if not more_body:
+                encoded, new_type, coding = await _run(self.encode, len(body), body, content_type)
+                if new_type != content_type:
+                    headers["content-type"] = new_type
+                    _add_vary(headers, "Accept")
+                if coding is not None:
+                    headers["content-encoding"] = coding
+                    _add_vary(headers, "Accept-Encoding")
+                if encoded is not body:
+                    headers["content-length"] = str(len(encoded))
+                await self.send(start)
+                await self.send({"type": "http.response.body", "body": encoded})
+                return
+
+            # Streamed body (exports): compress as it goes, never transcode
+            if self.coding is None or not content_type.startswith(COMPRESSIBLE_TYPES):
+                self.passthrough = True
+                await self.send(start)
+                await self.send(message)
+                return
+            self.compressor = COMPRESSORS[self.coding]()
+            headers["content-encoding"] = self.coding
+            _add_vary(headers, "Accept-Encoding")
+            del headers["content-length"]
+            await self.send(start)
+
+        data = await _run(self.compressor.compress, len(body), body)
+        if not more_body:
+            data += self.compressor.flush()
+        if data or not more_body:
+            await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
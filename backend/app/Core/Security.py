@@ -5,17 +5,39 @@ from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-from backend.app.DataBase import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.app.DataBase import get_db, get_async_db
+from backend.app.Core.BatchContext import batch_principal
 from backend.app.Model.EmployeeModel import EmployeeModel
-import bcrypt
 from backend.app.Utils.JwtPayload import JwtPayload
+from backend.app.Core.PasswordHasher import password_hasher
+from backend.app.Utils.Principal import Principal
+from backend.app.Utils.TTLCache import TTLCache
+from backend.app.Core.Logger import bind_log_context
+import hashlib
+import logging
+from typing import List
 # import re
 
+logger = logging.getLogger(__name__)
+
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return password_hasher.hash(password)
+
+def hash_passwords(passwords: List[str]) -> List[str]:
+    return password_hasher.hash_many(passwords)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+    return password_hasher.verify(plain_password, hashed_password)
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    return password_hasher.needs_rehash(hashed_password)
+
+async def hash_password_async(password: str) -> str:
+    return await password_hasher.hash_async(password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.verify_async(plain_password, hashed_password)
 
 
 # --- ACCESS TOKEN ---
@@ -37,9 +59,29 @@ def create_refresh_token(data: dict):
 
 
 # --- VERIFY FUNCTIONS ---
+# sha256(token) -> verified payload; entries expire at the token's own "exp"
+access_token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_MAX_SIZE)
+
+def decode_access_token(token: str) -> dict:
+    """
+    Verify and decode an access token, skipping the signature check for tokens
+    already verified. Raises JWTError for invalid or expired tokens.
+    """
+    digest = hashlib.sha256(token.encode('utf-8')).digest()
+    payload = access_token_cache.get(digest)
+    if payload is not None:
+        return payload
+
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    exp = payload.get("exp")
+    if exp is not None:
+        access_token_cache.set(digest, payload, expires_at=float(exp))
+    return payload
+
+
 def verify_access_token(token: str):
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = decode_access_token(token)
         return payload
     except JWTError:
         return None
@@ -55,48 +97,90 @@ def verify_refresh_token(token: str):
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-):
-    credentials_exception = HTTPException(
+# emp_id -> Principal, so authenticated requests don't need a users lookup each time
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+def invalidate_principal(emp_id: int):
+    """Drop a cached principal; call after committing changes to that employee."""
+    principal_cache.invalidate(int(emp_id))
+
+def _credentials_exception():
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    try:
-        print("\n\n DECODING TOKEN RECEIVED FROM FRONTEND...\n", token, "\n\n")
-
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
-        )
 
-        print("\nPAYLOAD:\n", payload, "\n\n")
-        # print("\nemp_ID:\n", payload.get("sub").get("emp_id"), "\n\n")
-
-        # emp_id = dict(payload.get("sub")).get("emp_id")
-        # emp_id = int(payload.get("sub").get("emp_id"))
-        # emp_id = re.search(r"'emp_id'\s*:\s*'(\d+)'", str(payload.get("sub")))
+def _emp_id_from_token(token: str) -> int:
+    try:
+        payload = decode_access_token(token)
         emp_id = payload.get("emp_id")
-        print("\nEMP_ID MATCH OBJECT:\n", emp_id, "\n\n")
 
         if emp_id is None:
-            raise credentials_exception
+            raise _credentials_exception()
 
     except JWTError as e:
-        print(f"Error decoding token: {e}")
-        raise credentials_exception
+        logger.debug("Error decoding token: %s", e)
+        raise _credentials_exception()
+
+    return int(emp_id)
+
+
+def _authenticated(principal: Principal) -> Principal:
+    if not principal.is_active:
+        raise _credentials_exception()
+
+    bind_log_context(emp_id=principal.emp_id)
+    logger.debug("Authenticated emp_id=%s role=%s", principal.emp_id, principal.role.value)
+    return principal
+
+
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+):
+    principal = batch_principal.get()
+    if principal is not None:
+        return principal  # /api/batch sub-request, authenticated once by the batch
 
-    # Query the database to ensure user exists and is active
-    user = db.query(EmployeeModel).filter(EmployeeModel.emp_id == int(emp_id)).first()
+    emp_id = _emp_id_from_token(token)
 
-    if user is None or not user.is_active:
-        raise credentials_exception
+    # Ensure user exists and is active, hitting the database only on a cache miss
+    principal = principal_cache.get(emp_id)
+    if principal is None:
+        user = db.query(EmployeeModel).filter(EmployeeModel.emp_id == emp_id).first()
+        if user is None:
+            raise _credentials_exception()
+        principal = Principal.from_model(user)
+        principal_cache.set(emp_id, principal)
 
-    return user 
+    return _authenticated(principal)
+
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """get_current_user for async routes; same cache, AsyncSession on a miss."""
+    principal = batch_principal.get()
+    if principal is not None:
+        return principal
+
+    emp_id = _emp_id_from_token(token)
+
+    principal = principal_cache.get(emp_id)
+    if principal is None:
+        user = await db.get(EmployeeModel, emp_id)
+        if user is None:
+            raise _credentials_exception()
+        principal = Principal.from_model(user)
+        principal_cache.set(emp_id, principal)
+
+    return _authenticated(principal)
 
 
 
@@ -0,0 +1,213 @@
+import threading
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.app.Core.Config import config as settings
+from backend.app.Model.EmployeeModel import EmployeeModel
+from backend.app.Model.Role import RoleEnum
+from backend.app.Utils.SkillIndex import parse_skills
+
+NO_EXPERIENCE = -1  # stored for NULL experience; fails any min_experience filter
+
+
+class _Snapshot:
+    """
+    Column arrays for every employee, one row each. Skills are bitsets packed
+    into uint64 words: bit i of a row is set when the employee has vocab skill i.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.vocab: Dict[str, int] = {}
+        self.depts: Dict[str, int] = {}
+        self.rows: Dict[int, int] = {}  # emp_id -> row
+        self.size = 0
+        self.emp_ids = np.zeros(capacity, dtype=np.int64)
+        self.dept_codes = np.full(capacity, -1, dtype=np.int32)
+        self.experience = np.full(capacity, NO_EXPERIENCE, dtype=np.int32)
+        self.searchable = np.zeros(capacity, dtype=bool)
+        self.bits = np.zeros((capacity, 1), dtype=np.uint64)
+
+    @classmethod
+    def build(cls, records: List[tuple]) -> "_Snapshot":
+        """Bulk-load (emp_id, dept, experience, skills, searchable) records with vectorized writes."""
+        snap = cls(capacity=max(len(records), 1024))
+        rows, bits = [], []
+        for row, (emp_id, dept, experience, skills, searchable) in enumerate(records):
+            snap.rows[emp_id] = row
+            snap.emp_ids[row] = emp_id
+            snap.dept_codes[row] = snap.depts.setdefault(dept, len(snap.depts)) if dept is not None else -1
+            snap.experience[row] = NO_EXPERIENCE if experience is None else experience
+            snap.searchable[row] = searchable
+            for name in parse_skills(skills):
+                rows.append(row)
+                bits.append(snap.vocab.setdefault(name, len(snap.vocab)))
+        snap.size = len(records)
+        snap.bits = np.zeros((len(snap.emp_ids), max(1, -(-len(snap.vocab) // 64))), dtype=np.uint64)
+        if bits:
+            bits = np.asarray(bits, dtype=np.uint64)
+            np.bitwise_or.at(snap.bits, (np.asarray(rows), (bits // 64).astype(np.intp)), np.uint64(1) << (bits % 64))
+        return snap
+
+    def _grow_rows(self):
+        extra = len(self.emp_ids)  # double the capacity
+        self.emp_ids = np.concatenate([self.emp_ids, np.zeros(extra, np.int64)])
+        self.dept_codes = np.concatenate([self.dept_codes, np.full(extra, -1, np.int32)])
+        self.experience = np.concatenate([self.experience, np.full(extra, NO_EXPERIENCE, np.int32)])
+        self.searchable = np.concatenate([self.searchable, np.zeros(extra, bool)])
+        self.bits = np.concatenate([self.bits, np.zeros((extra, self.bits.shape[1]), np.uint64)])
+
+    def _skill_bit(self, name: str) -> int:
+        bit = self.vocab.setdefault(name, len(self.vocab))
+        if bit // 64 >= self.bits.shape[1]:
+            self.bits = np.concatenate([self.bits, np.zeros_like(self.bits)], axis=1)
+        return bit
+
+    def set(self, emp_id: int, dept: Optional[str], experience: Optional[int], skills: Optional[str], searchable: bool):
+        row = self.rows.get(emp_id)
+        if row is None:
+            if self.size == len(self.emp_ids):
+                self._grow_rows()
+            row = self.rows[emp_id] = self.size
+            self.size += 1
+        self.emp_ids[row] = emp_id
+        self.dept_codes[row] = self.depts.setdefault(dept, len(self.depts)) if dept is not None else -1
+        self.experience[row] = NO_EXPERIENCE if experience is None else experience
+        self.searchable[row] = searchable
+        skill_bits = [self._skill_bit(name) for name in parse_skills(skills)]
+        words = np.zeros(self.bits.shape[1], dtype=np.uint64)
+        for bit in skill_bits:
+            words[bit // 64] |= np.uint64(1) << np.uint64(bit % 64)
+        self.bits[row] = words
+
+    def term_mask(self, term: str) -> np.ndarray:
+        """Bits of every vocab skill containing `term` (same partial match as the SQL search)."""
+        mask = np.zeros(self.bits.shape[1], dtype=np.uint64)
+        for name, bit in self.vocab.items():
+            if term in name:
+                mask[bit // 64] |= np.uint64(1) << np.uint64(bit % 64)
+        return mask
+
+
+class SkillMatcher:
+    """
+    In-process ranking of employees against a set of required skills.
+
+    The snapshot is loaded from the database on first use, patched by employee
+    writes in this process and fully reloaded after `max_age_seconds` to pick
+    up writes made by other workers.
+    """
+
+    def __init__(self, max_age_seconds: float = 300):
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._snap: Optional[_Snapshot] = None
+        self._loaded_at = 0.0
+        self._reloading = False
+        self._pending: List[tuple] = []  # writes seen while a reload was reading the table
+
+    def _load(self, db: Session):
+        with self._lock:
+            self._reloading = True
+            self._pending = []
+        try:
+            rows = db.execute(
+                select(EmployeeModel.emp_id, EmployeeModel.dept, EmployeeModel.experience,
+                       EmployeeModel.skills, EmployeeModel.is_active, EmployeeModel.role),
+                execution_options={"yield_per": 5000},
+            )
+            snap = _Snapshot.build([
+                (emp_id, dept, experience, skills, bool(is_active) and role == RoleEnum.employee)
+                for emp_id, dept, experience, skills, is_active, role in rows
+            ])
+            with self._lock:
+                for args in self._pending:
+                    snap.set(*args)
+                self._snap = snap
+                self._loaded_at = time.monotonic()
+        finally:
+            with self._lock:
+                self._reloading = False
+                self._pending = []
+
+    def _is_fresh(self) -> bool:
+        return self._snap is not None and time.monotonic() - self._loaded_at <= self.max_age_seconds
+
+    def ensure_fresh(self, db: Session):
+        if self._is_fresh():
+            return
+        with self._load_lock:
+            if not self._is_fresh():  # another request may have reloaded while we waited
+                self._load(db)
+
+    def upsert(self, emp_id: int, dept: Optional[str], experience: Optional[int], skills: Optional[str],
+               is_active: bool = True, role: RoleEnum = RoleEnum.employee):
+        """Apply one committed employee write to the snapshot."""
+        args = (emp_id, dept, experience, skills, bool(is_active) and role == RoleEnum.employee)
+        with self._lock:
+            if self._reloading:
+                self._pending.append(args)
+            if self._snap is not None:
+                self._snap.set(*args)
+
+    def invalidate(self):
+        with self._lock:
+            self._snap = None
+
+    def top_k(self, terms: List[str], k: int, dept: Optional[str] = None, min_experience: Optional[int] = None) -> List[dict]:
+        """
+        Best `k` searchable employees by skill coverage (share of `terms` matched),
+        then experience, then emp_id. Employees matching no term are left out.
+        """
+        if not terms or k <= 0:
+            return []
+        with self._lock:
+            snap = self._snap
+            if snap is None:
+                return []
+            n = snap.size
+            candidates = snap.searchable[:n].copy()
+            if dept is not None:
+                code = snap.depts.get(dept)
+                if code is None:
+                    return []
+                candidates &= snap.dept_codes[:n] == code
+            if min_experience is not None:
+                candidates &= snap.experience[:n] >= min_experience
+            idx = np.flatnonzero(candidates)
+
+            # covered[t, i]: candidate i has a skill containing terms[t]
+            covered = np.zeros((len(terms), len(idx)), dtype=bool)
+            for t, term in enumerate(terms):
+                mask = snap.term_mask(term)
+                # Only the words holding one of the term's skills need testing
+                for word in np.flatnonzero(mask):
+                    covered[t] |= (snap.bits[idx, word] & mask[word]) != 0
+            coverage = covered.sum(axis=0)
+
+            keep = coverage > 0
+            idx, coverage, covered = idx[keep], coverage[keep], covered[:, keep]
+            experience = np.maximum(snap.experience[idx], 0).astype(np.int64)
+            if len(idx) > k:
+                # Cheap preselect: everything tied with or above the k-th best key
+                key = coverage.astype(np.int64) * (int(experience.max()) + 1) + experience
+                kth = np.partition(key, len(key) - k)[len(key) - k]
+                sel = key >= kth
+                idx, coverage, covered, experience = idx[sel], coverage[sel], covered[:, sel], experience[sel]
+            order = np.lexsort((snap.emp_ids[idx], -experience, -coverage))[:k]
+
+            return [
+                {
+                    "emp_id": int(snap.emp_ids[idx[i]]),
+                    "score": round(float(coverage[i]) / len(terms), 4),
+                    "matched_skills": [term for t, term in enumerate(terms) if covered[t, i]],
+                }
+                for i in order
+            ]
+
+
+skill_matcher = SkillMatcher(max_age_seconds=settings.SKILL_MATCHER_MAX_AGE_SECONDS)
@@ -1,14 +1,166 @@
 from .Core.Config import config as settings
-from sqlalchemy import create_engine
+from .Core.BatchContext import batch_lane
+import threading
+import time
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait to check out a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._wait_lock = threading.Lock()
+        self.checkouts = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = (time.perf_counter() - start) * 1000
+            with self._wait_lock:
+                self.checkouts += 1
+                self.total_wait_ms += waited
+                self.max_wait_ms = max(self.max_wait_ms, waited)
+
+
+# --- per-dialect connect hooks ---
+def _sqlite_on_connect(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    # Negative cache_size is in KiB rather than pages
+    cursor.execute(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KB)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    cursor.close()
+
+
+def _postgresql_on_connect(dbapi_connection, connection_record):
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"SET statement_timeout = {int(settings.DB_STATEMENT_TIMEOUT_MS)}")
+        cursor.close()
+        dbapi_connection.commit()
+
+
+CONNECT_HOOKS = {
+    "sqlite": _sqlite_on_connect,
+    "postgresql": _postgresql_on_connect,
+}
+
+
+def build_engine_kwargs(url) -> dict:
+    url = make_url(url)
+    kwargs = {"echo": settings.DB_ECHO}
+
+    if url.get_backend_name() == "sqlite":
+        # FastAPI hands sessions between threadpool workers
+        kwargs["connect_args"] = {"check_same_thread": False}
+        # In-memory databases live in a single connection; leave SQLAlchemy's pool alone
+        if url.database in (None, "", ":memory:"):
+            return kwargs
+
+    kwargs.update(
+        poolclass=TimedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+    return kwargs
+
+
+engine=create_engine(settings.DataBase_URL, **build_engine_kwargs(settings.DataBase_URL))
+_connect_hook = CONNECT_HOOKS.get(engine.dialect.name)
+if _connect_hook is not None:
+    event.listen(engine, "connect", _connect_hook)
 
-engine=create_engine(settings.DataBase_URL)
 SessionLocal=sessionmaker(autocommit=False,autoflush=False,bind=engine)
 Base=declarative_base()
 def get_db():
+    lane = batch_lane.get()
+    if lane is not None:
+        # /api/batch sub-request: share the lane's session, the batch closes it
+        if lane.session is None:
+            lane.session = SessionLocal()
+        yield lane.session
+        return
     db=SessionLocal()
     try:
         yield db
     finally:
         db.close()
-        
+
+
+# --- async engine (used when Config.DB_ASYNC_MODE is on) ---
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+
+def async_database_url() -> str:
+    """DataBase_ASYNC_URL if set, otherwise DataBase_URL with the dialect's async driver."""
+    if settings.DataBase_ASYNC_URL:
+        return settings.DataBase_ASYNC_URL
+    url = make_url(settings.DataBase_URL)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise RuntimeError(f"No async driver known for {url.get_backend_name()}; set DataBase_ASYNC_URL")
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.DB_ASYNC_MODE:
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    _async_url = async_database_url()
+    _async_kwargs = build_engine_kwargs(_async_url)
+    # Async engines need the asyncio-adapted pool SQLAlchemy picks by default
+    _async_kwargs.pop("poolclass", None)
+    async_engine = create_async_engine(_async_url, **_async_kwargs)
+    if _connect_hook is not None:
+        event.listen(async_engine.sync_engine, "connect", _connect_hook)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db():
+    lane = batch_lane.get()
+    if lane is not None:
+        if lane.async_session is None:
+            lane.async_session = AsyncSessionLocal()
+        yield lane.async_session
+        return
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_pool_stats() -> dict:
+    """Connection pool occupancy and checkout wait times for monitoring."""
+    pool = engine.pool
+    stats = {"pool_class": type(pool).__name__, "status": pool.status()}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    if isinstance(pool, TimedQueuePool):
+        stats.update(
+            checkouts=pool.checkouts,
+            avg_wait_ms=pool.total_wait_ms / pool.checkouts if pool.checkouts else 0.0,
+            max_wait_ms=pool.max_wait_ms,
+        )
+    return stats
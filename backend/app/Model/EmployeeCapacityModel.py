@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, ForeignKey, Index
+from backend.app.DataBase import Base
+
+class EmployeeCapacityModel(Base):
+    """
+    Per-employee hour counters kept in step by assignment writes:
+    committed = allotted hours on open assignments, available = billable - committed.
+    """
+    __tablename__ = "employee_capacity"
+
+    emp_id = Column(Integer, ForeignKey("employees.emp_id", ondelete="CASCADE"), primary_key=True)
+    committed_hours = Column(Integer, nullable=False, default=0)
+    available_hours = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # Capacity filters and "most available first" listings
+        Index("ix_employee_capacity_available", "available_hours", "emp_id"),
+        Index("ix_employee_capacity_committed", "committed_hours", "emp_id"),
+    )
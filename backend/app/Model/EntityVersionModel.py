@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, String
+from backend.app.DataBase import Base
+
+class EntityVersionModel(Base):
+    """
+    One counter per tracked table, bumped by every transaction that writes to it.
+    ETags of the read endpoints are derived from these.
+    """
+    __tablename__ = "entity_versions"
+
+    name = Column(String, primary_key=True)  # table name
+    version = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, Date, ForeignKey
+from backend.app.DataBase import Base
+
+class ProjectDailyRollupModel(Base):
+    """
+    Per-project, per-day (UTC) assignment activity kept in step by assignment writes.
+    Assignments count on the day they were assigned and, once completed, on the
+    day they were completed; the burn-down series is a running sum of these.
+    """
+    __tablename__ = "project_daily_rollups"
+
+    project_id = Column(Integer, ForeignKey("projects.project_id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+
+    # Assigned on this day
+    assignments_added = Column(Integer, nullable=False, default=0)
+    allotted_hours = Column(Integer, nullable=False, default=0)
+    # Completed on this day
+    assignments_completed = Column(Integer, nullable=False, default=0)
+    completed_hours = Column(Integer, nullable=False, default=0)  # allotted hours burned
+    worked_hours = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer
+from backend.app.DataBase import Base
+
+class ProjectStatsModel(Base):
+    """Single-row running totals over projects, kept in step by project writes."""
+    __tablename__ = "project_stats"
+
+    id = Column(Integer, primary_key=True, default=1)
+
+    total_projects = Column(Integer, nullable=False, default=0)
+    active_projects = Column(Integer, nullable=False, default=0)
+    completed_projects = Column(Integer, nullable=False, default=0)
+    total_expected_hours = Column(Integer, nullable=False, default=0)
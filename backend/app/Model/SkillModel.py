@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Index, DDL, event
+from backend.app.DataBase import Base
+
+class SkillModel(Base):
+    """Skill dictionary: one row per normalized (trimmed, lower-case) skill name."""
+    __tablename__ = "skills"
+
+    skill_id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, index=True, nullable=False)
+
+class EmployeeSkillModel(Base):
+    """Which employees have which skills; derived from EmployeeModel.skills."""
+    __tablename__ = "employee_skills"
+
+    emp_id = Column(Integer, ForeignKey("employees.emp_id", ondelete="CASCADE"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.skill_id", ondelete="CASCADE"), primary_key=True)
+
+    __table_args__ = (
+        # Search goes skill -> employees; the primary key covers employee -> skills
+        Index("ix_employee_skills_skill_emp", "skill_id", "emp_id"),
+    )
+
+# Partial skill matches are LIKE '%term%' over the dictionary; on PostgreSQL a
+# trigram index serves those, elsewhere the (small) dictionary is scanned
+event.listen(
+    SkillModel.__table__,
+    "after_create",
+    DDL(
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm; "
+        "CREATE INDEX IF NOT EXISTS ix_skills_name_trgm ON skills USING gin (name gin_trgm_ops)"
+    ).execute_if(dialect="postgresql"),
+)
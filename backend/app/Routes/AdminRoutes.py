@@ -1,6 +1,11 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from backend.app.Core.Config import config as settings
+from backend.app.Utils.Pagination import send_page
+from backend.app.Utils.ETags import conditional_get
+from backend.app.Utils.Fields import Fields, sparse_fields
+from backend.app.Utils.Serialization import json_item
 from backend.app.DataBase import get_db
 from backend.app.Core.Security import get_current_user
 from backend.app.Controllers.AdminController import (
@@ -17,7 +22,13 @@ from backend.app.Controllers.AdminController import (
 )
 from backend.app.Model.EmployeeModel import EmployeeModel
 
-router = APIRouter(prefix="/api/admin/projects", tags=["Admin"])
+router = APIRouter(
+    prefix="/api/admin/projects", tags=["Admin"],
+    # GETs carry ETags; unchanged data revalidates with a 304
+    dependencies=[Depends(conditional_get("projects"))],
+)
+
+PROJECT_FIELDS = sparse_fields(ProjectResponse)
 
 
 # Project endpoints
@@ -32,12 +43,15 @@ def create_project_endpoint(
 
 @router.get("", response_model=List[ProjectResponse])
 def list_projects_endpoint(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    response: Response,
+    skip: int = Query(0, ge=0, description="Number of records to skip (prefer cursor)"),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's X-Next-Cursor header"),
+    fields: Fields = Depends(PROJECT_FIELDS),
     db: Session = Depends(get_db),
     current_user: EmployeeModel = Depends(get_current_user),
 ):
-    return list_projects(db, skip, limit, current_user)
+    return send_page(response, list_projects(db, skip, limit, current_user, cursor, fields))
 
 
 @router.get("/stats", response_model=ProjectStatsResponse)
@@ -51,10 +65,12 @@ def get_project_stats_endpoint(
 @router.get("/{project_id}", response_model=ProjectResponse)
 def get_project_endpoint(
     project_id: int,
+    response: Response,
+    fields: Fields = Depends(PROJECT_FIELDS),
     db: Session = Depends(get_db),
     current_user: EmployeeModel = Depends(get_current_user),
 ):
-    return get_project(db, project_id, current_user)
+    return json_item(get_project(db, project_id, current_user, fields), response)
 
 
 @router.put("/{project_id}", response_model=ProjectResponse)
@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import date
+from backend.app.DataBase import get_db
+from backend.app.Core.Security import get_current_user
+from backend.app.Controllers.AnalyticsController import utilization_report, project_burndown, GROUPINGS, SORT_COLUMNS
+from backend.app.View.AnalyticsSchemas import UtilizationReport, ProjectBurndown
+from backend.app.Model.EmployeeModel import EmployeeModel
+
+router = APIRouter(prefix="/api/analytics", tags=["Analytics"])
+
+
+@router.get("/utilization", response_model=UtilizationReport)
+def get_utilization(
+    group_by: str = Query("employee", pattern=f"^({'|'.join(GROUPINGS)})$", description="employee, department, project or client"),
+    sort: str = Query("key", pattern=f"^({'|'.join(SORT_COLUMNS)})$", description="Column to sort rows by"),
+    descending: bool = Query(False, description="Sort descending (e.g. worst overruns first)"),
+    limit: Optional[int] = Query(None, ge=1, description="Only the first N rows after sorting"),
+    db: Session = Depends(get_db),
+    current_user: EmployeeModel = Depends(get_current_user)
+):
+    """
+    Allotted vs worked hours, utilization, load and overrun ratios per group.
+    Available to: Manager (own department), Admin
+    """
+    return utilization_report(db, group_by, current_user, sort, descending, limit)
+
+
+@router.get("/projects/{project_id}/burndown", response_model=ProjectBurndown)
+def get_project_burndown(
+    project_id: int,
+    start: Optional[date] = Query(None, description="First day (UTC); defaults to the project's first activity"),
+    end: Optional[date] = Query(None, description="Last day (UTC); defaults to today"),
+    db: Session = Depends(get_db),
+    current_user: EmployeeModel = Depends(get_current_user)
+):
+    """
+    Daily hours allotted, completed and worked on a project, with running totals.
+    Available to: Manager, Admin
+    """
+    return project_burndown(db, project_id, current_user, start, end)
@@ -0,0 +1,76 @@
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from backend.app.Core.Config import config as settings
+from backend.app.Utils.Pagination import send_page
+from backend.app.Utils.ETags import conditional_get
+from backend.app.Utils.Fields import Fields, sparse_fields
+from backend.app.DataBase import get_async_db
+from backend.app.Core.Security import get_current_user_async
+from backend.app.Controllers.AssignProjectController import (
+    create_assignment_async, list_assignments_async, update_assignment_async, delete_assignment_async,
+    batch_create_assignments_async
+)
+from backend.app.View.AssignmentSchemas import (
+    AssignmentCreate, AssignmentUpdate, AssignmentResponse,
+    AssignmentBatchCreate, AssignmentBatchResponse,
+)
+from backend.app.Model.EmployeeModel import EmployeeModel
+
+# Same paths as AssignProjectRoutes, served by async handlers (Config.DB_ASYNC_MODE)
+router = APIRouter(
+    prefix="/api/assignments", tags=["Assignments"],
+    # GETs carry ETags; unchanged data revalidates with a 304
+    dependencies=[Depends(conditional_get("assigned_projects", "employees", "projects", user_dependency=get_current_user_async))],
+)
+
+@router.post("", response_model=AssignmentResponse)
+async def create_assignment_endpoint(
+    assignment: AssignmentCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: EmployeeModel = Depends(get_current_user_async)
+):
+    return await create_assignment_async(db, assignment, current_user)
+
+@router.post("/batch", response_model=AssignmentBatchResponse)
+async def batch_create_assignments_endpoint(
+    batch: AssignmentBatchCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: EmployeeModel = Depends(get_current_user_async)
+):
+    """
+    Assign many employees to one project in a single transaction.
+    Rows that cannot be created are reported per employee instead of failing the batch.
+    Available to: Manager, Admin
+    """
+    return await batch_create_assignments_async(db, batch, current_user)
+
+@router.get("", response_model=List[AssignmentResponse])
+async def list_assignments_endpoint(
+    response: Response,
+    emp_id: Optional[int] = Query(None),
+    project_id: Optional[int] = Query(None),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's X-Next-Cursor header"),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX, description="Page size"),
+    fields: Fields = Depends(sparse_fields(AssignmentResponse)),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: EmployeeModel = Depends(get_current_user_async)
+):
+    return send_page(response, await list_assignments_async(db, emp_id, project_id, current_user, cursor, limit, fields))
+
+@router.put("/{assign_id}", response_model=AssignmentResponse)
+async def update_assignment_endpoint(
+    assign_id: int,
+    update: AssignmentUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: EmployeeModel = Depends(get_current_user_async)
+):
+    return await update_assignment_async(db, assign_id, update, current_user)
+
+@router.delete("/{assign_id}")
+async def delete_assignment_endpoint(
+    assign_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: EmployeeModel = Depends(get_current_user_async)
+):
+    return await delete_assignment_async(db, assign_id, current_user)
@@ -1,17 +1,27 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from backend.app.Core.Config import config as settings
+from backend.app.Utils.Pagination import send_page
+from backend.app.Utils.ETags import conditional_get
+from backend.app.Utils.Fields import Fields, sparse_fields
 from backend.app.DataBase import get_db
 from backend.app.Core.Security import get_current_user
 from backend.app.Controllers.AssignProjectController import (
-    create_assignment, list_assignments, update_assignment, delete_assignment
+    create_assignment, list_assignments, update_assignment, delete_assignment,
+    batch_create_assignments
 )
 from backend.app.View.AssignmentSchemas import (
-    AssignmentCreate, AssignmentUpdate, AssignmentResponse
+    AssignmentCreate, AssignmentUpdate, AssignmentResponse,
+    AssignmentBatchCreate, AssignmentBatchResponse,
 )
 from backend.app.Model.EmployeeModel import EmployeeModel
 
-router = APIRouter(prefix="/api/assignments", tags=["Assignments"])
+router = APIRouter(
+    prefix="/api/assignments", tags=["Assignments"],
+    # GETs carry ETags; unchanged data revalidates with a 304
+    dependencies=[Depends(conditional_get("assigned_projects", "employees", "projects"))],
+)
 
 # Assignment endpoints
 @router.post("", response_model=AssignmentResponse)
@@ -22,14 +32,31 @@ def create_assignment_endpoint(
 ):
     return create_assignment(db, assignment, current_user)
 
+@router.post("/batch", response_model=AssignmentBatchResponse)
+def batch_create_assignments_endpoint(
+    batch: AssignmentBatchCreate,
+    db: Session = Depends(get_db),
+    current_user: EmployeeModel = Depends(get_current_user)
+):
+    """
+    Assign many employees to one project in a single transaction.
+    Rows that cannot be created are reported per employee instead of failing the batch.
+    Available to: Manager, Admin
+    """
+    return batch_create_assignments(db, batch, current_user)
+
 @router.get("", response_model=List[AssignmentResponse])
 def list_assignments_endpoint(
+    response: Response,
     emp_id: Optional[int] = Query(None),
     project_id: Optional[int] = Query(None),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's X-Next-Cursor header"),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX, description="Page size"),
+    fields: Fields = Depends(sparse_fields(AssignmentResponse)),
     db: Session = Depends(get_db),
     current_user: EmployeeModel = Depends(get_current_user)
 ):
-    return list_assignments(db, emp_id, project_id, current_user)
+    return send_page(response, list_assignments(db, emp_id, project_id, current_user, cursor, limit, fields))
 
 @router.put("/{assign_id}", response_model=AssignmentResponse)
 def update_assignment_endpoint(
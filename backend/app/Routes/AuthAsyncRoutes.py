@@ -0,0 +1,46 @@
+from fastapi.security import OAuth2PasswordRequestForm
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.app.DataBase import get_db, get_async_db
+from backend.app.Core.Logger import setup_logging
+from backend.app.View.AuthSchemas import SignupRequest, ForgotPasswordRequest
+from backend.app.Controllers.AuthController import (
+    signupUserAsync, loginUserAsync, forgetPasswordUserAsync, refreshAccessToken
+)
+
+logger = setup_logging()
+
+# Same paths as AuthRoutes, served by async handlers (Config.DB_ASYNC_MODE)
+router = APIRouter(prefix="/auth", tags=["Auth"])
+
+@router.post("/signup")
+async def signup(
+    request: SignupRequest,
+    db: AsyncSession = Depends(get_async_db)
+):
+    return await signupUserAsync(request, db, logger)
+
+@router.post("/login")
+async def login(
+    request: Request,
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_async_db)
+):
+    client_ip = request.client.host if request.client else None
+    return await loginUserAsync(form_data, db, logger, client_ip)
+
+@router.put("/forgot-password")
+async def forgot_password(
+    request: ForgotPasswordRequest,
+    db: AsyncSession = Depends(get_async_db)
+):
+    return await forgetPasswordUserAsync(request, db, logger)
+
+
+@router.post("/refresh")
+def refresh_access_token(
+    refresh_token: str,
+    db: Session = Depends(get_db)
+):
+    return refreshAccessToken(refresh_token, db, logger)
@@ -9,7 +9,7 @@
 # from app.Core.Config import config as settings
 
 from fastapi.security import OAuth2PasswordRequestForm
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 from backend.app.DataBase import get_db
 from backend.app.Core.Logger import setup_logging
@@ -29,10 +29,12 @@ def signup(
 
 @router.post("/login")
 def login(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
-   return loginUser(form_data, db, logger)
+   client_ip = request.client.host if request.client else None
+   return loginUser(form_data, db, logger, client_ip)
 
 @router.put("/forgot-password")
 def forgot_password(
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends, Request
+from backend.app.Core.Security import get_current_user
+from backend.app.Controllers.BatchController import run_batch
+from backend.app.Utils.Serialization import json_item
+from backend.app.View.BatchSchemas import BatchRequest, BatchResponse
+from backend.app.Model.EmployeeModel import EmployeeModel
+
+router = APIRouter(prefix="/api/batch", tags=["Batch"])
+
+
+@router.post("", response_model=BatchResponse)
+async def batch_endpoint(
+    batch: BatchRequest,
+    request: Request,
+    current_user: EmployeeModel = Depends(get_current_user),
+):
+    """
+    Run several API calls in one round trip, authenticated once.
+    Each sub-request gets the status, headers and body it would have had on its own.
+    Available to: All authenticated users (each sub-request keeps its own permission checks)
+    """
+    return json_item(await run_batch(request, batch, current_user))
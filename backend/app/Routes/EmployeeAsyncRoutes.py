@@ -0,0 +1,74 @@
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from backend.app.Core.Config import config as settings
+from backend.app.Utils.Pagination import send_page
+from backend.app.Utils.ETags import conditional_get
+from backend.app.Utils.Serialization import json_item, json_list
+from backend.app.Utils.Fields import Fields, partial_schema, sparse_fields
+from backend.app.DataBase import get_async_db
+from backend.app.Core.Security import get_current_user_async
+from backend.app.Controllers.EmployeeController import (
+    get_my_assignments_async,
+    get_my_assignment_details_async,
+    mark_task_completed_async,
+    get_my_completed_tasks_async
+)
+from backend.app.View.AssignmentSchemas import (
+    AssignmentResponse,
+    TaskCompletionCreate,
+    TaskCompletionResponse
+)
+from backend.app.Model.EmployeeModel import EmployeeModel
+
+# Same paths as EmployeeRoutes, served by async handlers (Config.DB_ASYNC_MODE)
+router = APIRouter(
+    prefix="/api/employee", tags=["Employee"],
+    # GETs carry ETags; unchanged data revalidates with a 304
+    dependencies=[Depends(conditional_get("assigned_projects", "employees", "projects", user_dependency=get_current_user_async))],
+)
+
+ASSIGNMENT_FIELDS = sparse_fields(AssignmentResponse)
+COMPLETION_FIELDS = sparse_fields(TaskCompletionResponse)
+
+
+@router.get("/my-assignments", response_model=List[AssignmentResponse])
+async def get_all_my_assignments(
+    response: Response,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's X-Next-Cursor header"),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX, description="Page size"),
+    fields: Fields = Depends(ASSIGNMENT_FIELDS),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: EmployeeModel = Depends(get_current_user_async)
+):
+    return send_page(response, await get_my_assignments_async(db, current_user, cursor, limit, fields))
+
+
+@router.get("/my-assignments/{assign_id}", response_model=AssignmentResponse)
+async def get_assignment_details(
+    assign_id: int,
+    response: Response,
+    fields: Fields = Depends(ASSIGNMENT_FIELDS),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: EmployeeModel = Depends(get_current_user_async)
+):
+    return json_item(await get_my_assignment_details_async(db, assign_id, current_user, fields), response)
+
+
+@router.post("/task-completions", response_model=TaskCompletionResponse, status_code=status.HTTP_201_CREATED)
+async def complete_task(
+    completion: TaskCompletionCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: EmployeeModel = Depends(get_current_user_async)
+):
+    return await mark_task_completed_async(db, completion, current_user)
+
+
+@router.get("/my-task-completions", response_model=List[TaskCompletionResponse])
+async def get_completed_tasks_history(
+    response: Response,
+    fields: Fields = Depends(COMPLETION_FIELDS),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: EmployeeModel = Depends(get_current_user_async)
+):
+    return json_list(partial_schema(TaskCompletionResponse, fields), await get_my_completed_tasks_async(db, current_user, fields), response)
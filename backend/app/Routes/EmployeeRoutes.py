@@ -1,6 +1,11 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from backend.app.Core.Config import config as settings
+from backend.app.Utils.Pagination import send_page
+from backend.app.Utils.ETags import conditional_get
+from backend.app.Utils.Serialization import json_item, json_list
+from backend.app.Utils.Fields import Fields, partial_schema, sparse_fields
 from backend.app.DataBase import get_db
 from backend.app.Core.Security import get_current_user
 from backend.app.Controllers.EmployeeController import (
@@ -16,24 +21,37 @@ from backend.app.View.AssignmentSchemas import (
 )
 from backend.app.Model.EmployeeModel import EmployeeModel
 
-router = APIRouter(prefix="/api/employee", tags=["Employee"])
+router = APIRouter(
+    prefix="/api/employee", tags=["Employee"],
+    # GETs carry ETags; unchanged data revalidates with a 304
+    dependencies=[Depends(conditional_get("assigned_projects", "employees", "projects"))],
+)
+
+ASSIGNMENT_FIELDS = sparse_fields(AssignmentResponse)
+COMPLETION_FIELDS = sparse_fields(TaskCompletionResponse)
 
 
 @router.get("/my-assignments", response_model=List[AssignmentResponse])
 def get_all_my_assignments(
+    response: Response,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's X-Next-Cursor header"),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX, description="Page size"),
+    fields: Fields = Depends(ASSIGNMENT_FIELDS),
     db: Session = Depends(get_db),
     current_user: EmployeeModel = Depends(get_current_user)
 ):
     """
-    Get all assignments/tasks assigned to the current user.
+    Get a page of assignments/tasks assigned to the current user.
     Available to: Employee, Manager, Admin
     """
-    return get_my_assignments(db, current_user)
+    return send_page(response, get_my_assignments(db, current_user, cursor, limit, fields))
 
 
 @router.get("/my-assignments/{assign_id}", response_model=AssignmentResponse)
 def get_assignment_details(
     assign_id: int,
+    response: Response,
+    fields: Fields = Depends(ASSIGNMENT_FIELDS),
     db: Session = Depends(get_db),
     current_user: EmployeeModel = Depends(get_current_user)
 ):
@@ -42,7 +60,7 @@ def get_assignment_details(
     Users can only view their own assignments.
     Available to: Employee, Manager, Admin
     """
-    return get_my_assignment_details(db, assign_id, current_user)
+    return json_item(get_my_assignment_details(db, assign_id, current_user, fields), response)
 
 
 @router.post("/task-completions", response_model=TaskCompletionResponse, status_code=status.HTTP_201_CREATED)
@@ -61,6 +79,8 @@ def complete_task(
 
 @router.get("/my-task-completions", response_model=List[TaskCompletionResponse])
 def get_completed_tasks_history(
+    response: Response,
+    fields: Fields = Depends(COMPLETION_FIELDS),
     db: Session = Depends(get_db),
     current_user: EmployeeModel = Depends(get_current_user)
 ):
@@ -68,4 +88,4 @@ def get_completed_tasks_history(
     View history of all tasks completed by the current user.
     Available to: Employee, Manager, Admin
     """
-    return get_my_completed_tasks(db, current_user)
+    return json_list(partial_schema(TaskCompletionResponse, fields), get_my_completed_tasks(db, current_user, fields), response)
@@ -0,0 +1,62 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from backend.app.Core.Security import get_current_user
+from backend.app.Controllers.ExportController import (
+    EXPORT_MEDIA_TYPES,
+    employee_export_query,
+    project_export_query,
+    assignment_export_query,
+    stream_export,
+)
+from backend.app.Model.EmployeeModel import EmployeeModel
+
+router = APIRouter(prefix="/api/exports", tags=["Exports"])
+
+FORMAT_QUERY = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson (one JSON object per line) or csv")
+
+
+def _export_response(stmt, fmt: str, name: str) -> StreamingResponse:
+    return StreamingResponse(
+        stream_export(stmt, fmt),
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{fmt}"'},
+    )
+
+
+@router.get("/employees")
+def export_employees(
+    format: str = FORMAT_QUERY,
+    current_user: EmployeeModel = Depends(get_current_user),
+):
+    """
+    Stream the employees of the caller's department (role=employee), like GET /api/manager/employees.
+    Available to: Manager
+    """
+    return _export_response(employee_export_query(current_user), format, "employees")
+
+
+@router.get("/projects")
+def export_projects(
+    format: str = FORMAT_QUERY,
+    current_user: EmployeeModel = Depends(get_current_user),
+):
+    """
+    Stream every project.
+    Available to: Manager, Admin
+    """
+    return _export_response(project_export_query(current_user), format, "projects")
+
+
+@router.get("/assignments")
+def export_assignments(
+    format: str = FORMAT_QUERY,
+    emp_id: Optional[int] = Query(None, description="Filter by employee ID"),
+    project_id: Optional[int] = Query(None, description="Filter by project ID"),
+    current_user: EmployeeModel = Depends(get_current_user),
+):
+    """
+    Stream assignments with employee and project names.
+    Available to: Manager, Admin
+    """
+    return _export_response(assignment_export_query(current_user, emp_id, project_id), format, "assignments")
@@ -0,0 +1,95 @@
+import csv
+import io
+import json
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List
+from backend.app.Core.Config import config as settings
+from backend.app.DataBase import get_db
+from backend.app.Core.Security import get_current_user
+from backend.app.Controllers.ImportController import import_employees, import_projects, import_assignments
+from backend.app.View.ImportSchemas import ImportResult
+from backend.app.Model.EmployeeModel import EmployeeModel
+
+router = APIRouter(prefix="/api/imports", tags=["Imports"])
+
+
+async def _read_body(request: Request) -> bytes:
+    """The request body, refused with 413 once it exceeds IMPORT_MAX_ROWS rows' worth of bytes."""
+    limit = settings.IMPORT_MAX_ROWS * settings.IMPORT_MAX_ROW_BYTES
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Import bodies are limited to {limit} bytes",
+    )
+    declared = request.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > limit:
+        raise too_large
+    chunks, size = [], 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > limit:  # chunked uploads, or a wrong Content-Length
+            raise too_large
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def import_rows(
+    request: Request,
+    # Authenticate before reading or parsing anything (the route reuses this result)
+    current_user: EmployeeModel = Depends(get_current_user),
+) -> List[Dict[str, Any]]:
+    """Request body as a list of rows: a JSON array, or CSV with a header line (text/csv)."""
+    body = await _read_body(request)
+    try:
+        if request.headers.get("content-type", "").startswith("text/csv"):
+            reader = csv.DictReader(io.StringIO(body.decode("utf-8-sig")))
+            # Empty CSV cells mean "not given" so optional fields fall back to their defaults
+            return [{k: v for k, v in row.items() if v != ""} for row in reader]
+        rows = json.loads(body)
+    except (UnicodeDecodeError, ValueError, csv.Error):
+        rows = None
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Body must be a JSON array of objects or CSV with a header row"
+        )
+    return rows
+
+
+@router.post("/employees", response_model=ImportResult)
+def import_employees_endpoint(
+    current_user: EmployeeModel = Depends(get_current_user),
+    rows: List[Dict[str, Any]] = Depends(import_rows),
+    db: Session = Depends(get_db),
+):
+    """
+    Create many employees in one call. Role is automatically set to 'employee'.
+    Available to: Manager
+    """
+    return import_employees(db, rows, current_user)
+
+
+@router.post("/projects", response_model=ImportResult)
+def import_projects_endpoint(
+    current_user: EmployeeModel = Depends(get_current_user),
+    rows: List[Dict[str, Any]] = Depends(import_rows),
+    db: Session = Depends(get_db),
+):
+    """
+    Create many projects in one call.
+    Available to: Admin
+    """
+    return import_projects(db, rows, current_user)
+
+
+@router.post("/assignments", response_model=ImportResult)
+def import_assignments_endpoint(
+    current_user: EmployeeModel = Depends(get_current_user),
+    rows: List[Dict[str, Any]] = Depends(import_rows),
+    db: Session = Depends(get_db),
+):
+    """
+    Assign many employees to projects in one call.
+    Available to: Manager, Admin
+    """
+    return import_assignments(db, rows, current_user)
@@ -1,16 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from backend.app.Core.Config import config as settings
+from backend.app.Utils.Pagination import send_page
+from backend.app.Utils.ETags import conditional_get
+from backend.app.Utils.Serialization import json_item, json_list
+from backend.app.Utils.Fields import Fields, partial_schema, sparse_fields
 from backend.app.DataBase import get_db
 from backend.app.Core.Security import get_current_user
 from backend.app.Controllers.ManagerController import (
     create_employee, list_employees, get_employee, update_employee, toggle_employee_status,
-    search_employees_by_skills,
-    EmployeeCreateByManager, EmployeeUpdate, EmployeeResponse
+    search_employees_by_skills, match_employees_by_skills,
+    EmployeeCreateByManager, EmployeeUpdate, EmployeeResponse, SkillMatchResponse, EmployeeCapacityResponse
 )
 from backend.app.Model.EmployeeModel import EmployeeModel
 
-router = APIRouter(prefix="/api/manager", tags=["Manager"])
+router = APIRouter(
+    prefix="/api/manager", tags=["Manager"],
+    # GETs carry ETags; unchanged data revalidates with a 304
+    dependencies=[Depends(conditional_get("employees", "assigned_projects"))],
+)
+
+SORT_QUERY = Query("emp_id", pattern="^(emp_id|available)$", description="emp_id, or available (most available hours first)")
+EMPLOYEE_FIELDS = sparse_fields(EmployeeResponse)
+CAPACITY_FIELDS = sparse_fields(EmployeeCapacityResponse)
+MATCH_FIELDS = sparse_fields(SkillMatchResponse)
 
 # Employee endpoints
 @router.post("/employees", response_model=EmployeeResponse)
@@ -25,19 +39,31 @@ def add_employee(
     """
     return create_employee(db, employee, current_user)
 
-@router.get("/employees", response_model=List[EmployeeResponse])
+@router.get("/employees", response_model=List[EmployeeCapacityResponse])
 def get_employees(
+    response: Response,
+    min_available_hours: Optional[int] = Query(None, description="Only employees with at least this many uncommitted billable hours"),
+    sort: str = SORT_QUERY,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's X-Next-Cursor header"),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX, description="Page size"),
+    fields: Fields = Depends(CAPACITY_FIELDS),
     db: Session = Depends(get_db),
     current_user: EmployeeModel = Depends(get_current_user)
 ):
     # return list_employees(db, current_user.dept, 'employee', current_user)
-    return list_employees(db, None, 'employee', current_user)
+    return send_page(response, list_employees(db, None, 'employee', current_user, cursor, limit, min_available_hours, sort, fields))
 
-@router.get("/employees/search/by-skills", response_model=List[EmployeeResponse])
+@router.get("/employees/search/by-skills", response_model=List[EmployeeCapacityResponse])
 def search_employees_by_skill_set(
+    response: Response,
     skills: str = Query(..., description="Comma-separated skills (e.g., 'Python,FastAPI,SQL')"),
     min_experience: Optional[int] = Query(None, description="Minimum years of experience"),
-    include_assigned: bool = Query(False, description="Include already assigned employees"),
+    include_assigned: bool = Query(False, description="Include employees with hours committed to open assignments"),
+    min_available_hours: Optional[int] = Query(None, description="Only employees with at least this many uncommitted billable hours"),
+    sort: str = SORT_QUERY,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's X-Next-Cursor header"),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX, description="Page size"),
+    fields: Fields = Depends(CAPACITY_FIELDS),
     db: Session = Depends(get_db),
     current_user: EmployeeModel = Depends(get_current_user)
 ):
@@ -45,15 +71,35 @@ def search_employees_by_skill_set(
     Search for employees based on skill set requirements.
     Managers can use this to find suitable employees for their projects.
     """
-    return search_employees_by_skills(db, skills, current_user, min_experience, include_assigned)
+    return send_page(response, search_employees_by_skills(db, skills, current_user, min_experience, include_assigned, cursor, limit,
+                                                          min_available_hours, sort, fields))
+
+@router.get("/employees/search/best-match", response_model=List[SkillMatchResponse])
+def match_employees_by_skill_set(
+    response: Response,
+    skills: str = Query(..., description="Comma-separated skills (e.g., 'Python,FastAPI,SQL')"),
+    min_experience: Optional[int] = Query(None, description="Minimum years of experience"),
+    k: int = Query(10, ge=1, le=settings.SKILL_MATCH_MAX_K, description="Number of candidates to return"),
+    fields: Fields = Depends(MATCH_FIELDS),
+    db: Session = Depends(get_db),
+    current_user: EmployeeModel = Depends(get_current_user)
+):
+    """
+    Top candidates ranked by share of the required skills covered, then experience.
+    Available to: Manager
+    """
+    return json_list(partial_schema(SkillMatchResponse, fields),
+                     match_employees_by_skills(db, skills, current_user, min_experience, k, fields), response)
 
 @router.get("/employees/{emp_id}", response_model=EmployeeResponse)
 def get_employee_info(
     emp_id: int,
+    response: Response,
+    fields: Fields = Depends(EMPLOYEE_FIELDS),
     db: Session = Depends(get_db),
     current_user: EmployeeModel = Depends(get_current_user)
 ):
-    return get_employee(db, emp_id, current_user)
+    return json_item(get_employee(db, emp_id, current_user, fields), response)
 
 @router.put("/employees/{emp_id}", response_model=EmployeeResponse)
 def update_employee_info(
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends
+from backend.app.DataBase import get_pool_stats
+from backend.app.Core.EntityCache import entity_cache_stats
+from backend.app.Core.Rolemanage import require_admin
+from backend.app.Model.EmployeeModel import EmployeeModel
+
+router = APIRouter(prefix="/api/admin/metrics", tags=["Metrics"])
+
+
+@router.get("/db-pool")
+def db_pool_stats(
+    current_user: EmployeeModel = Depends(require_admin)
+):
+    """
+    Connection pool occupancy and checkout wait times.
+    Available to: Admin
+    """
+    return get_pool_stats()
+
+
+@router.get("/entity-cache")
+def entity_cache_metrics(
+    current_user: EmployeeModel = Depends(require_admin)
+):
+    """
+    Hits, misses, invalidations and hit ratio of the project/employee caches (this worker).
+    Available to: Admin
+    """
+    return entity_cache_stats()
@@ -0,0 +1,93 @@
+from typing import Dict, Iterable, Optional
+from sqlalchemy import bindparam, delete, func, insert, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.app.Model.EmployeeModel import EmployeeModel
+from backend.app.Model.AssignedProjectModel import AssignedProjectModel
+from backend.app.Model.EmployeeCapacityModel import EmployeeCapacityModel
+
+_capacity = EmployeeCapacityModel.__table__
+
+# Core (not ORM-bulk) UPDATE so it can run as one executemany over many employees
+_bump = (
+    update(_capacity)
+    .where(_capacity.c.emp_id == bindparam("b_emp_id"))
+    .values(
+        committed_hours=_capacity.c.committed_hours + bindparam("b_delta"),
+        available_hours=_capacity.c.available_hours - bindparam("b_delta"),
+    )
+)
+
+
+def _bump_params(deltas: Dict[int, int]):
+    return [{"b_emp_id": emp_id, "b_delta": delta} for emp_id, delta in deltas.items() if delta]
+
+
+def _rebuild_statements(emp_ids: Optional[Iterable[int]] = None):
+    """DELETE + INSERT ... SELECT recomputing the counters from assignments."""
+    open_hours = (
+        select(AssignedProjectModel.emp_id, func.sum(AssignedProjectModel.allotted_hours).label("hours"))
+        .where(AssignedProjectModel.is_completed.is_not(True))
+        .group_by(AssignedProjectModel.emp_id)
+        .subquery()
+    )
+    committed = func.coalesce(open_hours.c.hours, 0)
+    source = (
+        select(EmployeeModel.emp_id, committed, func.coalesce(EmployeeModel.billable_work_hours, 0) - committed)
+        .outerjoin(open_hours, open_hours.c.emp_id == EmployeeModel.emp_id)
+    )
+    clear = delete(_capacity)
+    if emp_ids is not None:
+        emp_ids = list(emp_ids)
+        source = source.where(EmployeeModel.emp_id.in_(emp_ids))
+        clear = clear.where(_capacity.c.emp_id.in_(emp_ids))
+    fill = insert(_capacity).from_select(["emp_id", "committed_hours", "available_hours"], source)
+    return clear, fill
+
+
+def rebuild_capacity(db: Session, emp_ids: Optional[Iterable[int]] = None):
+    """
+    Recompute counters for `emp_ids` (all employees if None) inside the caller's
+    transaction. Also used to create the row for a new employee or after
+    billable_work_hours changes.
+    """
+    db.flush()
+    for stmt in _rebuild_statements(emp_ids):
+        db.execute(stmt)
+
+
+async def rebuild_capacity_async(db: AsyncSession, emp_ids: Optional[Iterable[int]] = None):
+    await db.flush()
+    for stmt in _rebuild_statements(emp_ids):
+        await db.execute(stmt)
+
+
+def bump_committed_hours(db: Session, deltas: Dict[int, int]):
+    """
+    Add `delta` open hours per employee (negative to release them) inside the
+    caller's transaction. Employees without a counter row get one rebuilt.
+    """
+    params = _bump_params(deltas)
+    if not params:
+        return
+    if db.execute(_bump, params).rowcount != len(params):
+        rebuild_capacity(db, [p["b_emp_id"] for p in params])
+
+
+async def bump_committed_hours_async(db: AsyncSession, deltas: Dict[int, int]):
+    params = _bump_params(deltas)
+    if not params:
+        return
+    if (await db.execute(_bump, params)).rowcount != len(params):
+        await rebuild_capacity_async(db, [p["b_emp_id"] for p in params])
+
+
+def capacity_is_incomplete(db: Session) -> bool:
+    """True when some employee has no counter row (e.g. a database from before the counters)."""
+    missing = (
+        select(EmployeeModel.emp_id)
+        .outerjoin(EmployeeCapacityModel, EmployeeCapacityModel.emp_id == EmployeeModel.emp_id)
+        .where(EmployeeCapacityModel.emp_id.is_(None))
+        .limit(1)
+    )
+    return db.scalar(missing) is not None
@@ -0,0 +1,54 @@
+import hashlib
+from typing import Callable, Optional
+from fastapi import Depends, HTTPException, Request, Response, status
+from backend.app.Core.Config import config as settings
+from backend.app.Core.ResponseEncoding import wants_msgpack
+from backend.app.Core.Security import get_current_user
+from backend.app.Utils.EntityVersions import current_versions
+
+# Let clients keep responses but revalidate them every time
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(request: Request, principal, versions: tuple) -> str:
+    """
+    Weak ETag over the URL, who is asking (scoping depends on it), the table
+    versions and the media type (JSON or msgpack; content-codings share tags).
+    """
+    key = "|".join([
+        request.url.path,
+        request.url.query,
+        f"{principal.emp_id}:{principal.role.value}:{principal.dept}",
+        ".".join(map(str, versions)),
+        "msgpack" if wants_msgpack(request.headers) else "json",
+    ])
+    return f'W/"{hashlib.sha256(key.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def conditional_get(*tables: str, user_dependency: Callable = get_current_user):
+    """
+    Router dependency for GET endpoints whose responses depend only on `tables`
+    (and the caller). Tags each response with an ETag and answers a matching
+    If-None-Match with 304 before the endpoint, and so its query, runs.
+    """
+    def check(request: Request, response: Response, current_user=Depends(user_dependency)):
+        if request.method != "GET" or not settings.ETAGS_ENABLED:
+            return
+        etag = make_etag(request, current_user, current_versions(tables))
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        if etag_matches(etag, request.headers.get("if-none-match")):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+
+    return check
@@ -0,0 +1,73 @@
+from itertools import chain
+from typing import Iterable, Tuple
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from backend.app.DataBase import engine
+from backend.app.Model.EntityVersionModel import EntityVersionModel
+
+# Tables whose writes invalidate ETags; the counter is named after the table
+TRACKED = ("employees", "projects", "assigned_projects")
+
+_versions = EntityVersionModel.__table__
+_TOUCHED = "entity_versions.touched"  # Session.info key: tracked tables written in this transaction
+
+
+def bump_versions(conn: Connection, names: Iterable[str]):
+    """Increment the counters of `names`, creating missing ones, inside the connection's transaction."""
+    names = sorted(set(names))  # one lock order for every writer
+    if not names:
+        return
+    updated = conn.execute(
+        update(_versions).where(_versions.c.name.in_(names)).values(version=_versions.c.version + 1)
+    ).rowcount
+    if updated != len(names):
+        existing = set(conn.scalars(select(_versions.c.name).where(_versions.c.name.in_(names))))
+        conn.execute(insert(_versions), [{"name": name, "version": 1} for name in names if name not in existing])
+
+
+def current_versions(names: Iterable[str]) -> Tuple[int, ...]:
+    """Committed counters of `names` (0 for never-written tables); one primary key lookup."""
+    names = list(names)
+    with engine.connect() as conn:
+        found = dict(conn.execute(select(_versions.c.name, _versions.c.version).where(_versions.c.name.in_(names))).all())
+    return tuple(found.get(name, 0) for name in names)
+
+
+def _touched(session: Session) -> set:
+    return session.info.setdefault(_TOUCHED, set())
+
+
+def _record_flush(session: Session, flush_context):
+    # Unit-of-work writes: new/dirty/deleted still describe what was just flushed
+    for obj in chain(session.new, session.dirty, session.deleted):
+        name = getattr(type(obj), "__tablename__", None)
+        if name in TRACKED:
+            _touched(session).add(name)
+
+
+def _record_statement(state):
+    # Bulk and executemany INSERT/UPDATE/DELETE sent through Session.execute
+    if state.is_insert or state.is_update or state.is_delete:
+        name = getattr(getattr(state.statement, "table", None), "name", None)
+        if name in TRACKED:
+            _touched(state.session).add(name)
+
+
+def _bump_before_commit(session: Session):
+    session.flush()  # record whatever the commit itself would flush
+    touched = session.info.pop(_TOUCHED, None)
+    if touched:
+        bump_versions(session.connection(), touched)
+
+
+def _forget(session: Session, transaction):
+    if transaction.parent is None:  # committed or rolled back: nothing left to bump
+        session.info.pop(_TOUCHED, None)
+
+
+# Registered on the Session class, so they also cover AsyncSession (via its sync_session)
+event.listen(Session, "after_flush", _record_flush)
+event.listen(Session, "do_orm_execute", _record_statement)
+event.listen(Session, "before_commit", _bump_before_commit)
+event.listen(Session, "after_transaction_end", _forget)
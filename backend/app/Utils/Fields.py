@@ -0,0 +1,72 @@
+from functools import lru_cache
+from typing import Any, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel, create_model
+
+from backend.app.Core.Config import config as settings
+
+Fields = Optional[Tuple[str, ...]]
+
+
+def parse_fields(schema: type, fields: Optional[str]) -> Fields:
+    """
+    Validate a `fields=a,b` value against `schema`. Returns the names in the
+    schema's own field order, or None when the parameter was not given.
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = sorted(requested - schema.model_fields.keys())
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown) or '(none given)'}. "
+                   f"Allowed: {', '.join(schema.model_fields)}",
+        )
+    return tuple(name for name in schema.model_fields if name in requested)
+
+
+def sparse_fields(schema: type):
+    """Route dependency reading the `fields` query parameter for responses of `schema`."""
+    def dependency(fields: Optional[str] = Query(
+        None, description=f"Comma-separated subset of fields to return: {', '.join(schema.model_fields)}",
+    )) -> Fields:
+        return parse_fields(schema, fields)
+
+    return dependency
+
+
+@lru_cache(maxsize=settings.SPARSE_FIELDS_CACHE_SIZE)
+def partial_schema(schema: type, fields: Fields) -> type:
+    """
+    `schema` cut down to `fields` (same types and defaults); `schema` itself
+    when fields is None. Bounded because callers choose `fields`; anything
+    derived from a model (its list_adapter) is kept on the model, so it is
+    freed along with an evicted entry.
+    """
+    if fields is None:
+        return schema
+    return create_model(
+        f"{schema.__name__}Fields",
+        **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in fields},
+    )
+
+
+def projection(columns: Sequence[Any], fields: Fields, *keys: str) -> Tuple[Any, ...]:
+    """
+    The `columns` (labelled by field name) that `fields` needs, plus the `keys`
+    paging and filtering rely on. Columns keep their order, so the first one
+    still anchors the FROM clause.
+    """
+    if fields is None:
+        return tuple(columns)
+    wanted = set(fields).union(keys)
+    return tuple(column for column in columns if column.key in wanted)
+
+
+def narrow(item: BaseModel, fields: Fields) -> BaseModel:
+    """Cut an already built response (e.g. a cached snapshot) down to `fields`."""
+    if fields is None:
+        return item
+    return partial_schema(type(item), fields).model_validate(item, from_attributes=True)
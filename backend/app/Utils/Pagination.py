@@ -0,0 +1,91 @@
+import base64
+import binascii
+import json
+from typing import Any, Callable, List, NamedTuple, Optional
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import and_, or_
+
+from backend.app.Utils.Serialization import json_list, validate_rows
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class Page(NamedTuple):
+    items: List[Any]
+    next_cursor: Optional[str] = None
+    schema: Optional[type] = None  # item type, when items were validated in bulk
+
+
+def encode_cursor(key) -> str:
+    """Opaque cursor for "rows after this key" (an int, or a tuple of ints for composite orderings)."""
+    raw = json.dumps({"k": list(key) if isinstance(key, tuple) else key}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], arity: int = 1):
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))["k"]
+    except (binascii.Error, ValueError, KeyError, TypeError, UnicodeError):
+        key = None
+    if arity == 1:
+        valid = isinstance(key, int)
+    else:
+        valid = isinstance(key, list) and len(key) == arity and all(isinstance(k, int) for k in key)
+        key = tuple(key) if valid else None
+    if not valid:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return key
+
+
+def keyset(query, key_column, cursor: Optional[str], limit: int):
+    """
+    Restrict a Query/Select to the page after `cursor`, ordered by `key_column`.
+    One extra row is fetched so the caller can tell whether another page exists.
+    """
+    after = decode_cursor(cursor)
+    if after is not None:
+        query = query.where(key_column > after)
+    return query.order_by(key_column).limit(limit + 1)
+
+
+def keyset_desc(query, rank_column, key_column, cursor: Optional[str], limit: int):
+    """
+    Like `keyset`, ordered by `rank_column` descending with `key_column` as the
+    tie-breaker. The cursor holds the (rank, key) pair of the last row.
+    """
+    after = decode_cursor(cursor, arity=2)
+    if after is not None:
+        rank, key = after
+        query = query.where(or_(rank_column < rank, and_(rank_column == rank, key_column > key)))
+    return query.order_by(rank_column.desc(), key_column).limit(limit + 1)
+
+
+def to_page(rows: List[Any], limit: int, key_of: Callable[[Any], Any], convert: Callable[[Any], Any] = None,
+            schema: Optional[type] = None) -> Page:
+    """
+    Trim the look-ahead row and build the next cursor from the last row's key.
+    Items come from `schema` validated over the rows in bulk, or `convert` per row.
+    """
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(key_of(rows[-1])) if has_more and rows else None
+    if schema is not None:
+        return Page(validate_rows(schema, rows), next_cursor, schema)
+    items = [convert(row) for row in rows] if convert else rows
+    return Page(items, next_cursor)
+
+
+def send_page(response: Response, page: Page):
+    """
+    Expose the next cursor as a response header and return the page body,
+    already encoded to JSON when the page knows its item schema.
+    """
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    if page.schema is not None:
+        return json_list(page.schema, page.items, response)
+    return page.items
@@ -0,0 +1,26 @@
+from pydantic import BaseModel, ConfigDict
+from backend.app.Model.Role import RoleEnum
+from typing import Optional
+
+
+class Principal(BaseModel):
+    """The authenticated user as seen by authorization checks (no DB session attached)."""
+    model_config = ConfigDict(frozen=True)
+
+    emp_id: int
+    emp_name: str
+    email: str
+    role: RoleEnum
+    dept: Optional[str] = None
+    is_active: bool = True
+
+    @classmethod
+    def from_model(cls, emp) -> "Principal":
+        return cls(
+            emp_id=emp.emp_id,
+            emp_name=emp.emp_name,
+            email=emp.email,
+            role=emp.role,
+            dept=emp.dept,
+            is_active=bool(emp.is_active),
+        )
@@ -0,0 +1,146 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import bindparam, delete, func, insert, literal, select, union_all, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.app.Model.AssignedProjectModel import AssignedProjectModel
+from backend.app.Model.ProjectDailyRollupModel import ProjectDailyRollupModel
+
+_rollups = ProjectDailyRollupModel.__table__
+
+COUNTERS = ("assignments_added", "allotted_hours", "assignments_completed", "completed_hours", "worked_hours")
+
+UPSERTS = {
+    "sqlite": sqlite_insert,
+    "postgresql": postgresql_insert,
+}
+
+
+def rollup_delta(project_id: int, when: datetime, sign: int = 1, **counters) -> dict:
+    """Counter changes for the bucket of `project_id` on the (UTC) day of `when`."""
+    delta = {"project_id": project_id, "day": when.date()}
+    delta.update({name: sign * (counters.get(name) or 0) for name in COUNTERS})
+    return delta
+
+
+def completion_rollup(a: AssignedProjectModel, sign: int = 1) -> dict:
+    return rollup_delta(a.project_id, a.completed_at, sign, assignments_completed=1,
+                        completed_hours=a.allotted_hours, worked_hours=a.hours_worked)
+
+
+def assignment_rollup(a: AssignedProjectModel, sign: int = 1) -> List[dict]:
+    """Everything `a` contributes (sign=-1 to take it back out, e.g. before an update or delete)."""
+    deltas = [rollup_delta(a.project_id, a.assigned_at, sign, assignments_added=1, allotted_hours=a.allotted_hours)]
+    if a.is_completed and a.completed_at is not None:
+        deltas.append(completion_rollup(a, sign))
+    return deltas
+
+
+def _merge(deltas: Iterable[dict]) -> List[dict]:
+    merged: Dict[tuple, dict] = {}
+    for delta in deltas:
+        bucket = merged.setdefault((delta["project_id"], delta["day"]), dict(delta, **{name: 0 for name in COUNTERS}))
+        for name in COUNTERS:
+            bucket[name] += delta[name]
+    return [bucket for bucket in merged.values() if any(bucket[name] for name in COUNTERS)]
+
+
+def _upsert(dialect_name: str):
+    """INSERT ... ON CONFLICT adding to the existing bucket, or None where the dialect lacks it."""
+    dialect_insert = UPSERTS.get(dialect_name)
+    if dialect_insert is None:
+        return None
+    stmt = dialect_insert(_rollups)
+    return stmt.on_conflict_do_update(
+        index_elements=["project_id", "day"],
+        set_={name: _rollups.c[name] + stmt.excluded[name] for name in COUNTERS},
+    )
+
+
+# Fallback for other dialects; buckets it misses are rebuilt from assignments
+_bump = (
+    update(_rollups)
+    .where(_rollups.c.project_id == bindparam("b_project_id"), _rollups.c.day == bindparam("b_day"))
+    .values({name: _rollups.c[name] + bindparam(f"b_{name}") for name in COUNTERS})
+)
+
+
+def _bump_params(params: List[dict]):
+    return [{f"b_{name}": value for name, value in p.items()} for p in params]
+
+
+def _rebuild_statements(project_ids: Optional[Iterable[int]] = None):
+    """DELETE + INSERT ... SELECT regrouping assignments into daily buckets."""
+    a = AssignedProjectModel
+    zero = literal(0)
+    assigned_day, completed_day = func.date(a.assigned_at), func.date(a.completed_at)
+    added = (
+        select(a.project_id.label("project_id"), assigned_day.label("day"),
+               func.count().label("assignments_added"), func.sum(a.allotted_hours).label("allotted_hours"),
+               zero.label("assignments_completed"), zero.label("completed_hours"), zero.label("worked_hours"))
+        .where(a.assigned_at.is_not(None))
+        .group_by(a.project_id, assigned_day)
+    )
+    completed = (
+        select(a.project_id, completed_day, zero, zero,
+               func.count(), func.sum(a.allotted_hours), func.sum(func.coalesce(a.hours_worked, 0)))
+        .where(a.is_completed == True, a.completed_at.is_not(None))
+        .group_by(a.project_id, completed_day)
+    )
+    clear = delete(_rollups)
+    if project_ids is not None:
+        project_ids = list(project_ids)
+        added = added.where(a.project_id.in_(project_ids))
+        completed = completed.where(a.project_id.in_(project_ids))
+        clear = clear.where(_rollups.c.project_id.in_(project_ids))
+    both = union_all(added, completed).subquery()
+    source = (
+        select(both.c.project_id, both.c.day, *(func.sum(both.c[name]) for name in COUNTERS))
+        .group_by(both.c.project_id, both.c.day)
+    )
+    fill = insert(_rollups).from_select(["project_id", "day", *COUNTERS], source)
+    return clear, fill
+
+
+def rebuild_project_rollups(db: Session, project_ids: Optional[Iterable[int]] = None):
+    """Recompute the buckets of `project_ids` (all projects if None) inside the caller's transaction."""
+    db.flush()
+    for stmt in _rebuild_statements(project_ids):
+        db.execute(stmt)
+
+
+async def rebuild_project_rollups_async(db: AsyncSession, project_ids: Optional[Iterable[int]] = None):
+    await db.flush()
+    for stmt in _rebuild_statements(project_ids):
+        await db.execute(stmt)
+
+
+def bump_rollups(db: Session, deltas: Iterable[dict]):
+    """Add `deltas` (see rollup_delta) to their daily buckets inside the caller's transaction."""
+    params = _merge(deltas)
+    if not params:
+        return
+    upsert = _upsert(db.get_bind().dialect.name)
+    if upsert is not None:
+        db.execute(upsert, params)
+    elif db.execute(_bump, _bump_params(params)).rowcount != len(params):
+        rebuild_project_rollups(db, {p["project_id"] for p in params})
+
+
+async def bump_rollups_async(db: AsyncSession, deltas: Iterable[dict]):
+    params = _merge(deltas)
+    if not params:
+        return
+    upsert = _upsert(db.get_bind().dialect.name)
+    if upsert is not None:
+        await db.execute(upsert, params)
+    elif (await db.execute(_bump, _bump_params(params))).rowcount != len(params):
+        await rebuild_project_rollups_async(db, {p["project_id"] for p in params})
+
+
+def rollups_are_missing(db: Session) -> bool:
+    """True when there are assignments but no buckets (e.g. a database from before the rollups)."""
+    return (db.scalar(select(_rollups.c.project_id).limit(1)) is None
+            and db.scalar(select(AssignedProjectModel.assign_id).limit(1)) is not None)
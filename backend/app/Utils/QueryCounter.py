@@ -0,0 +1,34 @@
+from contextlib import contextmanager
+from typing import List
+from sqlalchemy import event
+
+
+class QueryCounter:
+    """Collects the SQL statements an engine executes while active."""
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+
+@contextmanager
+def count_queries(engine):
+    """
+    Count statements sent to the database, e.g.
+
+        with count_queries(engine) as counter:
+            client.get("/api/assignments")
+        assert counter.count == 1, counter.statements
+    """
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter._before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter._before_cursor_execute)
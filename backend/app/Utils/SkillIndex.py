@@ -0,0 +1,90 @@
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import delete, insert, or_, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.orm import Session
+from backend.app.Model.EmployeeModel import EmployeeModel
+from backend.app.Model.SkillModel import SkillModel, EmployeeSkillModel
+
+
+def parse_skills(skills: Optional[str]) -> List[str]:
+    """"Python, FastAPI,,python" -> ["python", "fastapi"] (normalized, de-duplicated, in order)."""
+    if not skills:
+        return []
+    return list(dict.fromkeys(s.strip().lower() for s in skills.split(',') if s.strip()))
+
+
+CONFLICT_IGNORING_INSERTS = {
+    "sqlite": sqlite_insert,
+    "postgresql": postgresql_insert,
+}
+
+
+def _select_ids(db: Session, names: Iterable[str]) -> Dict[str, int]:
+    return dict(db.execute(select(SkillModel.name, SkillModel.skill_id).where(SkillModel.name.in_(names))).all())
+
+
+def _skill_ids(db: Session, names: Iterable[str]) -> Dict[str, int]:
+    """Dictionary ids for `names`, adding the ones not seen before."""
+    names = set(names)
+    if not names:
+        return {}
+    ids = _select_ids(db, names)
+    missing = sorted(names - ids.keys())
+    if missing:
+        # A concurrent employee write may add the same new skill: skip names that
+        # are there by now (instead of failing on skills.name) and read all ids back
+        dialect_insert = CONFLICT_IGNORING_INSERTS.get(db.get_bind().dialect.name)
+        if dialect_insert is None:
+            stmt = insert(SkillModel)
+        else:
+            stmt = dialect_insert(SkillModel).on_conflict_do_nothing(index_elements=["name"])
+        db.execute(stmt, [{"name": name} for name in missing])
+        ids.update(_select_ids(db, missing))
+    return ids
+
+
+def sync_employee_skills(db: Session, skills_by_emp: Dict[int, Optional[str]]):
+    """
+    Make employee_skills match the given EmployeeModel.skills strings, inside
+    the caller's transaction (caller commits). Call after every write to skills.
+    """
+    if not skills_by_emp:
+        return
+    parsed = {emp_id: parse_skills(skills) for emp_id, skills in skills_by_emp.items()}
+    ids = _skill_ids(db, (name for names in parsed.values() for name in names))
+    db.execute(delete(EmployeeSkillModel).where(EmployeeSkillModel.emp_id.in_(parsed.keys())))
+    links = [{"emp_id": emp_id, "skill_id": ids[name]} for emp_id, names in parsed.items() for name in names]
+    if links:
+        db.execute(insert(EmployeeSkillModel), links)
+
+
+def rebuild_skill_index(db: Session, batch_size: int = 1000):
+    """Backfill employee_skills from EmployeeModel.skills for every employee (caller commits)."""
+    db.execute(delete(EmployeeSkillModel))
+    rows = db.execute(
+        select(EmployeeModel.emp_id, EmployeeModel.skills).where(EmployeeModel.skills.is_not(None)),
+        execution_options={"yield_per": batch_size},
+    )
+    for batch in rows.partitions():
+        sync_employee_skills(db, dict(batch))
+
+
+def skill_index_is_empty(db: Session) -> bool:
+    return db.scalar(select(EmployeeSkillModel.emp_id).limit(1)) is None
+
+
+def employees_with_any_skill(terms: List[str]):
+    """
+    Subquery of emp_ids having at least one skill that contains any of `terms`
+    (case-insensitive partial match, same as the old in-Python filter).
+    Terms are matched against the skill dictionary, then joined to employees through the skill_id index.
+    """
+    like_terms = [
+        "%" + t.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        for t in terms
+    ]
+    matching_skills = select(SkillModel.skill_id).where(
+        or_(*(SkillModel.name.like(term, escape="\\") for term in like_terms))
+    )
+    return select(EmployeeSkillModel.emp_id).where(EmployeeSkillModel.skill_id.in_(matching_skills))
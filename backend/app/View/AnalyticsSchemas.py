@@ -0,0 +1,51 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import date
+
+
+class UtilizationRow(BaseModel):
+    key: Optional[str]  # emp_id / dept / project_id / client
+    name: Optional[str]
+    assignments: int
+    completed_assignments: int
+    allotted_hours: int
+    open_allotted_hours: int
+    completed_allotted_hours: int
+    worked_hours: int
+    utilization: Optional[float]  # worked / allotted on completed assignments
+    billable_work_hours: Optional[int] = None  # employee and department views
+    load: Optional[float] = None  # open allotted / billable
+    expected_hours: Optional[int] = None  # project and client views
+    overrun_ratio: Optional[float] = None  # worked / expected
+    allotted_ratio: Optional[float] = None  # allotted / expected
+
+
+class UtilizationReport(BaseModel):
+    group_by: str
+    rows: List[UtilizationRow]
+    totals: UtilizationRow
+
+
+class BurndownPoint(BaseModel):
+    day: date
+    # Activity on this day
+    assignments_added: int
+    allotted_hours: int
+    assignments_completed: int
+    completed_hours: int  # allotted hours of assignments completed this day
+    worked_hours: int
+    # Running totals up to and including this day
+    total_allotted_hours: int
+    total_completed_hours: int
+    total_worked_hours: int
+    remaining_hours: int  # allotted on assignments still open
+    open_assignments: int
+
+
+class ProjectBurndown(BaseModel):
+    project_id: int
+    project_name: str
+    expected_hours: Optional[int]
+    start: date
+    end: date
+    points: List[BurndownPoint]  # one per day, start..end
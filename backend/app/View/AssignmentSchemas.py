@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 # from app.Model.Role import RoleEnum
@@ -40,4 +40,21 @@ class TaskCompletionResponse(BaseModel):
     completed_at: datetime
     allotted_hours: int
     hours_worked: int
-    completion_notes: Optional[str] = None
\ No newline at end of file
+    completion_notes: Optional[str] = None
+
+class BatchAssignee(BaseModel):
+    emp_id: int
+    allotted_hours: int
+
+class AssignmentBatchCreate(BaseModel):
+    project_id: int
+    assignees: List[BatchAssignee]
+
+class AssignmentBatchError(BaseModel):
+    emp_id: int
+    error: str
+
+class AssignmentBatchResponse(BaseModel):
+    project_id: int
+    created: List[AssignmentResponse]
+    errors: List[AssignmentBatchError]
@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+
+
+class BatchSubRequest(BaseModel):
+    id: Optional[str] = None  # echoed back so clients can match responses
+    method: str = Field("GET", pattern="^(GET|POST|PUT|PATCH|DELETE)$")
+    path: str = Field(..., pattern="^/", description="Path and query string, e.g. /api/admin/projects?limit=20")
+    headers: Dict[str, str] = {}  # e.g. If-None-Match; Authorization always comes from the batch
+    body: Optional[Any] = None  # sent as JSON
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchSubRequest]
+
+
+class BatchSubResponse(BaseModel):
+    id: Optional[str] = None
+    status: int
+    headers: Dict[str, str]
+    body: Any = None  # parsed JSON, text for other media types, None when empty
+
+
+class BatchResponse(BaseModel):
+    responses: List[BatchSubResponse]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 # from datetime import datetime
 from backend.app.Model.Role import RoleEnum
 
@@ -55,3 +55,11 @@ class EmployeeResponse(BaseModel):
     dept: Optional[str]
     is_active: bool
     added_by: Optional[int] = None
+
+class SkillMatchResponse(EmployeeResponse):
+    score: float  # share of the requested skills the employee covers
+    matched_skills: List[str]
+
+class EmployeeCapacityResponse(EmployeeResponse):
+    committed_hours: int  # allotted hours on open assignments
+    available_hours: int  # billable_work_hours - committed_hours
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from typing import List
+
+
+class ImportRowError(BaseModel):
+    row: int  # 1-based position in the submitted batch
+    error: str
+
+
+class ImportResult(BaseModel):
+    total: int
+    created: int
+    created_ids: List[int]
+    errors: List[ImportRowError]
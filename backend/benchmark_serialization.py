@@ -0,0 +1,105 @@
+"""
+Script to compare the old and new list serialization paths
+Loads N assignments into an in-memory SQLite database and times, per request:
+  old: ORM objects -> one AssignmentResponse per row -> FastAPI response_model
+       revalidation + jsonable_encoder -> JSONResponse (json.dumps)
+  new: labelled column rows -> one bulk TypeAdapter validation -> dump_json
+
+Usage: python benchmark_serialization.py [rows]   (default 1000)
+"""
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+# Add parent directory to path to import backend modules
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.insert(0, str(parent_dir))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from backend.app.DataBase import Base
+from backend.app.Model.AssignedProjectModel import AssignedProjectModel
+from backend.app.Model.EmployeeModel import EmployeeModel
+from backend.app.Model.ProjectModel import ProjectModel
+from backend.app.Model.Role import RoleEnum
+from backend.app.Controllers.AssignProjectController import assignment_rows, to_assignment_response
+from backend.app.Utils.Serialization import json_list, validate_rows
+from backend.app.View.AssignmentSchemas import AssignmentResponse
+
+
+def seed(db: Session, n: int):
+    now = datetime.utcnow()
+    db.execute(insert(EmployeeModel), [
+        {"emp_id": i, "emp_name": f"Emp.{i}", "email": f"emp{i}@example.com", "hashed_password": "x",
+         "role": RoleEnum.employee, "dept": "IT", "experience": 1, "billable_work_hours": 160}
+        for i in range(1, n + 1)
+    ])
+    db.execute(insert(ProjectModel), [
+        {"project_id": i, "name": f"Project {i}", "client": "Client", "expected_hours": 100, "status": True, "start_date": now}
+        for i in range(1, n + 1)
+    ])
+    db.execute(insert(AssignedProjectModel), [
+        {"assign_id": i, "emp_id": i, "project_id": i, "allotted_hours": 10, "assigned_at": now,
+         "is_completed": False, "hours_worked": 0}
+        for i in range(1, n + 1)
+    ])
+    db.commit()
+
+
+def timed(fn, repeat: int) -> float:
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeat = 20
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = Session(engine)
+    seed(db, n)
+
+    field = create_model_field(name="Response_list", type_=List[AssignmentResponse], mode="serialization")
+    orm_query = (
+        select(AssignedProjectModel, EmployeeModel.emp_name, ProjectModel.name)
+        .join(EmployeeModel, AssignedProjectModel.emp_id == EmployeeModel.emp_id)
+        .join(ProjectModel, AssignedProjectModel.project_id == ProjectModel.project_id)
+        .order_by(AssignedProjectModel.assign_id)
+    )
+    row_query = assignment_rows().order_by(AssignedProjectModel.assign_id)
+
+    def old_path() -> bytes:
+        db.expunge_all()
+        items = [to_assignment_response(*row) for row in db.execute(orm_query).all()]
+        content = asyncio.run(serialize_response(field=field, response_content=items, is_coroutine=True))
+        return JSONResponse(content).body
+
+    def new_path() -> bytes:
+        items = validate_rows(AssignmentResponse, db.execute(row_query).all())
+        return json_list(AssignmentResponse, items).body
+
+    assert json.loads(old_path()) == json.loads(new_path()), "serialized output differs"
+
+    old_ms, new_ms = timed(old_path, repeat), timed(new_path, repeat)
+    print(f"{n} assignments, mean of {repeat} runs (query included)")
+    print(f"  old  {old_ms:8.2f} ms")
+    print(f"  new  {new_ms:8.2f} ms")
+    print(f"  speedup  {old_ms / new_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Script to pick a bcrypt cost for this host
+Measures hash time and proposes the highest PASSWORD_HASH_ROUNDS that fits the login latency budget.
+
+Usage: python calibrate_password_hashing.py [target_ms]   (default 250)
+"""
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import backend modules
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.insert(0, str(parent_dir))
+
+from backend.app.Core.Config import config as settings
+from backend.app.Core.PasswordHasher import calibrate_rounds, _hashpw
+
+
+def main():
+    target_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 250.0
+
+    print(f"Calibrating bcrypt for a {target_ms:.0f} ms budget...")
+    result = calibrate_rounds(target_ms)
+    proposed = result["proposed_rounds"]
+
+    print("\n  cost   estimated ms")
+    for rounds, ms in result["estimates_ms"].items():
+        marker = " <- proposed" if rounds == proposed else ""
+        marker += " (current)" if rounds == settings.PASSWORD_HASH_ROUNDS else ""
+        print(f"  {rounds:>4}   {ms:>12.1f}{marker}")
+
+    start = time.perf_counter()
+    _hashpw("calibration-password", proposed)
+    actual_ms = (time.perf_counter() - start) * 1000
+
+    print(f"\nMeasured {actual_ms:.1f} ms at cost {proposed}.")
+    print(f"Set PASSWORD_HASH_ROUNDS={proposed}; existing hashes are upgraded on each user's next login.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Script to check how many SQL statements the read endpoints run
+Seeds a throwaway SQLite database, calls each endpoint and fails if it runs
+more statements than its budget (e.g. because per-row lazy loads came back).
+
+Usage: python check_query_counts.py
+"""
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path to import backend modules
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.insert(0, str(parent_dir))
+
+# Configure a scratch database and cheap hashing before the app is imported
+_db_dir = tempfile.mkdtemp()
+os.environ["DataBase_URL"] = f"sqlite:///{_db_dir}/query_counts.sqlite3"
+os.environ["DB_ASYNC_MODE"] = "false"
+os.environ["PASSWORD_HASH_BACKEND"] = "inline"
+os.environ["PASSWORD_HASH_ROUNDS"] = "4"
+os.environ["LOGIN_RATE_LIMIT_ENABLED"] = "false"
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from fastapi.testclient import TestClient
+from backend.main import app
+from backend.app.DataBase import SessionLocal, engine
+from backend.app.Model.EmployeeModel import EmployeeModel
+from backend.app.Model.ProjectModel import ProjectModel
+from backend.app.Model.AssignedProjectModel import AssignedProjectModel
+from backend.app.Model.Role import RoleEnum
+from backend.app.Core.Security import hash_password
+from backend.app.Utils.QueryCounter import count_queries
+
+EMPLOYEES = 50
+PROJECTS = 20
+PASSWORD = "Check123@"
+
+# (role, path, max statements); authentication is warmed up first so the
+# principal cache does not add a lookup to the counts. Budgets include the
+# ETag version lookup (one statement), which is also all a 304 may cost.
+BUDGETS = [
+    ("manager", "/api/assignments", 2),
+    ("manager", "/api/assignments?project_id=1", 2),
+    ("manager", "/api/assignments?emp_id=3", 2),
+    ("manager", "/api/manager/employees/search/by-skills?skills=sql", 2),
+    ("manager", "/api/manager/employees?sort=available&min_available_hours=10", 2),
+    ("manager", "/api/analytics/projects/2/burndown", 4),  # project, first day, earlier totals, buckets
+    ("employee", "/api/employee/my-assignments", 2),
+    ("employee", "/api/employee/my-assignments/1", 2),
+    ("employee", "/api/employee/my-task-completions", 2),
+]
+REVALIDATION_BUDGET = 1
+
+
+def seed():
+    db = SessionLocal()
+    hashed = hash_password(PASSWORD)
+    db.add(EmployeeModel(emp_name="Check.Manager", email="check.manager@gyansys.com",
+                         hashed_password=hashed, role=RoleEnum.manager, dept="QA"))
+    for i in range(EMPLOYEES):
+        db.add(EmployeeModel(emp_name=f"Check.Employee{i}", email=f"check.employee{i}@gyansys.com",
+                             hashed_password=hashed, role=RoleEnum.employee, dept="QA",
+                             skills="Python,SQL", experience=i % 10, billable_work_hours=160))
+    for i in range(PROJECTS):
+        db.add(ProjectModel(name=f"Check Project {i}", client=f"Client {i % 5}", expected_hours=500))
+    db.flush()
+    # Every employee on every project; emp_id 2 is the first employee
+    for emp_id in range(2, EMPLOYEES + 2):
+        for project_id in range(1, PROJECTS + 1):
+            completed = project_id % 2 == 0
+            db.add(AssignedProjectModel(emp_id=emp_id, project_id=project_id, allotted_hours=10,
+                                        is_completed=completed, hours_worked=8 if completed else 0,
+                                        completed_at=datetime.utcnow() if completed else None))
+    db.commit()
+    db.close()
+
+
+def main():
+    seed()
+    failures = []
+    with TestClient(app) as client:
+        headers = {}
+        for role, email in (("manager", "check.manager@gyansys.com"), ("employee", "check.employee0@gyansys.com")):
+            token = client.post("/auth/login", data={"username": email, "password": PASSWORD}).json()["access_token"]
+            headers[role] = {"Authorization": f"Bearer {token}"}
+            client.get("/api/employee/my-assignments", headers=headers[role])
+
+        for role, path, budget in BUDGETS:
+            with count_queries(engine) as counter:
+                response = client.get(path, headers=headers[role])
+            ok = response.status_code == 200 and counter.count <= budget
+            print(f"{'OK  ' if ok else 'FAIL'} {path:<45} {counter.count} statement(s), budget {budget}")
+            if not ok:
+                failures.append((path, response.status_code, counter.statements))
+
+            etag = response.headers.get("ETag")
+            if etag is None:
+                continue
+            with count_queries(engine) as counter:
+                response = client.get(path, headers={**headers[role], "If-None-Match": etag})
+            ok = response.status_code == 304 and counter.count <= REVALIDATION_BUDGET
+            print(f"{'OK  ' if ok else 'FAIL'} {path + ' (304)':<45} {counter.count} statement(s), budget {REVALIDATION_BUDGET}")
+            if not ok:
+                failures.append((path + " (If-None-Match)", response.status_code, counter.statements))
+
+    for path, status_code, statements in failures:
+        print(f"\n{path} -> HTTP {status_code}")
+        for statement in statements:
+            print("   ", " ".join(statement.split())[:160])
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,89 @@
-from fastapi import FastAPI
+import uuid
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from .app.DataBase import engine, Base
-from .app.Routes.AuthRoutes import router as auth_router
+from .app.DataBase import engine, async_engine, Base, SessionLocal
+from .app.Controllers.AdminController import rebuild_project_stats
+from .app.Utils.SkillIndex import rebuild_skill_index, skill_index_is_empty
+from .app.Utils.Capacity import rebuild_capacity, capacity_is_incomplete
+from .app.Utils.ProjectRollups import rebuild_project_rollups, rollups_are_missing
+from .app.Utils.EntityVersions import bump_versions, TRACKED
+from .app.Core.Config import config as settings
 from .app.Routes.ManagerRoutes import router as manager_router
 from .app.Routes.AdminRoutes import router as admin_router
-from .app.Routes.AssignProjectRoutes import router as assignment_router
-from .app.Routes.EmployeeRoutes import router as employee_router
-from .app.Core.Logger import setup_logging
+from .app.Routes.MetricsRoutes import router as metrics_router
+from .app.Routes.ExportRoutes import router as export_router
+from .app.Routes.ImportRoutes import router as import_router
+from .app.Routes.AnalyticsRoutes import router as analytics_router
+from .app.Routes.BatchRoutes import router as batch_router
+from .app.Core.Logger import setup_logging, stop_logging, log_context
+from .app.Core.PasswordHasher import password_hasher
+from .app.Core.ResponseEncoding import ResponseEncodingMiddleware
 
 # Import all models to ensure they are registered with SQLAlchemy
 from .app.Model.EmployeeModel import EmployeeModel
 from .app.Model.ProjectModel import ProjectModel
 from .app.Model.AssignedProjectModel import AssignedProjectModel
+from .app.Model.ProjectStatsModel import ProjectStatsModel
+from .app.Model.SkillModel import SkillModel, EmployeeSkillModel
+from .app.Model.EmployeeCapacityModel import EmployeeCapacityModel
+from .app.Model.ProjectDailyRollupModel import ProjectDailyRollupModel
+from .app.Model.EntityVersionModel import EntityVersionModel
 from .app.Model.Role import RoleEnum
 
+# Auth, assignment and employee routes come in sync (Session) and async (AsyncSession) flavours
+if settings.DB_ASYNC_MODE:
+    from .app.Routes.AuthAsyncRoutes import router as auth_router
+    from .app.Routes.AssignProjectAsyncRoutes import router as assignment_router
+    from .app.Routes.EmployeeAsyncRoutes import router as employee_router
+else:
+    from .app.Routes.AuthRoutes import router as auth_router
+    from .app.Routes.AssignProjectRoutes import router as assignment_router
+    from .app.Routes.EmployeeRoutes import router as employee_router
+
 # Setup logging
 logger = setup_logging()
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.PROJECT_STATS_TABLE:
+        # Projects may have been written while maintenance was off; start from exact totals
+        with SessionLocal() as db:
+            rebuild_project_stats(db)
+            db.commit()
+    with SessionLocal() as db:
+        # Databases created before the skill index existed: backfill it once
+        if skill_index_is_empty(db):
+            rebuild_skill_index(db)
+            db.commit()
+        # Likewise the hour counters, for employees that predate them
+        if capacity_is_incomplete(db):
+            rebuild_capacity(db)
+            db.commit()
+        # ...and the daily project rollups behind the burn-down charts
+        if rollups_are_missing(db):
+            rebuild_project_rollups(db)
+            db.commit()
+        # Writes made while the app was down (scripts, manual SQL) never bumped the
+        # version counters, and a new release may shape responses differently
+        bump_versions(db.connection(), TRACKED)
+        db.commit()
+    yield
+    # Stop the bcrypt worker processes on shutdown
+    password_hasher.shutdown()
+    if async_engine is not None:
+        await async_engine.dispose()
+    stop_logging()
+
+
+app = FastAPI(lifespan=lifespan)
+
+# Negotiate msgpack / compressed bodies (inside CORS, so preflights skip it)
+app.add_middleware(ResponseEncodingMiddleware)
 
 # Add CORS middleware to allow requests from React frontend
 app.add_middleware(
@@ -29,14 +92,33 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Request-ID", "ETag"],
 )
 
+
+# Attach per-request fields to every log record emitted while handling the request
+@app.middleware("http")
+async def request_context(request: Request, call_next):
+    request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex[:12]
+    token = log_context.set({"request_id": request_id, "request_path": request.url.path})
+    try:
+        response = await call_next(request)
+    finally:
+        log_context.reset(token)
+    response.headers["X-Request-ID"] = request_id
+    return response
+
 # Include routers
 app.include_router(auth_router)
 app.include_router(manager_router)
 app.include_router(admin_router)
 app.include_router(assignment_router)
 app.include_router(employee_router)
+app.include_router(metrics_router)
+app.include_router(export_router)
+app.include_router(import_router)
+app.include_router(analytics_router)
+app.include_router(batch_router)
 
 logger.info("FastAPI app started")
 
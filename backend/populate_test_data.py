@@ -20,6 +20,8 @@ from backend.app.Model.ProjectModel import ProjectModel
 from backend.app.Model.AssignedProjectModel import AssignedProjectModel
 from backend.app.Model.Role import RoleEnum
 from backend.app.Core.Security import hash_password
+from backend.app.Utils.Capacity import rebuild_capacity
+from backend.app.Utils.SkillIndex import rebuild_skill_index
 from datetime import datetime, timedelta
 
 def populate_data():
@@ -249,6 +251,11 @@ def populate_data():
             )
             db.add(assignment)
         
+        db.flush()
+        # Hour counters and skill index, which the app keeps in step with its own writes
+        # (without counter rows, employees are missing from the manager's lists)
+        rebuild_capacity(db)
+        rebuild_skill_index(db)
         db.commit()
         
         print("\n✅ Test data populated successfully!")
@@ -0,0 +1,37 @@
+"""
+Script to rebuild the daily project rollups behind the burn-down charts
+Regroups assigned_projects into project_daily_rollups from scratch (or for the given projects only).
+
+Usage: python rebuild_project_rollups.py [project_id ...]
+"""
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import backend modules
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.insert(0, str(parent_dir))
+
+from sqlalchemy import func, select
+from backend.app.DataBase import SessionLocal
+from backend.app.Model.ProjectDailyRollupModel import ProjectDailyRollupModel
+from backend.app.Utils.ProjectRollups import rebuild_project_rollups
+import backend.main  # registers every model and creates missing tables
+
+
+def main():
+    project_ids = [int(arg) for arg in sys.argv[1:]] or None
+    start = time.perf_counter()
+    with SessionLocal() as db:
+        rebuild_project_rollups(db, project_ids)
+        db.commit()
+        buckets = db.scalar(select(func.count()).select_from(ProjectDailyRollupModel))
+    elapsed = time.perf_counter() - start
+
+    scope = "all projects" if project_ids is None else f"projects {', '.join(map(str, project_ids))}"
+    print(f"Rebuilt daily rollups for {scope} in {elapsed:.2f}s ({buckets} buckets in total).")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,32 @@
 import axios from 'axios';
+import type { AxiosResponseHeaders, RawAxiosResponseHeaders } from 'axios';
+import { decodeMsgpack } from './msgpack';
 
 const API_URL = 'http://localhost:8000'; // Adjust if needed
 
+// Opt in with VITE_API_MSGPACK=true to receive msgpack instead of JSON.
+// gzip/br/zstd need nothing here: the browser negotiates and decompresses them.
+const USE_MSGPACK = import.meta.env.VITE_API_MSGPACK === 'true';
+
+const textDecoder = new TextDecoder();
+
+// Bodies arrive as ArrayBuffers; decode them by the Content-Type the server chose
+const decodeBody = (data: unknown, headers: AxiosResponseHeaders | RawAxiosResponseHeaders) => {
+  if (!(data instanceof ArrayBuffer)) return data; // per-request responseType (e.g. blob downloads)
+  const contentType = String(headers['content-type'] ?? '');
+  if (contentType.includes('msgpack')) return decodeMsgpack(data);
+  const text = textDecoder.decode(data);
+  if (contentType.includes('json')) return text ? JSON.parse(text) : null;
+  return text;
+};
+
 const client = axios.create({
   baseURL: API_URL,
   headers: {
     'Content-Type': 'application/json',
+    ...(USE_MSGPACK ? { Accept: 'application/msgpack, application/json;q=0.9' } : {}),
   },
+  ...(USE_MSGPACK ? { responseType: 'arraybuffer' as const, transformResponse: [decodeBody] } : {}),
   timeout: 10000, // 10 second timeout
 });
 
@@ -63,4 +83,18 @@ client.interceptors.response.use(
   }
 );
 
+// List endpoints return one keyset page at a time; X-Next-Cursor is set while more rows remain
+const PAGE_SIZE = 1000; // the server's PAGE_SIZE_MAX
+
+export const getAllPages = async <T>(url: string, params: Record<string, unknown> = {}): Promise<T[]> => {
+  const items: T[] = [];
+  let cursor: string | undefined;
+  do {
+    const response = await client.get<T[]>(url, { params: { ...params, limit: PAGE_SIZE, ...(cursor ? { cursor } : {}) } });
+    items.push(...response.data);
+    cursor = response.headers['x-next-cursor'] || undefined;
+  } while (cursor);
+  return items;
+};
+
 export default client;
@@ -1,9 +1,8 @@
-import client from './client';
+import client, { getAllPages } from './client';
 import type { Assignment } from '../types/index';
 
 export const getMyAssignments = async () => {
-  const response = await client.get<Assignment[]>('/api/employee/my-assignments');
-  return response.data;
+  return getAllPages<Assignment>('/api/employee/my-assignments');
 };
 
 export const completeTask = async (data: { assign_id: number, hours_worked: number, completion_notes: string }) => {
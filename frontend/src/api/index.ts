@@ -1,4 +1,4 @@
-import client from './client';
+import client, { getAllPages } from './client';
 import type { 
   EmployeeCreateByManager, 
   EmployeeResponse, 
@@ -18,8 +18,7 @@ import type {
 
 // Manager API
 export const getEmployees = async () => {
-  const response = await client.get<EmployeeResponse[]>('/api/manager/employees');
-  return response.data;
+  return getAllPages<EmployeeResponse>('/api/manager/employees');
 };
 
 export const addEmployee = async (data: EmployeeCreateByManager) => {
@@ -42,8 +41,7 @@ export const searchEmployeesBySkills = async (params: {
   min_experience?: number;
   include_assigned?: boolean;
 }) => {
-  const response = await client.get<EmployeeResponse[]>('/api/manager/employees/search/by-skills', { params });
-  return response.data;
+  return getAllPages<EmployeeResponse>('/api/manager/employees/search/by-skills', params);
 };
 
 export const createAssignment = async (data: AssignmentCreate) => {
@@ -79,8 +77,7 @@ export const getProjectStats = async () => {
 
 // Assignments API
 export const getAssignments = async (params: { emp_id?: number; project_id?: number } = {}) => {
-  const response = await client.get<AssignmentResponse[]>('/api/assignments', { params });
-  return response.data;
+  return getAllPages<AssignmentResponse>('/api/assignments', params);
 };
 
 export const updateAssignment = async (assignId: number, data: AssignmentUpdate) => {
@@ -100,8 +97,7 @@ export const removeEmployeeFromProject = async (data: RemoveEmployeeRequest) =>
 
 // Employee API
 export const getMyAssignments = async () => {
-  const response = await client.get<AssignmentResponse[]>('/api/employee/my-assignments');
-  return response.data;
+  return getAllPages<AssignmentResponse>('/api/employee/my-assignments');
 };
 
 export const getAssignmentDetails = async (assignId: number) => {
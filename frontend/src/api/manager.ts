@@ -1,9 +1,8 @@
-import client from './client';
+import client, { getAllPages } from './client';
 import type { User, EmployeeCreateByManager } from '../types/index';
 
 export const getEmployees = async () => {
-  const response = await client.get<User[]>('/api/manager/employees');
-  return response.data;
+  return getAllPages<User>('/api/manager/employees');
 };
 
 export const addEmployee = async (data: EmployeeCreateByManager) => {
@@ -12,8 +11,7 @@ export const addEmployee = async (data: EmployeeCreateByManager) => {
 };
 
 export const searchEmployees = async (skills: string) => {
-    const response = await client.get<User[]>('/api/manager/employees/search/by-skills', { params: { skills } });
-    return response.data;
+    return getAllPages<User>('/api/manager/employees/search/by-skills', { skills });
 };
 
 export const createAssignment = async (data: { emp_id: number, project_id: number, allotted_hours: number }) => {
@@ -0,0 +1,81 @@
+// Minimal MessagePack decoder for API responses (the server never sends ext types)
+
+const textDecoder = new TextDecoder();
+
+class Reader {
+  private view: DataView;
+  private bytes: Uint8Array;
+  private pos = 0;
+
+  constructor(buffer: ArrayBuffer) {
+    this.view = new DataView(buffer);
+    this.bytes = new Uint8Array(buffer);
+  }
+
+  private take(length: number): number {
+    const start = this.pos;
+    this.pos += length;
+    return start;
+  }
+
+  private str(length: number): string {
+    const start = this.take(length);
+    return textDecoder.decode(this.bytes.subarray(start, start + length));
+  }
+
+  private array(length: number): unknown[] {
+    const out = new Array(length);
+    for (let i = 0; i < length; i++) out[i] = this.read();
+    return out;
+  }
+
+  private map(length: number): Record<string, unknown> {
+    const out: Record<string, unknown> = {};
+    for (let i = 0; i < length; i++) {
+      const key = String(this.read());
+      out[key] = this.read();
+    }
+    return out;
+  }
+
+  read(): unknown {
+    const v = this.view;
+    const type = v.getUint8(this.take(1));
+    if (type <= 0x7f) return type; // positive fixint
+    if (type >= 0xe0) return type - 0x100; // negative fixint
+    if ((type & 0xf0) === 0x80) return this.map(type & 0x0f);
+    if ((type & 0xf0) === 0x90) return this.array(type & 0x0f);
+    if ((type & 0xe0) === 0xa0) return this.str(type & 0x1f);
+    switch (type) {
+      case 0xc0: return null;
+      case 0xc2: return false;
+      case 0xc3: return true;
+      case 0xc4: { const n = v.getUint8(this.take(1)); const s = this.take(n); return this.bytes.slice(s, s + n); }
+      case 0xc5: { const n = v.getUint16(this.take(2)); const s = this.take(n); return this.bytes.slice(s, s + n); }
+      case 0xc6: { const n = v.getUint32(this.take(4)); const s = this.take(n); return this.bytes.slice(s, s + n); }
+      case 0xca: return v.getFloat32(this.take(4));
+      case 0xcb: return v.getFloat64(this.take(8));
+      case 0xcc: return v.getUint8(this.take(1));
+      case 0xcd: return v.getUint16(this.take(2));
+      case 0xce: return v.getUint32(this.take(4));
+      case 0xcf: return Number(v.getBigUint64(this.take(8)));
+      case 0xd0: return v.getInt8(this.take(1));
+      case 0xd1: return v.getInt16(this.take(2));
+      case 0xd2: return v.getInt32(this.take(4));
+      case 0xd3: return Number(v.getBigInt64(this.take(8)));
+      case 0xd9: return this.str(v.getUint8(this.take(1)));
+      case 0xda: return this.str(v.getUint16(this.take(2)));
+      case 0xdb: return this.str(v.getUint32(this.take(4)));
+      case 0xdc: return this.array(v.getUint16(this.take(2)));
+      case 0xdd: return this.array(v.getUint32(this.take(4)));
+      case 0xde: return this.map(v.getUint16(this.take(2)));
+      case 0xdf: return this.map(v.getUint32(this.take(4)));
+      default:
+        throw new Error(`Unsupported msgpack type 0x${type.toString(16)}`);
+    }
+  }
+}
+
+export function decodeMsgpack(buffer: ArrayBuffer): unknown {
+  return buffer.byteLength ? new Reader(buffer).read() : null;
+}